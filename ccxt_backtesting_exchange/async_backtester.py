@@ -0,0 +1,174 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from ccxt.base.exchange import OrderSide, OrderType
+
+from .backtester import Backtester
+from .clock import Clock
+
+
+class AsyncBacktester:
+    """
+    An asyncio facade over a Backtester, mirroring ccxt.async_support.
+
+    The exchange methods are coroutines, so strategies written against
+    ccxt.async_support run unchanged. The backtest itself runs on the event
+    loop thread: the coroutines complete without any thread handoff.
+
+    The clock is driven like a barrier. Every strategy awaits next_tick() when
+    it is done with the current tick, and the clock ticks once all the
+    strategies started by run() are waiting, so independent strategies sharing
+    one loop always observe the same time.
+    """
+
+    def __init__(
+        self,
+        balances: Dict = None,
+        clock: Clock = None,
+        fee=0.0,
+        fill_mode: str = "iterative",
+        backtester: Backtester = None,
+    ):
+        """
+        :param balances: Starting balances, example: {"BTC": 1, "USDT": 1000}
+        :param clock: The clock driving the backtest.
+        :param fee: Fee rate charged on the quote value of every order.
+        :param fill_mode: How orders are filled, see Backtester.
+        :param backtester: An existing Backtester to wrap instead of creating one.
+        """
+        if backtester is None:
+            backtester = Backtester(
+                balances or {}, clock=clock, fee=fee, fill_mode=fill_mode
+            )
+        self.backtester = backtester
+        self._participants = 0
+        self._waiting = 0
+        self._running = True
+        self._tick: Optional[asyncio.Future] = None
+
+    async def next_tick(self) -> bool:
+        """
+        Wait until every running strategy is done with the current tick, then
+        advance the clock.
+
+        :return: True if the clock has not reached the end time, False otherwise.
+        """
+        if not self._running:
+            return False
+        if self._tick is None:
+            self._tick = asyncio.get_running_loop().create_future()
+        tick = self._tick
+        self._waiting += 1
+        if self._waiting >= self._participants:
+            self.__advance()
+        return await tick
+
+    def __advance(self) -> None:
+        tick, self._tick = self._tick, None
+        self._waiting = 0
+        try:
+            self._running = self.backtester.tick()
+        except Exception as error:
+            self._running = False
+            tick.set_exception(error)
+        else:
+            tick.set_result(self._running)
+
+    async def run(self, *strategies: Callable[["AsyncBacktester"], Awaitable]) -> List:
+        """
+        Run strategies concurrently on the current event loop.
+
+        Each strategy is a coroutine function called with this exchange. It
+        should loop on `while await exchange.next_tick():` and may return at
+        any time, after which the clock no longer waits for it.
+
+        :param strategies: The strategy coroutine functions.
+        :return: The return values of the strategies.
+        """
+        self._participants += len(strategies)
+        return await asyncio.gather(*(self.__run(strategy) for strategy in strategies))
+
+    async def __run(self, strategy: Callable[["AsyncBacktester"], Awaitable]):
+        try:
+            return await strategy(self)
+        finally:
+            self._participants -= 1
+            if self._tick is not None and self._waiting >= self._participants:
+                self.__advance()
+
+    def milliseconds(self) -> int:
+        return self.backtester.milliseconds()
+
+    def timestamp(self) -> str:
+        return self.backtester.timestamp()
+
+    def add_data_feed(self, symbol: str, timeframe: str, file_path):
+        return self.backtester.add_data_feed(symbol, timeframe, file_path)
+
+    async def close(self) -> None:
+        """
+        Nothing to release, kept for compatibility with ccxt.async_support.
+        """
+
+    async def deposit(self, asset: str, amount: float):
+        return self.backtester.deposit(asset, amount)
+
+    async def withdraw(self, code: str, amount: float, params={}):
+        return self.backtester.withdraw(code, amount, params)
+
+    async def fetch_balance(self, params={}):
+        return self.backtester.fetch_balance(params)
+
+    async def create_order(
+        self,
+        symbol: str,
+        type: OrderType,
+        side: OrderSide,
+        amount: float,
+        price: float,
+        params={},
+    ):
+        return self.backtester.create_order(symbol, type, side, amount, price, params)
+
+    async def create_orders(self, orders: List[dict], params={}):
+        return self.backtester.create_orders(orders, params)
+
+    async def cancel_order(self, id: str, symbol: str = None, params: dict = {}):
+        return self.backtester.cancel_order(id, symbol, params)
+
+    async def cancel_orders(self, ids: List, symbol: str = None, params: dict = {}):
+        return self.backtester.cancel_orders(ids, symbol, params)
+
+    async def cancel_all_orders(self, symbol: str = None, params: dict = {}):
+        return self.backtester.cancel_all_orders(symbol, params)
+
+    async def fetch_order(self, id: str, symbol: str = None, params: dict = {}):
+        return self.backtester.fetch_order(id, symbol, params)
+
+    async def fetch_orders(self, symbol=None, since=None, limit=None, params={}):
+        return self.backtester.fetch_orders(symbol, since, limit, params)
+
+    async def fetch_open_orders(self, symbol=None, since=None, limit=None, params={}):
+        return self.backtester.fetch_open_orders(symbol, since, limit, params)
+
+    async def fetch_closed_orders(self, symbol=None, since=None, limit=None, params={}):
+        return self.backtester.fetch_closed_orders(symbol, since, limit, params)
+
+    async def fetch_my_trades(self, symbol=None, since=None, limit=None, params={}):
+        return self.backtester.fetch_my_trades(symbol, since, limit, params)
+
+    async def fetch_ticker(self, symbol: str, params={}):
+        return self.backtester.fetch_ticker(symbol, params)
+
+    async def fetch_tickers(self, symbols=None, params={}):
+        return self.backtester.fetch_tickers(symbols, params)
+
+    async def fetch_ohlcv(
+        self, symbol, timeframe="1m", since=None, limit=100, params={}
+    ):
+        return self.backtester.fetch_ohlcv(symbol, timeframe, since, limit, params)
+
+    async def watch_ohlcv(
+        self, symbol, timeframe="1m", since=None, limit=None, params={}
+    ):
+        return self.backtester.watch_ohlcv(symbol, timeframe, since, limit, params)
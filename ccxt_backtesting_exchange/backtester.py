@@ -1,7 +1,5 @@
-import pandas as pd
 import numpy as np
-from typing import Dict
-from enum import Enum
+from typing import Dict, List, Union
 
 import ccxt
 from ccxt.base.errors import (
@@ -12,19 +10,12 @@ from ccxt.base.errors import (
     OrderImmediatelyFillable,
 )
 from ccxt.base.exchange import OrderSide, OrderType
-import pandas as pd
-import numpy as np
 
 
+from .balance_ledger import BalanceLedger
 from .data_feed import DataFeed
 from .clock import Clock
-
-
-class OrderStatus(Enum):
-    FILLED = "filled"
-    PARTIALLY_FILLED = "partially_filled"
-    CANCELED = "canceled"
-    OPEN = "open"
+from .order_store import OrderStatus, OrderStore
 
 
 class Backtester(ccxt.Exchange):
@@ -33,181 +24,37 @@ class Backtester(ccxt.Exchange):
     and implements the ccxt.Exchange unified API.
     """
 
+    FILL_MODES = ("iterative", "vectorized")
+
     def __init__(
         self,
         balances: Dict,
         clock: Clock = None,
         fee=0.0,
+        fill_mode: str = "iterative",
     ):
+        """
+        :param balances: Starting balances, example: {"BTC": 1, "USDT": 1000}
+        :param clock: The clock driving the backtest.
+        :param fee: Fee rate charged on the quote value of every order.
+        :param fill_mode: How fill_orders applies fills. 'iterative' fills
+            orders one by one, 'vectorized' fills every crossable order of a
+            symbol at once and applies aggregated balance deltas.
+        """
         super().__init__()
         # add static properties
+        if fill_mode not in self.FILL_MODES:
+            raise ValueError(
+                f"Invalid fill mode '{fill_mode}'. Expected one of {self.FILL_MODES}."
+            )
+        self._fill_mode = fill_mode
 
-        self._balances = pd.DataFrame(
-            columns=["asset", "free", "used", "total"]
-        ).astype(
-            {"asset": str, "free": np.float32, "used": np.float32, "total": np.float32}
-        )
-        self._orders = pd.DataFrame(
-            columns=[
-                "datetime",
-                "timestamp",
-                "lastTradeTimestamp",
-                "symbol",
-                "type",
-                "side",
-                "price",
-                "amount",
-                "status",
-                "fee",
-                "params",
-            ]
-        )
+        self._balances = BalanceLedger(balances)
+        self._orders = OrderStore()
         self._fee = fee
         self.__clock = clock
-
-        self.__init_balances(balances)
         self._data_feeds = {}
 
-    def __init_balances(self, balances: Dict):
-        """
-        Initialize the balances of the backtesting exchange.
-
-        balances: Dict, example: {"BTC": 1, "ETH": 10}
-        """
-        if not balances:
-            return
-        updates = pd.DataFrame(
-            [
-                {
-                    "asset": asset,
-                    "free": balance,
-                    "used": 0.0,
-                    "total": balance,
-                }
-                for asset, balance in balances.items()
-            ]
-        )
-        self._balances = updates
-
-    def __get_df_value_by_column(
-        self, df: pd.DataFrame, query_column: str, query_value: any, return_column: str
-    ) -> any:
-        """
-        Generic method to get a value from a specific value from a DataFrame.
-
-        :param df: The DataFrame to query.
-        :param query_column: The column to query for the specific value.
-        :param query_value: The value to search for in the query column.
-        :param return_column: The column from which to retrieve the value.
-
-        :return: The queried value from DataFrame.
-        :raises: ValueError if query not found.
-        """
-        # Check if the query column exists in the DataFrame
-        if query_column not in df.columns:
-            raise ValueError(
-                f"Query column '{query_column}' not found in the DataFrame."
-            )
-
-        # Check if the return column exists in the DataFrame
-        if return_column not in df.columns:
-            raise ValueError(
-                f"Return column '{return_column}' not found in the DataFrame."
-            )
-
-        # Find the rows that match the query_value in the query_column
-        filtered_df = df[df[query_column] == query_value]
-
-        if filtered_df.empty:
-            raise ValueError(
-                f"No rows found where '{query_column}' is '{query_value}'."
-            )
-
-        # Retrieve the value from the return_column
-        value = filtered_df[return_column].values[0]
-
-        return value
-
-    def __set_df_value_by_column(
-        self,
-        df: pd.DataFrame,
-        query_column: str,
-        query_value: any,
-        update_column: str,
-        new_value: any,
-        limit: int = 1,
-    ) -> None:
-        """
-        Generic method to set a value in a DataFrame.
-
-        :param df: The DataFrame to update.
-        :param query_column: The column where we search for the query_value.
-        :param query_value: The value to search for in the query_column.
-        :param update_column: The column where the value should be updated.
-        :param new_value: The new value to set in the update_column.
-        :raises: ValueError if update column is not found, or if no match is found.
-        """
-        # Check if the query column exists in the DataFrame
-
-        if query_column not in df.columns and query_column != "index":
-            raise ValueError(
-                f"Query column '{query_column}' not found in the DataFrame."
-            )
-
-        # Check if the update column exists in the DataFrame
-        if update_column not in df.columns:
-            raise ValueError(
-                f"Update column '{update_column}' not found in the DataFrame."
-            )
-
-        # Find the index of the row(s) matching the query value
-        if query_column == "index":
-            mask = df.index == query_value
-        else:
-            mask = df[query_column] == query_value
-
-        if not mask.any():
-            raise ValueError(
-                f"No rows found where '{query_column}' is '{query_value}'."
-            )
-            # Check if any rows match the query
-
-        # Check if the number of matching rows exceeds the limit
-        matching_rows = df[mask]
-        if len(matching_rows) > limit:
-            raise ValueError(
-                f"Query matches {len(matching_rows)} rows. LIMIT = {limit}."
-            )
-        new_value = df[update_column].dtype.type(new_value)
-        # Update the column value for the matching rows
-        df.loc[mask, update_column] = new_value
-
-    def __update_df_value_by_column(
-        self,
-        df: pd.DataFrame,
-        query_column: str,
-        query_value: any,
-        update_column: str,
-        delta: any,
-    ) -> None:
-        """
-        Generic method to add a delta to a value in a DataFrame.
-
-        :param df: The DataFrame to update.
-        :param query_column: The column where we search for the query_value.
-        :param query_value: The value to search for in the query_column.
-        :param update_column: The column where the value should be updated.
-        :param new_value: The new value to set in the update_column.
-        :raises: ValueError if update column is not found, or if no match is found.
-        """
-        value = self.__get_df_value_by_column(
-            df, query_column, query_value, update_column
-        )
-        new_value = value + delta
-        self.__set_df_value_by_column(
-            df, query_column, query_value, update_column, new_value
-        )
-
     def _get_asset_balance(self, asset: str, column: str) -> float:
         """
         Helper method to get the balance of a specific asset by column (.g., free).
@@ -216,7 +63,7 @@ class Backtester(ccxt.Exchange):
         :param column: The column to retrieve (e.g., 'free' or 'total').
         :return: The balance of the asset in the specified column.
         """
-        return self.__get_df_value_by_column(self._balances, "asset", asset, column)
+        return self._balances.get(asset, column)
 
     def _update_asset_balance(self, asset: str, column: str, amount: float) -> None:
         """
@@ -227,55 +74,84 @@ class Backtester(ccxt.Exchange):
         :param column: The column to update ('free' or 'total').
         :param amount: The amount to add or subtract.
         """
-
-        # Update the balance by adding/subtracting the amount
-        self.__update_df_value_by_column(self._balances, "asset", asset, column, amount)
+        self._balances.update(asset, column, amount)
 
     def fill_orders(self):
         """
         Fill orders that are fillable on the current timestamp.
+
+        Only the orders whose price lies within the candle range are visited,
+        found by binary search in each symbol's price-sorted book.
+        """
+        for symbol in self._orders.symbols(OrderStatus.OPEN.value):
+            candle = self._data_feeds[symbol].get_data_at_timestamp(self.milliseconds())
+            [timestamp, open, high, low, close, volume] = candle
+            rows = self._orders.crossable(symbol, low, high)
+            if len(rows) == 0:
+                continue
+            if self._fill_mode == "vectorized":
+                self.__fill_symbol_orders_vectorized(symbol, rows)
+            else:
+                self.__fill_symbol_orders_iterative(symbol, np.sort(rows))
+
+    def __fill_symbol_orders_iterative(self, symbol: str, rows: np.ndarray):
         """
-        open_orders = self._orders[self._orders["status"] == OrderStatus.OPEN.value]
-        symbols = open_orders["symbol"].unique()
+        Fill orders of a symbol one by one.
 
-        for symbol in symbols:
-            [timestamp, open, high, low, close, volume] = self._data_feeds[
-                symbol
-            ].get_data_at_timestamp(self.milliseconds())
-            base_asset, quote_asset = symbol.split("/")
-            for index, order in open_orders[open_orders["symbol"] == symbol].iterrows():
-                trade_value = order["amount"] * order["price"]
-                if order["price"] >= low and order["price"] <= high:
-                    if order["side"] == "buy":
-                        trade_value += order["fee"]["cost"]
-                        self._update_asset_balance(quote_asset, "used", -trade_value)
-                        self._update_asset_balance(quote_asset, "total", -trade_value)
-                        self._update_asset_balance(base_asset, "free", order["amount"])
-                        self._update_asset_balance(base_asset, "total", order["amount"])
-
-                    elif order["side"] == "sell":
-                        trade_value -= order["fee"]["cost"]
-                        self._update_asset_balance(base_asset, "used", -order["amount"])
-                        self._update_asset_balance(
-                            base_asset, "total", -order["amount"]
-                        )
-                        self._update_asset_balance(quote_asset, "free", trade_value)
-                        self._update_asset_balance(quote_asset, "total", trade_value)
-
-                    self.__set_df_value_by_column(
-                        self._orders,
-                        "index",
-                        index,
-                        "status",
-                        OrderStatus.FILLED.value,
-                    )
-                    self.__set_df_value_by_column(
-                        self._orders,
-                        "index",
-                        index,
-                        "lastTradeTimestamp",
-                        self.milliseconds(),
-                    )
+        :param symbol: The trading pair symbol of the orders.
+        :param rows: The rows of the orders to fill in the order store.
+        """
+        base_asset, quote_asset = symbol.split("/")
+        for row in rows:
+            amount = self._orders.amount(row)
+            trade_value = amount * self._orders.price(row)
+            if self._orders.side(row) == "buy":
+                trade_value += self._orders.fee_cost(row)
+                self._update_asset_balance(quote_asset, "used", -trade_value)
+                self._update_asset_balance(quote_asset, "total", -trade_value)
+                self._update_asset_balance(base_asset, "free", amount)
+                self._update_asset_balance(base_asset, "total", amount)
+            else:
+                trade_value -= self._orders.fee_cost(row)
+                self._update_asset_balance(base_asset, "used", -amount)
+                self._update_asset_balance(base_asset, "total", -amount)
+                self._update_asset_balance(quote_asset, "free", trade_value)
+                self._update_asset_balance(quote_asset, "total", trade_value)
+
+            self._orders.set_status(row, OrderStatus.FILLED.value, self.milliseconds())
+
+    def __fill_symbol_orders_vectorized(self, symbol: str, rows: np.ndarray):
+        """
+        Fill orders of a symbol at once, applying their balance effects as
+        one delta per asset and column.
+
+        :param symbol: The trading pair symbol of the orders.
+        :param rows: The rows of the orders to fill in the order store.
+        """
+        prices = self._orders.prices(rows)
+        amounts = self._orders.amounts(rows)
+        fee_costs = self._orders.fee_costs(rows)
+        buys = self._orders.is_buy(rows)
+        sells = ~buys
+        trade_values = amounts * prices
+
+        base_asset, quote_asset = symbol.split("/")
+        if buys.any():
+            spent = float((trade_values[buys] + fee_costs[buys]).sum())
+            bought = float(amounts[buys].sum())
+            self._update_asset_balance(quote_asset, "used", -spent)
+            self._update_asset_balance(quote_asset, "total", -spent)
+            self._update_asset_balance(base_asset, "free", bought)
+            self._update_asset_balance(base_asset, "total", bought)
+        if sells.any():
+            sold = float(amounts[sells].sum())
+            received = float((trade_values[sells] - fee_costs[sells]).sum())
+            self._update_asset_balance(base_asset, "used", -sold)
+            self._update_asset_balance(base_asset, "total", -sold)
+            self._update_asset_balance(quote_asset, "free", received)
+            self._update_asset_balance(quote_asset, "total", received)
+
+        self._orders.set_statuses(rows, OrderStatus.FILLED.value, self.milliseconds())
 
     def tick(self) -> bool:
         """
@@ -285,7 +161,75 @@ class Backtester(ccxt.Exchange):
         """
         if self._data_feeds:
             self.fill_orders()
-        return self.__clock.tick()
+        running = self.__clock.tick()
+        for data_feed in self._data_feeds.values():
+            data_feed.advance(self.milliseconds())
+        return running
+
+    def run_until_event(self) -> bool:
+        """
+        Advance the clock like repeated tick() calls, stopping after the first
+        tick that fills an order or once the clock passes its end time.
+
+        Instead of filling tick by tick, the next tick at which any resting
+        order price falls inside the candle range is looked up in each feed's
+        CandleRangeIndex, and the clock jumps straight to it.
+
+        :return: True if the clock has not reached the end time, False otherwise.
+        """
+        clock = self.__clock
+        end = clock.end_epoch
+        if self.milliseconds() > end:
+            return self.tick()
+
+        event = None
+        if self._data_feeds:
+            for symbol in self._orders.symbols(OrderStatus.OPEN.value):
+                time = self.__next_fill_time(symbol)
+                if event is None or time < event:
+                    event = time
+
+        ticks_past_end = clock.ticks_until(end + 1)
+        ticks = ticks_past_end
+        if event is not None:
+            ticks = min(clock.ticks_until(event), ticks_past_end)
+        if ticks:
+            clock.fast_forward(ticks)
+            for data_feed in self._data_feeds.values():
+                data_feed.advance(self.milliseconds())
+        if ticks == ticks_past_end:
+            return False
+        return self.tick()
+
+    def __next_fill_time(self, symbol: str) -> int:
+        """
+        Find the first tick from now at which fill_orders would fill an open
+        order of a symbol, or fail because the feed has no more data.
+
+        :param symbol: The trading pair symbol.
+        :return: The time of the tick in milliseconds.
+        """
+        data_feed: DataFeed = self._data_feeds[symbol]
+        timestamps = data_feed.timestamps
+        prices = self._orders.book(symbol).prices()
+        interval = self.__clock.interval_milliseconds
+        now = self.milliseconds()
+
+        def first_tick_after(timestamp):
+            return now + self.__clock.ticks_until(timestamp + 1) * interval
+
+        time = now
+        while True:
+            index = data_feed.next_crossing(time, prices)
+            if index is None:
+                # the first tick past the last candle fails like tick() would
+                return first_tick_after(timestamps[-1]) if len(timestamps) else now
+            # a tick fills on the first candle at or after its time, so the
+            # candle belongs to the first tick after the previous candle
+            if index > 0:
+                time = max(time, first_tick_after(timestamps[index - 1]))
+            if time <= timestamps[index]:
+                return time
 
     def milliseconds(self):
         """
@@ -303,17 +247,33 @@ class Backtester(ccxt.Exchange):
         """
         return self.__clock.datetime()
 
-    def add_data_feed(self, symbol: str, timeframe: str, file_path: str):
+    def add_data_feed(
+        self, symbol: str, timeframe: str, file_path: Union[str, DataFeed]
+    ):
         """
         Add a new data feed to the backtester.
 
         :param symbol: The trading pair symbol (e.g., 'BTC/USDT').
         :param timeframe: The timeframe of the data (e.g., '1m', '1h').
-        :param file_path: The path to the data feed file.
+        :param file_path: The path to the data feed file, either JSON or the
+            memory-mapped .npy format, the directory of a partitioned store, of
+            which only the monthly partitions covering the clock window and
+            the partition before it, for lookback, are loaded, or an already
+            loaded DataFeed such as one attached to shared memory.
         """
         if symbol in self._data_feeds:
             raise NameError(f"Data feed for '{symbol}' already exists.")
-        self._data_feeds[symbol] = DataFeed(file_path, timeframe)
+        if isinstance(file_path, DataFeed):
+            self._data_feeds[symbol] = file_path
+        elif self.__clock is not None:
+            self._data_feeds[symbol] = DataFeed(
+                file_path,
+                timeframe,
+                start=self.__clock.start_epoch,
+                end=self.__clock.end_epoch,
+            )
+        else:
+            self._data_feeds[symbol] = DataFeed(file_path, timeframe)
 
     def deposit(self, asset: str, amount: float):
         """
@@ -342,7 +302,7 @@ class Backtester(ccxt.Exchange):
 
         :return: A dictionary of balances indexed by asset.
         """
-        return self._balances.set_index("asset").to_dict(orient="index")
+        return self._balances.to_dict()
 
     def create_order(
         self,
@@ -408,11 +368,6 @@ class Backtester(ccxt.Exchange):
         # Calculate fee
         fee_cost = amount * price * self._fee
         base_asset, quote_asset = symbol.split("/")
-        fee = {
-            "currency": quote_asset,
-            "cost": fee_cost,
-            "rate": self._fee,
-        }
 
         # Update pending balance
         if side == "buy":
@@ -432,22 +387,201 @@ class Backtester(ccxt.Exchange):
             self._update_asset_balance(base_asset, "used", amount)
             self._update_asset_balance(base_asset, "free", -amount)
 
-        order_id = len(self._orders)
-        self._orders.loc[order_id] = {
+        order_id = self._orders.append(
+            datetime=self.timestamp(),
+            timestamp=self.milliseconds(),
+            symbol=symbol,
+            type=type,
+            side=side,
+            price=price,
+            amount=amount,
+            fee_cost=fee_cost,
+            fee_rate=self._fee,
+            params=params,
+        )
+
+        return self.fetch_order(order_id)
+
+    def create_orders(self, orders: List[dict], params={}) -> List[dict]:
+        """
+        Creates a batch of orders at the current time, with the same rules as
+        create_order called once per order.
+
+        The batch is validated as arrays, each symbol's candle is looked up
+        once, the reservations are checked against the free balance of every
+        asset at once and the orders are written to the order store together.
+
+        :param orders: The orders, dictionaries with the symbol, type, side,
+            amount, price and optional params arguments of create_order.
+        :param params: 'atomic' (default True) creates every order or none of
+            them, raising the error of the first invalid order. When False,
+            orders are accepted in request order while they are valid and
+            funded, and the others are returned with status 'rejected' and the
+            error in their info.
+        :return: The orders, in request order.
+        :raises BadSymbol: If a trading pair is invalid, in atomic mode.
+        :raises BadRequest: If an order type, side, amount or price is invalid,
+            in atomic mode.
+        :raises OrderImmediatelyFillable: If a postOnly order would fill
+            immediately, in atomic mode.
+        :raises InsufficientFunds: If the batch needs more than the free
+            balance of an asset, in atomic mode.
+        """
+        atomic = params.get("atomic", True)
+        count = len(orders)
+        errors = [None] * count
+
+        def reject(mask: np.ndarray, error: Exception):
+            for index in np.flatnonzero(mask).tolist():
+                if errors[index] is None:
+                    errors[index] = error
+
+        def number(value) -> float:
+            return float(value) if isinstance(value, (int, float)) else np.nan
+
+        symbols = [order.get("symbol") for order in orders]
+        types = [order.get("type") for order in orders]
+        sides = [order.get("side") for order in orders]
+        order_params = [order.get("params") or {} for order in orders]
+        amounts = np.array([number(order.get("amount")) for order in orders])
+        prices = np.array([number(order.get("price")) for order in orders])
+
+        valid_symbols = np.array(
+            [isinstance(symbol, str) and "/" in symbol for symbol in symbols], bool
+        )
+        reject(
+            ~valid_symbols,
+            BadSymbol(
+                "Invalid symbol format. Expected 'BASE/QUOTE' (e.g., 'BTC/USDT')."
+            ),
+        )
+        limits = np.array([type == "limit" for type in types], bool)
+        markets = np.array([type == "market" for type in types], bool)
+        reject(
+            ~(limits | markets),
+            BadRequest("Invalid order type. Expected 'limit' or 'market'."),
+        )
+        buys = np.array([side == "buy" for side in sides], bool)
+        sells = np.array([side == "sell" for side in sides], bool)
+        reject(~(buys | sells), BadRequest("Invalid side. Expected 'buy' or 'sell'."))
+        reject(~(amounts > 0), BadRequest("Invalid amount. Must be a positive number."))
+        reject(~(prices > 0), BadRequest("Invalid price. Must be a positive number."))
+
+        # limit orders crossing the open are placed as market orders at the open
+        opens = np.full(count, np.nan)
+        symbol_array = np.array(symbols, dtype=object)
+        for symbol in set(symbol_array[valid_symbols & limits].tolist()):
+            datafeed = self._data_feeds.get(symbol, None)
+            if datafeed:
+                candle = datafeed.get_data_at_timestamp(self.milliseconds())
+                opens[symbol_array == symbol] = candle[1]
+        crossing = limits & np.where(buys, prices > opens, prices < opens)
+        post_only = np.array(
+            [bool(order.get("postOnly", False)) for order in order_params], bool
+        )
+        reject(
+            crossing & post_only,
+            OrderImmediatelyFillable("The order would be filled immediately."),
+        )
+        crossing &= ~post_only
+        prices = np.where(crossing, opens, prices)
+        types = ["market" if cross else type for cross, type in zip(crossing, types)]
+
+        # buys reserve quote currency including the fee, sells the base amount
+        fee_costs = amounts * prices * self._fee
+        reserved = np.where(buys, amounts * prices + fee_costs, amounts)
+        assets = np.array(
+            [
+                symbol.split("/")[0 if sell else 1] if valid else None
+                for symbol, sell, valid in zip(symbols, sells, valid_symbols)
+            ],
+            dtype=object,
+        )
+        valid = np.array([error is None for error in errors], bool)
+        reservations = {}
+        for asset in set(assets[valid].tolist()):
+            indexes = np.flatnonzero(valid & (assets == asset))
+            try:
+                free = self._get_asset_balance(asset, "free")
+            except ValueError as error:
+                reject(assets == asset, error)
+                continue
+            funds_error = InsufficientFunds(
+                f"Insufficient balance: {asset} balance too low."
+            )
+            needed = np.cumsum(reserved[indexes])
+            if needed[-1] <= free:
+                reservations[asset] = float(needed[-1])
+            elif atomic:
+                reject(indexes[needed > free], funds_error)
+            else:
+                # skip the orders the balance left by earlier ones cannot fund
+                for index in indexes.tolist():
+                    if reserved[index] > free:
+                        errors[index] = funds_error
+                    else:
+                        free -= reserved[index]
+                reservations[asset] = float(
+                    sum(reserved[index] for index in indexes if errors[index] is None)
+                )
+
+        if atomic:
+            for error in errors:
+                if error is not None:
+                    raise error
+
+        for asset, amount in reservations.items():
+            self._update_asset_balance(asset, "used", +amount)
+            self._update_asset_balance(asset, "free", -amount)
+
+        accepted = np.flatnonzero([error is None for error in errors])
+        ids = self._orders.extend(
+            datetime=self.timestamp(),
+            timestamp=self.milliseconds(),
+            symbols=[symbols[index] for index in accepted],
+            types=[types[index] for index in accepted],
+            sides=[sides[index] for index in accepted],
+            prices=prices[accepted],
+            amounts=amounts[accepted],
+            fee_costs=fee_costs[accepted],
+            fee_rate=self._fee,
+            params=[orders[index].get("params", {}) for index in accepted],
+        )
+
+        created = dict(zip(accepted.tolist(), ids.tolist()))
+        return [
+            (
+                self._orders.to_dict(created[index])
+                if index in created
+                else self.__rejected_order(orders[index], errors[index])
+            )
+            for index in range(count)
+        ]
+
+    def __rejected_order(self, order: dict, error: Exception) -> dict:
+        """
+        Build the order returned by create_orders for a rejected request.
+
+        :param order: The order request.
+        :param error: The reason the order was rejected.
+        :return: The order as a dictionary, without id.
+        """
+        return {
+            "id": None,
             "datetime": self.timestamp(),
             "timestamp": self.milliseconds(),
             "lastTradeTimestamp": None,
-            "symbol": symbol,
-            "type": type,
-            "side": side,
-            "price": price,
-            "amount": amount,
-            "fee": fee,
-            "status": OrderStatus.OPEN.value,
+            "symbol": order.get("symbol"),
+            "type": order.get("type"),
+            "side": order.get("side"),
+            "price": order.get("price"),
+            "amount": order.get("amount"),
+            "status": OrderStatus.REJECTED.value,
+            "fee": None,
+            "params": order.get("params", {}),
+            "info": {"error": f"{type(error).__name__}: {error}"},
         }
 
-        return self.fetch_order(order_id)
-
     def fetch_orders(
         self,
         symbol: str = None,
@@ -462,42 +596,53 @@ class Backtester(ccxt.Exchange):
         :param since: Timestamp in milliseconds to fetch orders since.
         :param limit: The maximum number of orders to return.
         :param params: Additional parameters specific to the exchange API.
-        :return: A list of orders.
+        :return: An OrderList, which builds the dictionary of an order only
+            when it is accessed.
         """
-        orders = self._orders
-        # Filter orders by symbol
-        if symbol is not None:
-            orders = orders[orders["symbol"] == symbol]
-
-        # Filter orders by since timestamp if provided
-        if since is not None:
-            orders = orders[orders["timestamp"] >= since]
-
-        for column, value in params.items():
-            if column == "until":
-                orders = orders[orders["timestamp"] < params["until"]]
+        filters = {
+            column: value
+            for column, value in params.items()
+            if column not in ("status", "until")
+        }
 
-            elif column == "id":
-                orders = orders[orders.index == params["id"]]
-            elif column in orders.columns:
-                orders = orders[orders[column] == value]
-            else:
-                raise BadRequest(f"Invalid column '{column}' in params.")
+        # Orders placed within [since, until), newest first. The limit can
+        # only be applied by the index when no other column is filtered.
+        rows = self._orders.latest(
+            symbol,
+            params.get("status"),
+            since,
+            params.get("until"),
+            None if filters else limit,
+        )
 
-        # Sort orders by timestamp
-        orders = orders.sort_values(by="timestamp", ascending=False)
+        for column, value in filters.items():
+            rows = self._orders.filter(rows, column, value)
 
         # Limit the number of orders if limit is provided
         if limit is not None:
-            orders = orders.head(limit)
+            rows = rows[:limit]
 
-        # Convert DataFrame to list of dictionaries
-        orders_list = (
-            orders.reset_index()
-            .rename(columns={"index": "id"})
-            .to_dict(orient="records")
-        )
-        return orders_list
+        return self._orders.views(rows)
+
+    def __find_order_row(self, id, symbol: str = None, params: dict = {}) -> int:
+        """
+        Resolve an order id to its row in the order store.
+
+        :param id: The ID of the order.
+        :param symbol: The trading pair symbol the order must belong to (optional).
+        :param params: Additional column filters the order must match (optional).
+        :return: The row of the order.
+        :raises OrderNotFound: If no order matches.
+        """
+        row = self._orders.row(id)
+        rows = np.array([row])
+        if symbol is not None:
+            rows = self._orders.filter(rows, "symbol", symbol)
+        for column, value in params.items():
+            rows = self._orders.filter(rows, column, value)
+        if len(rows) == 0:
+            raise OrderNotFound(f"Order with id '{id}' not found.")
+        return row
 
     def fetch_order(self, id: str, symbol: str = None, params: dict = {}):
         """
@@ -508,13 +653,7 @@ class Backtester(ccxt.Exchange):
         :param params: Additional parameters specific to the exchange API (optional).
         :return: The order as a dictionary.
         """
-        order = self.fetch_orders(symbol=symbol, params={"id": id, **params})
-        if not order or len(order) == 0:
-            raise OrderNotFound(f"Order with id '{id}' not found.")
-        if len(order) > 1:
-            raise OrderNotFound(f"Multiple orders found with id '{id}'.")
-
-        return order[0]
+        return self._orders.to_dict(self.__find_order_row(id, symbol, params))
 
     def fetch_open_orders(self, symbol: str, since=None, limit=None, params: dict = {}):
         """
@@ -569,25 +708,92 @@ class Backtester(ccxt.Exchange):
         :param symbol: The trading pair symbol (optional).
         :param params: Additional parameters specific to the exchange API (optional).
         """
-        order = self.fetch_order(id, symbol, params)
-        base_asset, quote_asset = order["symbol"].split("/")
-        if order["status"] != OrderStatus.OPEN.value:
+        row = self.__find_order_row(id, symbol, params)
+        base_asset, quote_asset = self._orders.symbol(row).split("/")
+        if self._orders.status(row) != OrderStatus.OPEN.value:
             raise BadRequest("Order is already closed or canceled.")
-        if order["side"] == "buy":
-            trade_value = order["amount"] * order["price"] + order["fee"]["cost"]
+        amount = self._orders.amount(row)
+        if self._orders.side(row) == "buy":
+            trade_value = amount * self._orders.price(row) + self._orders.fee_cost(row)
             self._update_asset_balance(quote_asset, "used", -trade_value)
             self._update_asset_balance(quote_asset, "free", +trade_value)
 
-        elif order["side"] == "sell":
-            self._update_asset_balance(base_asset, "used", -order["amount"])
-            self._update_asset_balance(base_asset, "free", +order["amount"])
+        elif self._orders.side(row) == "sell":
+            self._update_asset_balance(base_asset, "used", -amount)
+            self._update_asset_balance(base_asset, "free", +amount)
 
-        self.__set_df_value_by_column(
-            self._orders, "index", id, "status", OrderStatus.CANCELED.value
-        )
-        self.__set_df_value_by_column(
-            self._orders, "index", id, "lastTradeTimestamp", self.milliseconds()
+        self._orders.set_status(row, OrderStatus.CANCELED.value, self.milliseconds())
+
+    def cancel_orders(self, ids: List, symbol: str = None, params: dict = {}):
+        """
+        Cancels several orders by their IDs. Either every order is canceled or,
+        if any of them cannot be, none is.
+
+        :param ids: The IDs of the orders to cancel.
+        :param symbol: The trading pair symbol the orders must belong to (optional).
+        :param params: Additional column filters the orders must match (optional).
+        :return: The canceled orders.
+        :raises OrderNotFound: If an order does not exist or does not match.
+        :raises BadRequest: If an order is listed more than once or is not open.
+        """
+        rows = np.array(
+            [self.__find_order_row(id, symbol, params) for id in ids], dtype=np.int64
         )
+        if len(np.unique(rows)) != len(rows):
+            seen = set()
+            for id, row in zip(ids, rows.tolist()):
+                if row in seen:
+                    raise BadRequest(f"Order {id} is listed more than once.")
+                seen.add(row)
+        open_rows = self._orders.filter(rows, "status", OrderStatus.OPEN.value)
+        if len(open_rows) != len(rows):
+            raise BadRequest("Order is already closed or canceled.")
+        self.__cancel_rows(rows)
+        return self._orders.views(rows)
+
+    def cancel_all_orders(self, symbol: str = None, params: dict = {}):
+        """
+        Cancels every open order, optionally only those of one symbol.
+
+        :param symbol: The trading pair symbol (optional).
+        :param params: Additional parameters specific to the exchange API (optional).
+        :return: The canceled orders.
+        """
+        rows = self._orders.rows(symbol, OrderStatus.OPEN.value)
+        self.__cancel_rows(rows)
+        return self._orders.views(rows)
+
+    def __cancel_rows(self, rows: np.ndarray):
+        """
+        Cancel open orders at once, releasing their reserved balances as one
+        delta per asset.
+
+        :param rows: The rows of the open orders in the order store.
+        """
+        if len(rows) == 0:
+            return
+        released = {}
+        for symbol, symbol_rows in self._orders.group_by_symbol(rows).items():
+            base_asset, quote_asset = symbol.split("/")
+            amounts = self._orders.amounts(symbol_rows)
+            buys = self._orders.is_buy(symbol_rows)
+            if buys.any():
+                trade_values = amounts[buys] * self._orders.prices(
+                    symbol_rows[buys]
+                ) + self._orders.fee_costs(symbol_rows[buys])
+                released[quote_asset] = released.get(quote_asset, 0.0) + float(
+                    trade_values.sum()
+                )
+            if not buys.all():
+                released[base_asset] = released.get(base_asset, 0.0) + float(
+                    amounts[~buys].sum()
+                )
+
+        for asset, amount in released.items():
+            self._update_asset_balance(asset, "used", -amount)
+            self._update_asset_balance(asset, "free", +amount)
+
+        self._orders.set_statuses(rows, OrderStatus.CANCELED.value, self.milliseconds())
 
     def load_markets(self, reload=False, params=...):
         raise NotImplementedError(
@@ -646,3 +852,32 @@ class Backtester(ccxt.Exchange):
         return data_feed.get_data_between_timestamps(
             start=since, end=params.get("until", None), limit=limit, timeframe=timeframe
         )
+
+    def watch_ohlcv(self, symbol, timeframe="1m", since=None, limit=None, params={}):
+        """
+        Get the most recent ohlcvs up to the current time, like ccxt.pro.
+
+        Bars are built incrementally as the clock ticks, so only candles before
+        the current time are used and the last bar may still be in progress.
+        Each call costs O(limit) regardless of the history length, or
+        O(capacity) with since.
+
+        :param symbol: The trading pair symbol (e.g., 'BTC/USDT').
+        :param timeframe: The timeframe of the bars (e.g., '1h').
+        :param since: Only return bars starting at or after this timestamp.
+        :param limit: The maximum number of bars to return, the earliest ones
+            from since if given, like fetch_ohlcv, else the most recent ones.
+        :param params: 'capacity' sets how many completed bars are kept.
+        :return: A NumPy array of ohlcvs, oldest first.
+        """
+        if symbol not in self._data_feeds:
+            raise BadSymbol(f"No data feed found for '{symbol}'.")
+        data_feed: DataFeed = self._data_feeds[symbol]
+        capacity = max(params.get("capacity", 1000), limit or 0)
+        resampler = data_feed.stream(timeframe, capacity)
+        resampler.advance(self.milliseconds())
+        if since is None:
+            return resampler.ohlcv(limit)
+        # like fetch_ohlcv, the limit applies to the bars from since on
+        ohlcv = resampler.ohlcv()
+        return ohlcv[ohlcv[:, 0] >= since][:limit]
@@ -0,0 +1,125 @@
+from typing import Dict
+
+import numpy as np
+
+
+class BalanceLedger:
+    """
+    Per-asset balances held in a preallocated NumPy array.
+
+    Every asset owns one row ("slot") of a (capacity, 3) float64 array holding
+    its free, used and total balances. Assets are resolved to slots through a
+    dictionary, so reads and updates are O(1).
+    """
+
+    COLUMNS = ("free", "used", "total")
+
+    def __init__(self, balances: Dict = None, capacity: int = 16):
+        """
+        Initialize the ledger.
+
+        :param balances: Initial free balances, example: {"BTC": 1, "ETH": 10}
+        :param capacity: Number of asset slots to preallocate.
+        """
+        self._slots: Dict[str, int] = {}
+        self._columns = {column: i for i, column in enumerate(self.COLUMNS)}
+        self._values = np.zeros((max(capacity, 1), len(self.COLUMNS)), np.float64)
+
+        for asset, balance in (balances or {}).items():
+            self.add_asset(asset, balance)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, asset: str) -> bool:
+        return asset in self._slots
+
+    def add_asset(self, asset: str, free: float = 0.0) -> int:
+        """
+        Register a new asset, growing the backing array if it is full.
+
+        :param asset: The asset to register.
+        :param free: The initial free (and total) balance of the asset.
+        :return: The slot assigned to the asset.
+        :raises ValueError: If the asset is already registered.
+        """
+        if asset in self._slots:
+            raise ValueError(f"Asset '{asset}' already exists in the ledger.")
+
+        slot = len(self._slots)
+        if slot == len(self._values):
+            grown = np.zeros((2 * len(self._values), len(self.COLUMNS)), np.float64)
+            grown[:slot] = self._values
+            self._values = grown
+
+        self._slots[asset] = slot
+        self._values[slot] = (free, 0.0, free)
+        return slot
+
+    def slot(self, asset: str) -> int:
+        """
+        Get the slot of an asset.
+
+        :param asset: The asset to look up.
+        :return: The row of the asset in the backing array.
+        :raises ValueError: If the asset is not in the ledger.
+        """
+        try:
+            return self._slots[asset]
+        except KeyError:
+            raise ValueError(f"No balance found for asset '{asset}'.")
+
+    def column(self, column: str) -> int:
+        """
+        Get the index of a balance column.
+
+        :param column: The column name ('free', 'used' or 'total').
+        :return: The column index in the backing array.
+        :raises ValueError: If the column does not exist.
+        """
+        try:
+            return self._columns[column]
+        except KeyError:
+            raise ValueError(f"Balance column '{column}' does not exist.")
+
+    def get(self, asset: str, column: str) -> float:
+        """
+        Get the balance of an asset for a column.
+
+        :param asset: The asset to query.
+        :param column: The column to retrieve (e.g., 'free' or 'total').
+        :return: The balance of the asset in the specified column.
+        """
+        return float(self._values[self.slot(asset), self.column(column)])
+
+    def set(self, asset: str, column: str, value: float) -> None:
+        """
+        Overwrite the balance of an asset for a column.
+
+        :param asset: The asset to update.
+        :param column: The column to update.
+        :param value: The new balance.
+        """
+        self._values[self.slot(asset), self.column(column)] = value
+
+    def update(self, asset: str, column: str, delta: float) -> None:
+        """
+        Add a delta to the balance of an asset for a column.
+
+        :param asset: The asset to update.
+        :param column: The column to update.
+        :param delta: The amount to add (negative to subtract).
+        """
+        self._values[self.slot(asset), self.column(column)] += delta
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Export the ledger in the ccxt balance layout.
+
+        :return: A dictionary of balances indexed by asset.
+        """
+        rows = self._values[: len(self._slots)].tolist()
+        return {
+            asset: dict(zip(self.COLUMNS, rows[slot]))
+            for asset, slot in self._slots.items()
+        }
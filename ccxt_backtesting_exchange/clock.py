@@ -2,6 +2,15 @@ import datetime
 
 
 class Clock:
+    """
+    Steps through time from a start time to an end time at a fixed interval.
+
+    The current time is kept as an integer number of milliseconds, so reading
+    it is cheap. The datetime object and the formatted string of the current
+    time are only built when asked for, and the string is memoized until the
+    clock moves.
+    """
+
     def __init__(
         self,
         start_time: datetime.datetime,
@@ -14,11 +23,38 @@ class Clock:
         :param start_time: The starting time of the backtest.
         :param end_time: The ending time of the backtest.
         :param interval: The time interval for each step (e.g., 1 second, 1 minute).
+        :raises ValueError: If the interval is not a positive number of milliseconds.
         """
+        if interval <= datetime.timedelta(0) or interval % datetime.timedelta(
+            milliseconds=1
+        ):
+            raise ValueError(
+                f"Invalid interval {interval}: must be a positive whole number "
+                "of milliseconds."
+            )
         self.start_time = start_time
         self.end_time = end_time
         self.interval = interval
-        self.current_time = start_time
+        self.start_epoch = int(start_time.timestamp() * 1000)
+        self.end_epoch = int(end_time.timestamp() * 1000)
+        self.interval_milliseconds = interval // datetime.timedelta(milliseconds=1)
+        self.reset()
+
+    @property
+    def ticks(self) -> int:
+        """
+        The number of time steps taken since the start time.
+        """
+        return self._ticks
+
+    @property
+    def current_time(self) -> datetime.datetime:
+        return self.start_time + self._ticks * self.interval
+
+    @current_time.setter
+    def current_time(self, current_time: datetime.datetime) -> None:
+        self._ticks = (current_time - self.start_time) // self.interval
+        self._epoch = self.start_epoch + self._ticks * self.interval_milliseconds
 
     def tick(self) -> bool:
         """
@@ -26,8 +62,29 @@ class Clock:
 
         :return: True if the clock has not reached the end time, False otherwise.
         """
-        self.current_time += self.interval
-        return self.current_time <= self.end_time
+        self._ticks += 1
+        self._epoch += self.interval_milliseconds
+        return self._epoch <= self.end_epoch
+
+    def ticks_until(self, timestamp: int) -> int:
+        """
+        Count the ticks needed for the clock to reach a point in time.
+
+        :param timestamp: The time in milliseconds.
+        :return: The smallest number of ticks after which epoch() >= timestamp.
+        """
+        return max(0, -(-(timestamp - self._epoch) // self.interval_milliseconds))
+
+    def fast_forward(self, ticks: int) -> bool:
+        """
+        Advance the clock by several time steps at once.
+
+        :param ticks: The number of time steps to advance.
+        :return: True if the clock has not reached the end time, False otherwise.
+        """
+        self._ticks += ticks
+        self._epoch += ticks * self.interval_milliseconds
+        return self._epoch <= self.end_epoch
 
     def get_current_time(self) -> datetime.datetime:
         """
@@ -43,7 +100,7 @@ class Clock:
 
         :return: The current time in milliseconds.
         """
-        return int(self.current_time.timestamp() * 1000)
+        return self._epoch
 
     def datetime(self) -> str:
         """
@@ -51,10 +108,16 @@ class Clock:
 
         :return: The current time as a string.
         """
-        return self.current_time.strftime("%Y-%m-%d %H:%M:%S")
+        if self._datetime_epoch != self._epoch:
+            self._datetime = self.current_time.strftime("%Y-%m-%d %H:%M:%S")
+            self._datetime_epoch = self._epoch
+        return self._datetime
 
     def reset(self):
         """
         Reset the clock to the start time.
         """
-        self.current_time = self.start_time
+        self._ticks = 0
+        self._epoch = self.start_epoch
+        self._datetime = None
+        self._datetime_epoch = None
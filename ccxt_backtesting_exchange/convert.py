@@ -0,0 +1,54 @@
+import argparse
+import glob
+import os
+import sys
+from typing import Dict, Optional
+
+from .storage import build_sidecar
+
+
+def convert_directory(directory: str, force: bool = False) -> Dict[str, Optional[str]]:
+    """
+    Build the binary sidecar of every JSON ohlcv file in a directory.
+
+    :param directory: The directory holding the JSON files.
+    :param force: Rebuild sidecars even if they are still valid.
+    :return: A dictionary mapping each JSON path to None on success or to the
+        error message if the file could not be converted.
+    """
+    results = {}
+    for json_path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        try:
+            build_sidecar(json_path, force=force)
+            results[json_path] = None
+        except (OSError, ValueError) as error:
+            results[json_path] = str(error)
+    return results
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point, see `python -m ccxt_backtesting_exchange.convert -h`.
+    """
+    parser = argparse.ArgumentParser(
+        description="Convert JSON ohlcv files to memory-mappable binary sidecars."
+    )
+    parser.add_argument(
+        "directory", nargs="?", default="./data", help="directory of JSON files"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild sidecars that are up to date"
+    )
+    args = parser.parse_args(argv)
+
+    results = convert_directory(args.directory, force=args.force)
+    for json_path, error in results.items():
+        if error is None:
+            print(f"Converted {json_path}")
+        else:
+            print(f"Skipped {json_path}: {error}", file=sys.stderr)
+    return 1 if any(results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,127 @@
+import hashlib
+import os
+from typing import Optional, Union
+
 import numpy as np
-import json
 
-from .utils import timeframe_to_timedelta
+from .partitioned_store import PartitionedStore
+from .range_index import CandleRangeIndex
+from .resample_cache import ResampleCache, default_resample_cache
+from .storage import load_ohlcv_json, load_ohlcv_npy
+from .streaming_resampler import StreamingResampler
+from .utils import resample_ohlcv, timeframe_to_timedelta
 
 
 class DataFeed:
 
-    def __init__(self, file_path: str, timeframe: str = "1m"):
+    def __init__(
+        self,
+        file_path: Union[str, os.PathLike, np.ndarray],
+        timeframe: str = "1m",
+        sidecar: bool = True,
+        resample_cache: ResampleCache = None,
+        fingerprint: str = None,
+        start: int = None,
+        end: int = None,
+        lookback: int = 1,
+    ):
         """
-        Initialize the DataFeed by loading ohlcv data from a JSON file.
-
-        :param file_path: Path to the JSON file containing ohlcv data.
+        Initialize the DataFeed by loading ohlcv data from a file.
+
+        JSON files hold a list of [timestamp, open, high, low, close, volume]
+        lists. Files ending in .npy hold the binary columnar format written by
+        storage.save_ohlcv_npy and are memory-mapped instead of parsed.
+
+        :param file_path: Path to the JSON or .npy file containing ohlcv data,
+            the directory of a PartitionedStore, or a (n, 6) array of ohlcvs,
+            used without copying if column-major (Fortran order) and copied
+            to column-major otherwise. The feed's data is read-only.
+        :param sidecar: Cache JSON files as a binary sidecar next to them and
+            load the sidecar on later runs, see storage.load_ohlcv_json.
+        :param resample_cache: Cache for resampled data. Defaults to the cache
+            shared by every feed, resample_cache.default_resample_cache.
+        :param fingerprint: The fingerprint of the data if already known, which
+            saves hashing it.
+        :param start: With a partitioned store, only the partitions from this
+            time on, in milliseconds, are loaded.
+        :param end: With a partitioned store, only the partitions up to this
+            time, in milliseconds, are loaded.
+        :param lookback: With a partitioned store and a start, how many stored
+            partitions before the start are loaded too, so the history
+            preceding it stays available.
         """
         self.__interval = timeframe_to_timedelta(timeframe)
-        self.__RESAMPLE_CACHE = {}
+        self.__resample_cache = (
+            default_resample_cache if resample_cache is None else resample_cache
+        )
+        self.__fingerprint = fingerprint
+        self.__streams = {}
+        self.__range_index = None
+        if not isinstance(file_path, np.ndarray):
+            file_path = os.fspath(file_path)
         try:
-            with open(file_path, "r") as file:
-                data = json.load(file)
-
-            self.__data = np.array(data, dtype=np.float64)
+            if isinstance(file_path, np.ndarray):
+                self.__data = file_path
+            elif PartitionedStore.is_store(file_path):
+                self.__data = PartitionedStore(file_path).read(start, end, lookback)
+            elif file_path.endswith(".npy"):
+                self.__data = load_ohlcv_npy(file_path)
+            else:
+                self.__data = load_ohlcv_json(file_path, sidecar=sidecar)
         except FileNotFoundError:
             # if file does not exist, create an empty array and raise a warning
             self.__data = np.array([])
             print(f"Warning: File {file_path} not found. DataFeed is empty.")
 
+        # keep columns contiguous so the timestamp column can be searched in place,
+        # and read-only through a view so no caller can alter the feed's data
+        # whichever file, cache or array it came from
+        self.__data = np.asfortranarray(self.__data).view()
+        self.__data.flags.writeable = False
+        self.__move_cursor(0)
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The (n, 6) ohlcv array of the feed.
+        """
+        return self.__data
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        A digest of the feed's data, identifying feeds with identical content.
+        """
+        if self.__fingerprint is None:
+            digest = hashlib.blake2b(repr(self.__data.shape).encode(), digest_size=16)
+            for column in self.__data.T:
+                digest.update(np.ascontiguousarray(column))
+            self.__fingerprint = digest.hexdigest()
+        return self.__fingerprint
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """
+        The timestamp column of the feed, sorted ascending.
+        """
+        return self.__data[:, 0] if self.__data.size else np.array([])
+
+    def next_crossing(self, timestamp: int, prices: np.ndarray) -> Optional[int]:
+        """
+        Find the first candle at or after a timestamp whose [low, high] range
+        contains any of the given prices.
+
+        :param timestamp: The timestamp in milliseconds to start searching from.
+        :param prices: The prices, sorted ascending.
+        :return: The index of the candle, or None if no candle qualifies.
+        """
+        if self.__data.size == 0:
+            return None
+        if self.__range_index is None:
+            self.__range_index = CandleRangeIndex(self.__data[:, 3], self.__data[:, 2])
+        start = int(np.searchsorted(self.__data[:, 0], timestamp))
+        return self.__range_index.next_crossing(start, prices)
+
     def _aggregate_ohlcv(self, ohlcv: np.ndarray):
         """
         Aggregate a set of ohlcvs into a single ohlcv.
@@ -64,7 +162,7 @@ class DataFeed:
         :param end: End timestamp in milliseconds (exclusive).
         :param limit: Maximum number of records to return. Return all records if None.
         :param timeframe: Resample the data to a new timeframe before returning.
-        :return: A NumPy structured array containing the filtered ohlcvs.
+        :return: A read-only NumPy array view of the filtered ohlcvs.
         """
         if self.__data.size == 0:
             return np.array([])
@@ -73,23 +171,55 @@ class DataFeed:
         else:
             data = self.__data
 
-        timestamps = data[:, 0]  # Extract timestamps from first column
-        if start is None:
-            mask = timestamps >= timestamps[0]
-        else:
-            mask = timestamps >= start
-
-        if end is not None:
-            mask &= timestamps < end
-
-        filtered_data = data[mask]
+        # Timestamps are sorted and contiguous (column-major data), so both
+        # bounds are binary searches and the result is a view, not a copy
+        timestamps = data[:, 0]
+        first = 0 if start is None else int(np.searchsorted(timestamps, start))
+        last = len(data) if end is None else int(np.searchsorted(timestamps, end))
+        last = max(first, last)
 
         if limit is not None:
             if end is None and start is not None:
-                filtered_data = filtered_data[:limit]
+                last = min(last, first + limit)
             else:
-                filtered_data = filtered_data[-limit:]
-        return filtered_data
+                first = max(first, last - limit)
+        return data[first:last]
+
+    def __move_cursor(self, index: int) -> None:
+        """
+        Point the cursor at a row, caching the timestamps bounding it.
+        """
+        timestamps = self.__data[:, 0] if self.__data.size else self.__data
+        self.__cursor = index
+        self.__cursor_low = float(timestamps[index - 1]) if index > 0 else -np.inf
+        self.__cursor_high = (
+            float(timestamps[index]) if index < len(timestamps) else np.inf
+        )
+
+    def __seek(self, timestamp: int) -> int:
+        """
+        Find the first row at or after a timestamp, like np.searchsorted.
+
+        The row found last is remembered. During a backtest the clock only
+        moves forward, so the answer is usually that row or the next one and
+        the binary search is only a fallback.
+
+        :param timestamp: The timestamp in milliseconds.
+        :return: The index of the first row with a timestamp >= timestamp.
+        """
+        if self.__cursor_low < timestamp <= self.__cursor_high:
+            return self.__cursor
+
+        timestamps = self.__data[:, 0]
+        index = self.__cursor
+        if timestamp > self.__cursor_high:
+            index += 1
+            if index < len(timestamps) and timestamps[index] < timestamp:
+                index += int(np.searchsorted(timestamps[index:], timestamp))
+        else:
+            index = int(np.searchsorted(timestamps, timestamp))
+        self.__move_cursor(index)
+        return index
 
     def get_data_at_timestamp(self, timestamp: int, offset: int = 0):
         """
@@ -102,8 +232,7 @@ class DataFeed:
         if self.__data.size == 0:
             return np.array([])
 
-        timestamps = self.__data[:, 0]
-        index = np.searchsorted(timestamps, timestamp)
+        index = self.__seek(timestamp)
         index += offset
         if index < 0 or index >= len(self.__data):
             raise IndexError("Index out of bounds")
@@ -118,9 +247,6 @@ class DataFeed:
         """
         interval = timeframe_to_timedelta(timeframe)
 
-        if interval in self.__RESAMPLE_CACHE:
-            return self.__RESAMPLE_CACHE[interval]
-
         if interval < self.__interval:
             raise ValueError("New timeframe must be larger than current timeframe")
 
@@ -131,28 +257,51 @@ class DataFeed:
             return np.array([])
 
         resample_milliseconds = int(interval.total_seconds() * 1000)
-        timestamps = self.__data[:, 0]
+        return self.__resample_cache.get_or_compute(
+            (self.fingerprint, resample_milliseconds),
+            lambda: self.__resample(resample_milliseconds),
+        )
 
-        # Compute the bins: round timestamps down to the nearest interval
-        bin_edges = (timestamps // resample_milliseconds) * resample_milliseconds
-        unique_bins, bin_indices = np.unique(bin_edges, return_inverse=True)
+    def __resample(self, resample_milliseconds: int) -> np.ndarray:
+        """
+        Aggregate the data into bins of resample_milliseconds.
 
-        # Preallocate array for performance
-        aggregated_data = np.zeros(
-            (len(unique_bins), self.__data.shape[1]), dtype=np.float64
-        )
+        :param resample_milliseconds: The bin size in milliseconds.
+        :return: A NumPy array containing the resampled ohlcvs.
+        """
+        data = self.__data
+        timestamps = data[:, 0]
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            data = data[np.argsort(timestamps, kind="stable")]
 
-        for i, bin_val in enumerate(unique_bins):
-            mask = bin_edges == bin_val
-            grouped_data = self.__data[mask]
+        return resample_ohlcv(data, resample_milliseconds)
 
-            aggregated_data[i, 0] = bin_val
-            aggregated_data[i, 1] = grouped_data[0, 1]  # first open, as open
-            aggregated_data[i, 2] = np.max(grouped_data[:, 2])
-            aggregated_data[i, 3] = np.min(grouped_data[:, 3])
-            aggregated_data[i, 4] = grouped_data[-1, 4]  # last close, as close
+    def stream(self, timeframe: str, capacity: int = 1000) -> StreamingResampler:
+        """
+        Get the incremental resampler of a timeframe, creating it if needed.
 
-            aggregated_data[i, 5] = grouped_data[:, 5].sum()
+        :param timeframe: The timeframe to build (e.g., '1h').
+        :param capacity: The minimum number of completed bars to keep.
+        :return: The StreamingResampler of the timeframe.
+        """
+        if timeframe_to_timedelta(timeframe) < self.__interval:
+            raise ValueError("New timeframe must be larger than current timeframe")
+
+        resampler = self.__streams.get(timeframe)
+        if resampler is None or resampler.capacity < capacity:
+            data = self.__data if self.__data.size else self.__data.reshape(0, 6)
+            resampler = StreamingResampler(data, timeframe, capacity)
+            self.__streams[timeframe] = resampler
+        return resampler
 
-        self.__RESAMPLE_CACHE[interval] = aggregated_data
-        return aggregated_data
+    def advance(self, timestamp: int) -> None:
+        """
+        Advance the cursor and every incremental resampler of the feed to the
+        given time.
+
+        :param timestamp: The current time in milliseconds.
+        """
+        if self.__data.size:
+            self.__seek(timestamp)
+        for resampler in self.__streams.values():
+            resampler.advance(timestamp)
@@ -1,30 +1,59 @@
 import ccxt
+import numpy as np
 import pandas as pd
 import json
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List, Tuple
+from typing import Iterator, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
-from .utils import timeframe_to_timedelta
+from .partitioned_store import PartitionedStore
+from .rate_limit import TokenBucket, retry
+from .storage import OHLCV_COLUMNS
+from .utils import find_gaps, timeframe_to_timedelta
 
 
 class MarketDataCache:
-    def __init__(self, exchange_id: str, symbol: str, timeframe="1m"):
+    def __init__(
+        self,
+        exchange_id: str,
+        symbol: str,
+        timeframe="1m",
+        exchange: ccxt.Exchange = None,
+        retries: int = 3,
+        backoff: float = 1.0,
+        partitioned: bool = False,
+    ):
         """
         Initialize the MarketDataCache.
 
         :param exchange_id: The ID of the exchange (e.g., 'binance', 'kraken').
         :param symbol: The trading symbol (e.g., 'BTC/USDT').
+        :param exchange: An exchange object to fetch from instead of creating
+            one from exchange_id, e.g. a configured client or a stub.
+        :param retries: How many times a failed request is retried.
+        :param backoff: Delay in seconds before the first retry, doubled each time.
+        :param partitioned: Store the data as monthly binary partitions with a
+            manifest of synced ranges, see PartitionedStore, instead of a
+            single JSON file rewritten on every sync.
         """
-        try:
-            self.exchange: ccxt.Exchange = getattr(ccxt, exchange_id)()
-        except AttributeError:
-            raise ValueError(f"Exchange {exchange_id} not supported by ccxt.")
+        if exchange is None:
+            try:
+                exchange = getattr(ccxt, exchange_id)()
+            except AttributeError:
+                raise ValueError(f"Exchange {exchange_id} not supported by ccxt.")
+        self.exchange: ccxt.Exchange = exchange
+        self.retries = retries
+        self.backoff = backoff
+        self.__rate_limiter: Optional[TokenBucket] = None
 
         self.symbol = symbol
         self.timeframe = timeframe
         self.interval = timeframe_to_timedelta(timeframe)
         self.file_path = f"./data/{symbol.replace('/', '_')}_{timeframe}.json".lower()
+        self.store = (
+            PartitionedStore(self.file_path[: -len(".json")]) if partitioned else None
+        )
 
     def __convert_to_dataframe(self, arr) -> pd.DataFrame:
         """
@@ -36,9 +65,17 @@ class MarketDataCache:
         df = pd.DataFrame(
             arr, columns=["timestamp", "open", "high", "low", "close", "volume"]
         )
-        df["timestamp"] = df["timestamp"].astype("int64")
-        df.iloc[:, 1:] = df.iloc[:, 1:].astype("float64")
-        return df
+        # astype copies, so read-only input arrays are never written to
+        return df.astype(
+            {
+                "timestamp": "int64",
+                "open": "float64",
+                "high": "float64",
+                "low": "float64",
+                "close": "float64",
+                "volume": "float64",
+            }
+        )
 
     def split_gap_into_chunks(
         self, gaps: List[Tuple[datetime, datetime]], max_delta: timedelta
@@ -61,54 +98,98 @@ class MarketDataCache:
 
         return chunks
 
+    def iter_ohlcv(
+        self, since: Optional[int] = None, until: Optional[int] = None, limit: int = 100
+    ) -> Iterator[np.ndarray]:
+        """
+        Fetch OHLCV data page by page, yielding each page as it arrives.
+
+        Paging stops once a page reaches until, or when the exchange returns
+        an empty page or a page that does not advance past the previous one.
+
+        :param since: Timestamp in milliseconds to fetch data from (optional).
+        :param until: Timestamp in milliseconds to fetch data until (optional).
+        :param limit: Number of data points to fetch per page (default is 100).
+        :return: A generator of (n, 6) float64 arrays of ohlcvs.
+        """
+        last_timestamp = None
+        while True:
+            ohlcv = retry(
+                lambda: self.__request_ohlcv(since, until, limit),
+                retries=self.retries,
+                backoff=self.backoff,
+            )
+            if len(ohlcv) == 0:
+                return
+            page = np.asarray(ohlcv, dtype=np.float64)
+            if last_timestamp is not None and page[-1, 0] <= last_timestamp:
+                return
+            yield page
+
+            last_timestamp = page[-1, 0]
+            if until is not None and last_timestamp >= until:
+                return
+            since = int(last_timestamp + 1)
+
     def fetch_ohlcv(
         self, since: Optional[int] = None, until: Optional[int] = None, limit: int = 100
     ) -> pd.DataFrame:
         """
-        Fetch OHLCV data using ccxt.
+        Fetch OHLCV data using ccxt, following pages until the range is covered.
 
         :param since: Timestamp in milliseconds to fetch data from (optional).
         :param until: Timestamp in milliseconds to fetch data until (optional).
-        :param limit: Number of data points to fetch (default is 100).
+        :param limit: Number of data points to fetch per page (default is 100).
         :return: Pandas DataFrame with OHLCV data.
         """
-
-        ohlcv = self.exchange.fetch_ohlcv(
+        # pages are appended to a buffer that doubles when full, so the rows
+        # are copied a constant number of times on average
+        buffer = np.empty((limit or 1000, 6), dtype=np.float64)
+        size = 0
+        for page in self.iter_ohlcv(since=since, until=until, limit=limit):
+            end = size + len(page)
+            if end > len(buffer):
+                grown = np.empty((max(end, 2 * len(buffer)), 6), dtype=np.float64)
+                grown[:size] = buffer[:size]
+                buffer = grown
+            buffer[size:end] = page
+            size = end
+
+        return self.__convert_to_dataframe(buffer[:size])
+
+    def __request_ohlcv(
+        self, since: Optional[int], until: Optional[int], limit: int
+    ) -> list:
+        if self.__rate_limiter is not None:
+            self.__rate_limiter.acquire()
+        return self.exchange.fetch_ohlcv(
             self.symbol,
             timeframe=self.timeframe,
             since=since,
             limit=limit,
             params={"until": until},
         )
-        print(ohlcv)
-
-        if len(ohlcv) == 0:
-            return self.__convert_to_dataframe([])
 
-        df = self.__convert_to_dataframe(ohlcv)
-
-        last_fetched_timestamp = df["timestamp"].iloc[-1]
-        if last_fetched_timestamp >= until:
-            return df
-        else:
-            return pd.concat(
-                [
-                    df,
-                    self.fetch_ohlcv(
-                        since=int(last_fetched_timestamp + 1),
-                        until=until,
-                        limit=limit,
-                    ),
-                ],
-                ignore_index=True,
-            )
-
-    def load_existing_data(self) -> pd.DataFrame:
+    def load_existing_data(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> pd.DataFrame:
         """
-        Load existing OHLCV data from the JSON file.
+        Load existing OHLCV data from the JSON file or the partitioned store.
 
+        :param since: With a partitioned store, only the partitions from this
+            time on are read.
+        :param until: With a partitioned store, only the partitions up to this
+            time are read.
         :return: Pandas DataFrame with existing data.
         """
+        if self.store is not None:
+            return self.__convert_to_dataframe(
+                self.store.read(
+                    start=None if since is None else self.__milliseconds(since),
+                    end=None if until is None else self.__milliseconds(until),
+                )
+            )
+
         try:
             with open(self.file_path, "r") as file:
                 data = json.load(file)
@@ -130,69 +211,150 @@ class MarketDataCache:
         :param df: Pandas DataFrame with OHLCV data.
         :param start_time: Start time of the data.
         :param end_time: End time of the data.
+        :return: List of (start, end) timestamps of the gaps, end excluded.
         """
         if df.empty:
             return [(start_time, end_time)]
 
-        df["datetime"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-        df.set_index("datetime", inplace=True)
-
-        full_range = pd.date_range(
-            start=start_time, end=end_time, freq=self.interval, tz=timezone.utc
+        gaps = find_gaps(
+            df["timestamp"].to_numpy(dtype=np.int64),
+            self.__milliseconds(start_time),
+            self.__milliseconds(end_time),
+            self.__interval_milliseconds(),
         )
-        missing_timestamps = full_range.difference(df.index)
+        return self.__to_timestamps(gaps)
 
-        if missing_timestamps.empty:
-            return []
-
-        missing_intervals = []
-        start = missing_timestamps[0]
-        prev = missing_timestamps[0]
-
-        for ts in missing_timestamps[1:]:
-            if ts - prev == self.interval:
-                prev = ts
-            else:
-                missing_intervals.append((start, prev + self.interval))
-                start = ts
-                prev = ts
+    def identify_store_gaps(self, start_time: datetime, end_time: datetime):
+        """
+        Identify the parts of a time range the partitioned store has not
+        synced, from its manifest alone, without reading any candle.
 
-        missing_intervals.append((start, prev + self.interval))
-        return missing_intervals
+        :param start_time: Start time of the data.
+        :param end_time: End time of the data.
+        :return: List of (start, end) timestamps of the gaps, end excluded.
+        """
+        start = self.__milliseconds(start_time)
+        end = self.__milliseconds(end_time) + self.__interval_milliseconds()
+        return self.__to_timestamps(self.store.missing_ranges(start, end))
+
+    def __interval_milliseconds(self) -> int:
+        return self.interval // timedelta(milliseconds=1)
+
+    @staticmethod
+    def __milliseconds(time: datetime) -> int:
+        # naive datetimes are taken as UTC
+        time = pd.Timestamp(time)
+        if time.tzinfo is None:
+            time = time.tz_localize(timezone.utc)
+        return time.value // 1_000_000
+
+    @staticmethod
+    def __to_timestamps(gaps) -> List[Tuple[pd.Timestamp, pd.Timestamp]]:
+        times = pd.to_datetime(np.asarray(gaps, dtype=np.int64).ravel(), unit="ms")
+        times = times.tz_localize(timezone.utc)
+        return list(zip(times[0::2], times[1::2]))
 
     def save_data(self, df: pd.DataFrame) -> None:
         """
-        Save OHLCV data to the JSON file.
+        Save OHLCV data to the JSON file, or merge it into the partitions of
+        the partitioned store it falls in.
 
         :param df: Pandas DataFrame with OHLCV data.
         """
+        if self.store is not None:
+            self.store.write(df[list(OHLCV_COLUMNS)].to_numpy(dtype=np.float64))
+            return
         df = df.sort_values("timestamp").drop_duplicates(subset="timestamp")
         df.to_json(self.file_path, orient="values")
 
     def sync(
-        self, since: datetime, until: datetime, chunk_size: int = 1000
+        self,
+        since: datetime,
+        until: datetime,
+        chunk_size: int = 1000,
+        max_workers: int = 4,
     ) -> pd.DataFrame:
         """
         Sync the OHLCV data with the exchange.
 
+        The gaps are split into chunks fetched concurrently by a pool of
+        threads. Requests are spaced by a token bucket following the
+        exchange's rateLimit, unless its enableRateLimit is off, and failed
+        requests are retried with exponential backoff. If a chunk still fails,
+        the chunks fetched so far are saved before the error is raised.
+
+        With a partitioned store, the gaps are found from the ranges its
+        manifest records as synced, without reading the stored candles.
+
         :param since: Start time of the data.
         :param until: End time of the data.
-        :return: Updated Pandas DataFrame with OHLCV data.
+        :param chunk_size: Number of candles fetched per request.
+        :param max_workers: Maximum number of requests in flight at once.
+        :return: Updated Pandas DataFrame with OHLCV data, sorted by timestamp.
         """
-        existing_data = self.load_existing_data()
-        gaps = self.identify_data_gaps(existing_data, since, until)
+        if self.store is None:
+            existing_data = self.load_existing_data()
+            gaps = self.identify_data_gaps(existing_data, since, until)
+        else:
+            gaps = self.identify_store_gaps(since, until)
         gaps = self.split_gap_into_chunks(gaps, max_delta=chunk_size * self.interval)
 
-        for start, end in tqdm(gaps, desc="Syncing data"):
-            new_data = self.fetch_ohlcv(
-                since=int(start.timestamp() * 1000),
-                until=int(end.timestamp() * 1000),
-                limit=chunk_size,
-            )
-            if existing_data.empty:
-                existing_data = new_data
-            else:
-                existing_data = pd.concat([existing_data, new_data], ignore_index=True)
-
-        self.save_data(existing_data)
+        self.__rate_limiter = TokenBucket.from_exchange(
+            self.exchange, capacity=max_workers
+        )
+        fetched = []
+        covered = []
+        interval = self.__interval_milliseconds()
+        error = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.fetch_ohlcv, since=start, until=end, limit=chunk_size
+                ): (start, end)
+                for start, end in (
+                    (self.__milliseconds(start), self.__milliseconds(end))
+                    for start, end in gaps
+                )
+            }
+            for future in tqdm(
+                as_completed(futures), total=len(futures), desc="Syncing data"
+            ):
+                if future.cancelled():
+                    continue
+                try:
+                    frame = future.result()
+                    fetched.append(frame)
+                    if not frame.empty:
+                        # the chunk is only known to be synced up to its last
+                        # candle, the exchange may not have the rest yet
+                        start, end = futures[future]
+                        last = int(frame["timestamp"].max())
+                        covered.append((start, min(end, last + interval)))
+                except Exception as exception:
+                    # stop fetching but keep the chunks already in flight
+                    if error is None:
+                        error = exception
+                        for pending in futures:
+                            pending.cancel()
+        self.__rate_limiter = None
+
+        fetched = [frame for frame in fetched if not frame.empty]
+        if self.store is None:
+            frames = [existing_data] + fetched if not existing_data.empty else fetched
+            if frames:
+                existing_data = (
+                    pd.concat(frames, ignore_index=True)
+                    .sort_values("timestamp", kind="stable")
+                    .drop_duplicates(subset="timestamp")
+                    .reset_index(drop=True)
+                )
+            self.save_data(existing_data)
+        else:
+            # only the partitions receiving new candles are rewritten
+            if fetched:
+                self.save_data(pd.concat(fetched, ignore_index=True))
+            self.store.add_covered_ranges(covered)
+            existing_data = self.load_existing_data(since, until)
+        if error is not None:
+            raise error
         return existing_data
@@ -0,0 +1,132 @@
+from bisect import bisect_left, bisect_right
+from typing import List
+
+import numpy as np
+
+
+class _PriceLevels:
+    """
+    Resting orders of one side, kept sorted by price then by arrival.
+
+    Prices are stored as sort keys in a plain list so bisect can be used to
+    insert and to find price ranges. Descending sides store negated prices.
+    """
+
+    def __init__(self, descending: bool = False):
+        self._sign = -1.0 if descending else 1.0
+        self._keys: List[float] = []
+        self._rows: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row: int, price: float) -> None:
+        index = bisect_right(self._keys, self._sign * price)
+        self._keys.insert(index, self._sign * price)
+        self._rows.insert(index, row)
+
+    def remove(self, row: int, price: float) -> None:
+        key = self._sign * price
+        index = bisect_left(self._keys, key)
+        while index < len(self._keys) and self._keys[index] == key:
+            if self._rows[index] == row:
+                del self._keys[index]
+                del self._rows[index]
+                return
+            index += 1
+        raise KeyError(f"Order {row} is not resting at price {price}.")
+
+    def remove_many(self, rows: np.ndarray) -> None:
+        """
+        Remove several rows at once, keeping the order of the others.
+        """
+        kept = ~np.isin(np.array(self._rows, dtype=np.int64), rows)
+        self._keys = np.array(self._keys, dtype=np.float64)[kept].tolist()
+        self._rows = np.array(self._rows, dtype=np.int64)[kept].tolist()
+
+    def between(self, low: float, high: float) -> List[int]:
+        """
+        Get the rows resting at a price within [low, high], in book order.
+        """
+        if self._sign > 0:
+            start, end = bisect_left(self._keys, low), bisect_right(self._keys, high)
+        else:
+            start, end = bisect_left(self._keys, -high), bisect_right(self._keys, -low)
+        return self._rows[start:end]
+
+    def prices(self) -> np.ndarray:
+        """
+        Get the resting prices in book order.
+        """
+        return self._sign * np.array(self._keys, dtype=np.float64)
+
+    def rows(self) -> List[int]:
+        return list(self._rows)
+
+
+class RestingOrderBook:
+    """
+    The open orders of a single symbol sorted by price, bids descending and
+    asks ascending.
+
+    Finding the orders that a candle can fill is a binary search against the
+    candle's low and high, so the cost depends on the number of crossable
+    orders rather than on the number of resting orders.
+    """
+
+    def __init__(self):
+        self.bids = _PriceLevels(descending=True)
+        self.asks = _PriceLevels(descending=False)
+
+    def __len__(self) -> int:
+        return len(self.bids) + len(self.asks)
+
+    def __side(self, side: str) -> _PriceLevels:
+        return self.bids if side == "buy" else self.asks
+
+    def add(self, row: int, side: str, price: float) -> None:
+        """
+        Add a resting order to the book.
+
+        :param row: The row of the order in the order store.
+        :param side: The order side ("buy" or "sell").
+        :param price: The order price.
+        """
+        self.__side(side).add(row, price)
+
+    def remove(self, row: int, side: str, price: float) -> None:
+        """
+        Remove a resting order from the book.
+
+        :param row: The row of the order in the order store.
+        :param side: The order side ("buy" or "sell").
+        :param price: The order price.
+        :raises KeyError: If the order is not in the book.
+        """
+        self.__side(side).remove(row, price)
+
+    def remove_many(self, rows: np.ndarray) -> None:
+        """
+        Remove several resting orders from the book, filtering each side once.
+
+        :param rows: The rows of the orders in the order store.
+        """
+        self.bids.remove_many(rows)
+        self.asks.remove_many(rows)
+
+    def crossable(self, low: float, high: float) -> np.ndarray:
+        """
+        Get the orders whose price lies within a candle's [low, high] range.
+
+        :param low: The candle low.
+        :param high: The candle high.
+        :return: The rows of the crossable orders, bids first.
+        """
+        rows = self.bids.between(low, high) + self.asks.between(low, high)
+        return np.array(rows, dtype=np.int64)
+
+    def prices(self) -> np.ndarray:
+        """
+        Get every resting price of the book in ascending order.
+        """
+        return np.sort(np.concatenate([self.bids.prices(), self.asks.prices()]))
@@ -0,0 +1,702 @@
+from bisect import bisect_left, insort
+from collections.abc import Sequence
+from enum import Enum
+from typing import Dict, Iterator, List
+
+import numpy as np
+from ccxt.base.errors import BadRequest, OrderNotFound
+
+from .order_book import RestingOrderBook
+
+
+def _without(rows: List[int], removed: np.ndarray) -> List[int]:
+    """
+    Remove sorted rows from a sorted row list.
+    """
+    kept = np.setdiff1d(np.array(rows, dtype=np.int64), removed, assume_unique=True)
+    return kept.tolist()
+
+
+def _merged(rows: List[int], added: np.ndarray) -> List[int]:
+    """
+    Insert sorted rows into a sorted row list.
+    """
+    rows = np.array(rows, dtype=np.int64)
+    return np.insert(rows, np.searchsorted(rows, added), added).tolist()
+
+
+class OrderStatus(Enum):
+    FILLED = "filled"
+    PARTIALLY_FILLED = "partially_filled"
+    CANCELED = "canceled"
+    OPEN = "open"
+    REJECTED = "rejected"
+
+
+class OrderStore:
+    """
+    Append-only columnar storage for backtester orders.
+
+    Orders are stored row by row in growable typed NumPy columns. Symbols,
+    types, sides and statuses are dictionary encoded, and the order id is the
+    row number, so looking an order up by id is O(1). Rows are additionally
+    indexed by status and symbol to find open orders without scanning history,
+    and open orders are kept in a price-sorted RestingOrderBook per symbol.
+
+    Orders are appended in clock order, so as long as no order is placed
+    before an earlier one, sorting rows by id sorts them by timestamp and time
+    ranges of the indexes are found by binary search.
+    """
+
+    COLUMNS = (
+        "datetime",
+        "timestamp",
+        "lastTradeTimestamp",
+        "symbol",
+        "type",
+        "side",
+        "price",
+        "amount",
+        "status",
+        "fee",
+        "params",
+    )
+    TYPES = ("limit", "market")
+    SIDES = ("buy", "sell")
+    STATUSES = tuple(status.value for status in OrderStatus)
+    TYPE_CODES = {type: code for code, type in enumerate(TYPES)}
+    SIDE_CODES = {side: code for code, side in enumerate(SIDES)}
+    STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+    MISSING_TIMESTAMP = np.iinfo(np.int64).min
+    # batches of at least this many rows change status with array operations
+    # over the indexes, smaller ones row by row
+    BULK_MOVE_ROWS = 64
+    ORDER_KEYS = ("id",) + COLUMNS
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty order store.
+
+        :param capacity: Number of rows to preallocate.
+        """
+        capacity = max(capacity, 1)
+        self._size = 0
+        self._timestamp = np.empty(capacity, dtype=np.int64)
+        self._last_trade_timestamp = np.empty(capacity, dtype=np.int64)
+        self._symbol = np.empty(capacity, dtype=np.int32)
+        self._type = np.empty(capacity, dtype=np.int8)
+        self._side = np.empty(capacity, dtype=np.int8)
+        self._status = np.empty(capacity, dtype=np.int8)
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._amount = np.empty(capacity, dtype=np.float64)
+        self._fee_cost = np.empty(capacity, dtype=np.float64)
+        self._fee_rate = np.empty(capacity, dtype=np.float64)
+        self._datetime: List[str] = []
+        self._params: List[dict] = []
+
+        self._symbols: List[str] = []
+        self._symbol_codes: Dict[str, int] = {}
+        # status -> symbol -> rows, sorted lists kept in id order
+        self._index: Dict[str, Dict[str, List[int]]] = {
+            status: {} for status in self.STATUSES
+        }
+        self._by_symbol: Dict[str, List[int]] = {}
+        # status -> rows of every symbol, sorted lists kept in id order
+        self._by_status: Dict[str, List[int]] = {status: [] for status in self.STATUSES}
+        self._books: Dict[str, RestingOrderBook] = {}
+        # whether timestamps never decrease with the row
+        self._time_ordered = True
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __grow(self):
+        """
+        Double the capacity of every typed column.
+        """
+        for name in (
+            "_timestamp",
+            "_last_trade_timestamp",
+            "_symbol",
+            "_type",
+            "_side",
+            "_status",
+            "_price",
+            "_amount",
+            "_fee_cost",
+            "_fee_rate",
+        ):
+            column = getattr(self, name)
+            grown = np.empty(2 * len(column), dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+
+    def __symbol_code(self, symbol: str) -> int:
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            code = len(self._symbols)
+            self._symbols.append(symbol)
+            self._symbol_codes[symbol] = code
+            self._by_symbol[symbol] = []
+            self._books[symbol] = RestingOrderBook()
+        return code
+
+    def append(
+        self,
+        datetime: str,
+        timestamp: int,
+        symbol: str,
+        type: str,
+        side: str,
+        price: float,
+        amount: float,
+        fee_cost: float,
+        fee_rate: float,
+        params: dict = None,
+    ) -> int:
+        """
+        Append a new open order.
+
+        :return: The id of the new order.
+        """
+        row = self._size
+        if row == len(self._timestamp):
+            self.__grow()
+        self.__check_time_order(timestamp)
+
+        status = OrderStatus.OPEN.value
+        self._timestamp[row] = timestamp
+        self._last_trade_timestamp[row] = self.MISSING_TIMESTAMP
+        self._symbol[row] = self.__symbol_code(symbol)
+        self._type[row] = self.TYPE_CODES[type]
+        self._side[row] = self.SIDE_CODES[side]
+        self._status[row] = self.STATUS_CODES[status]
+        self._price[row] = price
+        self._amount[row] = amount
+        self._fee_cost[row] = fee_cost
+        self._fee_rate[row] = fee_rate
+        self._datetime.append(datetime)
+        self._params.append(params)
+        self._size += 1
+
+        self._index[status].setdefault(symbol, []).append(row)
+        self._by_status[status].append(row)
+        self._by_symbol[symbol].append(row)
+        self._books[symbol].add(row, side, price)
+        return row
+
+    def extend(
+        self,
+        datetime: str,
+        timestamp: int,
+        symbols: List[str],
+        types: List[str],
+        sides: List[str],
+        prices: np.ndarray,
+        amounts: np.ndarray,
+        fee_costs: np.ndarray,
+        fee_rate: float,
+        params: List[dict],
+    ) -> np.ndarray:
+        """
+        Append several new open orders placed at the same time, writing every
+        typed column with one slice assignment.
+
+        :return: The ids of the new orders.
+        """
+        start = self._size
+        end = start + len(symbols)
+        while end > len(self._timestamp):
+            self.__grow()
+        if end > start:
+            self.__check_time_order(timestamp)
+
+        status = OrderStatus.OPEN.value
+        self._timestamp[start:end] = timestamp
+        self._last_trade_timestamp[start:end] = self.MISSING_TIMESTAMP
+        self._symbol[start:end] = [self.__symbol_code(symbol) for symbol in symbols]
+        self._type[start:end] = [self.TYPE_CODES[type] for type in types]
+        self._side[start:end] = [self.SIDE_CODES[side] for side in sides]
+        self._status[start:end] = self.STATUS_CODES[status]
+        self._price[start:end] = prices
+        self._amount[start:end] = amounts
+        self._fee_cost[start:end] = fee_costs
+        self._fee_rate[start:end] = fee_rate
+        self._datetime.extend([datetime] * len(symbols))
+        self._params.extend(params)
+        self._size = end
+
+        rows = np.arange(start, end)
+        index = self._index[status]
+        self._by_status[status].extend(rows.tolist())
+        for row, symbol, side, price in zip(
+            rows.tolist(), symbols, sides, np.asarray(prices).tolist()
+        ):
+            index.setdefault(symbol, []).append(row)
+            self._by_symbol[symbol].append(row)
+            self._books[symbol].add(row, side, price)
+        return rows
+
+    @property
+    def time_ordered(self) -> bool:
+        """
+        Whether every order was placed at or after the previous one.
+        """
+        return self._time_ordered
+
+    def __check_time_order(self, timestamp: int) -> None:
+        if self._size and timestamp < self._timestamp[self._size - 1]:
+            self._time_ordered = False
+
+    def row(self, id) -> int:
+        """
+        Resolve an order id to its row.
+
+        :param id: The id of the order.
+        :return: The row of the order.
+        :raises OrderNotFound: If no order has this id.
+        """
+        if (
+            isinstance(id, (int, np.integer))
+            and not isinstance(id, bool)
+            and 0 <= id < self._size
+        ):
+            return int(id)
+        raise OrderNotFound(f"Order with id '{id}' not found.")
+
+    def symbol(self, row: int) -> str:
+        return self._symbols[self._symbol[row]]
+
+    def side(self, row: int) -> str:
+        return self.SIDES[self._side[row]]
+
+    def status(self, row: int) -> str:
+        return self.STATUSES[self._status[row]]
+
+    def price(self, row: int) -> float:
+        return float(self._price[row])
+
+    def amount(self, row: int) -> float:
+        return float(self._amount[row])
+
+    def fee_cost(self, row: int) -> float:
+        return float(self._fee_cost[row])
+
+    def prices(self, rows: np.ndarray) -> np.ndarray:
+        return self._price[rows]
+
+    def amounts(self, rows: np.ndarray) -> np.ndarray:
+        return self._amount[rows]
+
+    def fee_costs(self, rows: np.ndarray) -> np.ndarray:
+        return self._fee_cost[rows]
+
+    def is_buy(self, rows: np.ndarray) -> np.ndarray:
+        return self._side[rows] == self.SIDE_CODES["buy"]
+
+    def group_by_symbol(self, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Split rows by the symbol of their order.
+
+        :param rows: The rows to split.
+        :return: The rows of every symbol, in their original order.
+        """
+        codes = self._symbol[rows]
+        return {
+            self._symbols[code]: rows[codes == code]
+            for code in np.unique(codes).tolist()
+        }
+
+    def __move(self, row: int, status: str) -> None:
+        """
+        Move a row between the status indexes, keeping the book in sync.
+        """
+        symbol = self.symbol(row)
+        previous = self.status(row)
+        if previous == status:
+            return
+        for rows in (self._index[previous][symbol], self._by_status[previous]):
+            del rows[bisect_left(rows, row)]
+        insort(self._index[status].setdefault(symbol, []), row)
+        insort(self._by_status[status], row)
+        if previous == OrderStatus.OPEN.value:
+            self._books[symbol].remove(row, self.side(row), self.price(row))
+        elif status == OrderStatus.OPEN.value:
+            self._books[symbol].add(row, self.side(row), self.price(row))
+
+    def book(self, symbol: str) -> RestingOrderBook:
+        """
+        Get the book of open orders of a symbol.
+
+        :param symbol: The trading pair symbol.
+        :return: The resting order book, empty if the symbol has no orders.
+        """
+        return self._books.get(symbol) or RestingOrderBook()
+
+    def crossable(self, symbol: str, low: float, high: float) -> np.ndarray:
+        """
+        Get the open orders of a symbol priced within [low, high].
+
+        :param symbol: The trading pair symbol.
+        :param low: The candle low.
+        :param high: The candle high.
+        :return: The rows of the crossable orders.
+        """
+        return self.book(symbol).crossable(low, high)
+
+    def set_status(self, row: int, status: str, last_trade_timestamp: int) -> None:
+        """
+        Move an order to a new status and stamp its last trade timestamp.
+
+        :param row: The row of the order.
+        :param status: The new status of the order.
+        :param last_trade_timestamp: Timestamp in milliseconds of the change.
+        """
+        self.__move(row, status)
+        self._status[row] = self.STATUS_CODES[status]
+        self._last_trade_timestamp[row] = last_trade_timestamp
+
+    def set_statuses(
+        self, rows: np.ndarray, status: str, last_trade_timestamp: int
+    ) -> None:
+        """
+        Move several orders to a new status at once.
+
+        Large batches rebuild every affected index list with one set
+        difference and one sorted insert, and filter each affected book once,
+        instead of moving the rows one by one.
+
+        :param rows: The rows of the orders.
+        :param status: The new status of the orders.
+        :param last_trade_timestamp: Timestamp in milliseconds of the change.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) >= self.BULK_MOVE_ROWS:
+            self.__move_all(np.unique(rows), status)
+        else:
+            for row in rows.tolist():
+                self.__move(row, status)
+        self._status[rows] = self.STATUS_CODES[status]
+        self._last_trade_timestamp[rows] = last_trade_timestamp
+
+    def __move_all(self, rows: np.ndarray, status: str) -> None:
+        """
+        Move sorted unique rows between the status indexes, keeping the books
+        in sync.
+        """
+        previous = self._status[rows]
+        moving = previous != self.STATUS_CODES[status]
+        rows, previous = rows[moving], previous[moving]
+        if len(rows) == 0:
+            return
+
+        for code in np.unique(previous).tolist():
+            name = self.STATUSES[code]
+            leaving = rows[previous == code]
+            self._by_status[name] = _without(self._by_status[name], leaving)
+            index = self._index[name]
+            for symbol, symbol_rows in self.group_by_symbol(leaving).items():
+                index[symbol] = _without(index[symbol], symbol_rows)
+                if name == OrderStatus.OPEN.value:
+                    self._books[symbol].remove_many(symbol_rows)
+
+        self._by_status[status] = _merged(self._by_status[status], rows)
+        index = self._index[status]
+        for symbol, symbol_rows in self.group_by_symbol(rows).items():
+            index[symbol] = _merged(index.get(symbol, []), symbol_rows)
+            if status == OrderStatus.OPEN.value:
+                for row in symbol_rows.tolist():
+                    self._books[symbol].add(row, self.side(row), self.price(row))
+
+    def symbols(self, status: str = None) -> List[str]:
+        """
+        List the symbols that have orders, optionally only with a given status.
+
+        :param status: Only return symbols having orders with this status.
+        :return: A list of symbols.
+        """
+        if status is None:
+            return list(self._symbols)
+        return [symbol for symbol, rows in self._index.get(status, {}).items() if rows]
+
+    def rows(self, symbol: str = None, status: str = None) -> np.ndarray:
+        """
+        Get the rows of orders matching a symbol and/or status, in id order.
+
+        :param symbol: Only return orders for this symbol.
+        :param status: Only return orders with this status.
+        :return: A NumPy array of rows.
+        """
+        if status is None and symbol is None:
+            return np.arange(self._size)
+        if status is None:
+            return np.array(self._by_symbol.get(symbol, []), dtype=np.int64)
+
+        if symbol is None:
+            return np.array(self._by_status.get(status, []), dtype=np.int64)
+        return np.array(self._index.get(status, {}).get(symbol, []), dtype=np.int64)
+
+    def latest(
+        self,
+        symbol: str = None,
+        status: str = None,
+        since: int = None,
+        until: int = None,
+        limit: int = None,
+    ) -> np.ndarray:
+        """
+        Get the rows of orders matching a symbol and/or status placed within
+        [since, until), newest first, ties broken by the highest id.
+
+        While the orders are in time order the time range is two binary
+        searches and the limit a slice, so the cost does not depend on the
+        number of orders outside of the result. Otherwise the rows are
+        filtered and sorted by timestamp.
+
+        :param symbol: Only return orders for this symbol.
+        :param status: Only return orders with this status.
+        :param since: Only return orders placed at or after this timestamp.
+        :param until: Only return orders placed before this timestamp.
+        :param limit: The maximum number of rows to return.
+        :return: A NumPy array of rows.
+        """
+        if not self._time_ordered:
+            rows = self.rows(symbol, status)
+            if since is not None:
+                rows = rows[self._timestamp[rows] >= since]
+            if until is not None:
+                rows = rows[self._timestamp[rows] < until]
+            rows = rows[::-1]
+            rows = rows[np.argsort(-self._timestamp[rows], kind="stable")]
+            return rows if limit is None else rows[:limit]
+
+        # the rows placed within the range form the id range [first, last)
+        size = self._size
+        timestamps = self._timestamp[:size]
+        first = 0 if since is None else int(np.searchsorted(timestamps, since))
+        last = size if until is None else int(np.searchsorted(timestamps, until))
+
+        if status is None and symbol is None:
+            if limit is not None:
+                first = max(first, last - limit)
+            return np.arange(first, max(first, last), dtype=np.int64)[::-1]
+        if symbol is None:
+            index = self._by_status.get(status, [])
+        elif status is None:
+            index = self._by_symbol.get(symbol, [])
+        else:
+            index = self._index.get(status, {}).get(symbol, [])
+        start, end = bisect_left(index, first), bisect_left(index, last)
+        if limit is not None:
+            start = max(start, end - limit)
+        return np.array(index[start:end], dtype=np.int64)[::-1]
+
+    def timestamps(self, rows: np.ndarray) -> np.ndarray:
+        return self._timestamp[rows]
+
+    def filter(self, rows: np.ndarray, column: str, value) -> np.ndarray:
+        """
+        Keep the rows whose column equals a value.
+
+        :param rows: The candidate rows.
+        :param column: The column to compare ('id' or one of COLUMNS).
+        :param value: The value to compare against.
+        :return: The matching rows.
+        :raises BadRequest: If the column does not exist.
+        """
+        if column == "id":
+            try:
+                return rows[rows == self.row(value)]
+            except OrderNotFound:
+                return rows[:0]
+
+        encoded = {
+            "symbol": (self._symbol, self._symbol_codes),
+            "type": (self._type, self.TYPE_CODES),
+            "side": (self._side, self.SIDE_CODES),
+            "status": (self._status, self.STATUS_CODES),
+        }
+        numeric = {
+            "timestamp": self._timestamp,
+            "price": self._price,
+            "amount": self._amount,
+        }
+        if column in encoded:
+            codes, lookup = encoded[column]
+            if value not in lookup:
+                return rows[:0]
+            return rows[codes[rows] == lookup[value]]
+        if column in numeric:
+            return rows[numeric[column][rows] == value]
+        if column in self.COLUMNS:
+            return np.array(
+                [row for row in rows if self.field(row, column) == value],
+                dtype=np.int64,
+            )
+        raise BadRequest(f"Invalid column '{column}' in params.")
+
+    def field(self, row: int, key: str):
+        """
+        Get one value of the ccxt-shaped dictionary of an order.
+
+        :param row: The row of the order.
+        :param key: The key of the value, one of ORDER_KEYS.
+        :return: The value.
+        :raises KeyError: If the key is not an order key.
+        """
+        if key == "id":
+            return int(row)
+        if key == "datetime":
+            return self._datetime[row]
+        if key == "timestamp":
+            return int(self._timestamp[row])
+        if key == "lastTradeTimestamp":
+            return self.last_trade_timestamp(self._last_trade_timestamp[row])
+        if key == "symbol":
+            return self.symbol(row)
+        if key == "type":
+            return self.TYPES[self._type[row]]
+        if key == "side":
+            return self.side(row)
+        if key == "price":
+            return self.price(row)
+        if key == "amount":
+            return self.amount(row)
+        if key == "status":
+            return self.status(row)
+        if key == "fee":
+            return {
+                "currency": self.symbol(row).split("/")[1],
+                "cost": float(self._fee_cost[row]),
+                "rate": float(self._fee_rate[row]),
+            }
+        if key == "params":
+            return self._params[row]
+        raise KeyError(key)
+
+    @classmethod
+    def last_trade_timestamp(cls, value: int):
+        value = int(value)
+        return None if value == cls.MISSING_TIMESTAMP else value
+
+    def to_dict(self, row: int) -> dict:
+        """
+        Materialize an order as a ccxt-shaped dictionary.
+
+        :param row: The row of the order.
+        :return: The order as a dictionary.
+        """
+        return {key: self.field(row, key) for key in self.ORDER_KEYS}
+
+    def views(self, rows: np.ndarray) -> "OrderList":
+        """
+        Get orders as a list materialized on demand, as of now.
+
+        :param rows: The rows of the orders.
+        :return: A sequence of order dictionaries.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        return OrderList(
+            self, rows, self._status[rows], self._last_trade_timestamp[rows]
+        )
+
+
+class OrderList(Sequence):
+    """
+    A sequence of ccxt-shaped order dictionaries, each built from the columns
+    of an OrderStore the first time it is accessed.
+
+    Only the rows of the orders and a snapshot of their status and last trade
+    timestamp are held, so taking len() or the ids of a large list costs no
+    dictionary. The dictionaries hold the status of the orders when the list
+    was taken, and are kept once built, so changes made to them stick. The
+    list is not a builtin list: use list(orders) or to_list() where one is
+    needed, e.g. for json.dumps.
+    """
+
+    __slots__ = ("_store", "_rows", "_statuses", "_last_trade_timestamps", "_orders")
+
+    def __init__(
+        self,
+        store: OrderStore,
+        rows: np.ndarray,
+        statuses: np.ndarray,
+        last_trade_timestamps: np.ndarray,
+        orders: List[dict] = None,
+    ):
+        self._store = store
+        self._rows = rows
+        self._statuses = statuses
+        self._last_trade_timestamps = last_trade_timestamps
+        self._orders = [None] * len(rows) if orders is None else orders
+
+    def __order(self, index: int) -> dict:
+        order = self._orders[index]
+        if order is None:
+            order = self._store.to_dict(int(self._rows[index]))
+            order["status"] = self._store.STATUSES[self._statuses[index]]
+            order["lastTradeTimestamp"] = self._store.last_trade_timestamp(
+                self._last_trade_timestamps[index]
+            )
+            self._orders[index] = order
+        return order
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OrderList(
+                self._store,
+                self._rows[index],
+                self._statuses[index],
+                self._last_trade_timestamps[index],
+                self._orders[index],
+            )
+        if not -len(self) <= index < len(self):
+            raise IndexError("order index out of range")
+        return self.__order(index % len(self))
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(len(self)):
+            yield self.__order(index)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (OrderList, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            order == other_order for order, other_order in zip(self, other)
+        )
+
+    def __add__(self, other) -> List[dict]:
+        if not isinstance(other, (OrderList, list)):
+            return NotImplemented
+        return self.to_list() + list(other)
+
+    def __radd__(self, other) -> List[dict]:
+        if not isinstance(other, list):
+            return NotImplemented
+        return other + self.to_list()
+
+    def __reduce__(self):
+        # pickles as a plain list rather than with the whole order store
+        return list, (self.to_list(),)
+
+    def __repr__(self) -> str:
+        return repr(self.to_list())
+
+    @property
+    def ids(self) -> List[int]:
+        """
+        The ids of the orders, read without building any dictionary.
+        """
+        return self._rows.tolist()
+
+    def copy(self) -> List[dict]:
+        return self.to_list()
+
+    def to_list(self) -> List[dict]:
+        """
+        Materialize the orders as a list of dictionaries.
+        """
+        return list(self)
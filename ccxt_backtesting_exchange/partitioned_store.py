@@ -0,0 +1,216 @@
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .storage import (
+    OHLCV_COLUMNS,
+    _atomic_open,
+    load_ohlcv_npy,
+    save_ohlcv_npy,
+)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def month_bounds(key: str) -> Tuple[int, int]:
+    """
+    Get the time range of a monthly partition.
+
+    :param key: The partition key, e.g. '2024-12'.
+    :return: The start and end timestamps in milliseconds, end excluded.
+    """
+    month = np.datetime64(key, "M")
+    start, end = np.array([month, month + 1]).astype("datetime64[ms]").astype(np.int64)
+    return int(start), int(end)
+
+
+def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge overlapping or touching time ranges.
+
+    :param ranges: (start, end) ranges in milliseconds, end excluded.
+    :return: The merged ranges, sorted by start.
+    """
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class PartitionedStore:
+    """
+    The ohlcv history of one symbol and timeframe, stored as one .npy file per
+    month next to a small JSON manifest.
+
+    The manifest lists the partitions and the time ranges that have been
+    synced, including gaps between candles the exchange had no candles for,
+    so writes only touch the partitions receiving new rows and readers only
+    open the partitions overlapping the window they need.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Open a store, creating its directory if needed.
+
+        :param directory: The directory holding the partitions and manifest.
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self._manifest = self.__load_manifest()
+
+    @staticmethod
+    def is_store(path: str) -> bool:
+        """
+        Check whether a path is the directory of a partitioned store.
+        """
+        return os.path.isfile(os.path.join(path, MANIFEST_NAME))
+
+    def __load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, "r") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            return {"version": MANIFEST_VERSION, "partitions": {}, "ranges": []}
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported manifest version in {self.manifest_path}: "
+                f"{manifest.get('version')}."
+            )
+        return manifest
+
+    def __save_manifest(self) -> None:
+        with _atomic_open(self.manifest_path, "w") as file:
+            json.dump(self._manifest, file, indent=1)
+
+    def partition_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npy")
+
+    @property
+    def partitions(self) -> Dict[str, dict]:
+        """
+        The manifest entry of every partition: its row count and first and
+        last timestamps, keyed by month.
+        """
+        return self._manifest["partitions"]
+
+    @property
+    def covered_ranges(self) -> List[Tuple[int, int]]:
+        """
+        The synced (start, end) time ranges in milliseconds, end excluded.
+        """
+        return [tuple(time_range) for time_range in self._manifest["ranges"]]
+
+    def add_covered_ranges(self, ranges: List[Tuple[int, int]]) -> None:
+        """
+        Record time ranges as synced.
+
+        :param ranges: (start, end) ranges in milliseconds, end excluded.
+        """
+        ranges = [(int(start), int(end)) for start, end in ranges]
+        ranges = merge_ranges(self.covered_ranges + ranges)
+        self._manifest["ranges"] = [list(time_range) for time_range in ranges]
+        self.__save_manifest()
+
+    def missing_ranges(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """
+        Get the parts of a time range that have not been synced.
+
+        :param start: The start of the range in milliseconds.
+        :param end: The end of the range in milliseconds, excluded.
+        :return: The (start, end) ranges not covered, end excluded.
+        """
+        missing = []
+        for covered_start, covered_end in self.covered_ranges:
+            if covered_start >= end:
+                break
+            if covered_end <= start:
+                continue
+            if covered_start > start:
+                missing.append((start, covered_start))
+            start = covered_end
+        if start < end:
+            missing.append((start, end))
+        return missing
+
+    def write(self, data: np.ndarray) -> List[str]:
+        """
+        Merge new candles into the store, rewriting only the partitions they
+        fall in. Candles already stored are replaced by the new ones.
+
+        :param data: A (n, 6) array of ohlcvs.
+        :return: The keys of the partitions written.
+        """
+        data = np.asarray(data, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+        if len(data) == 0:
+            return []
+
+        months = data[:, 0].astype("datetime64[ms]").astype("datetime64[M]")
+        keys = []
+        for month in np.unique(months):
+            key = str(month)
+            rows = data[months == month]
+            if key in self.partitions:
+                rows = np.concatenate([rows, self.read_partition(key)])
+            # keep the first occurrence of each timestamp, i.e. the new candle
+            _, first = np.unique(rows[:, 0], return_index=True)
+            rows = rows[first]
+
+            save_ohlcv_npy(rows, self.partition_path(key))
+            self.partitions[key] = {
+                "rows": len(rows),
+                "first": int(rows[0, 0]),
+                "last": int(rows[-1, 0]),
+            }
+            keys.append(key)
+
+        self._manifest["partitions"] = dict(sorted(self.partitions.items()))
+        self.__save_manifest()
+        return keys
+
+    def read_partition(self, key: str) -> np.ndarray:
+        """
+        Open one partition, memory-mapped.
+
+        :param key: The partition key, e.g. '2024-12'.
+        :return: A read-only (n, 6) array of ohlcvs.
+        """
+        return load_ohlcv_npy(self.partition_path(key))
+
+    def read(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        lookback: int = 0,
+    ) -> np.ndarray:
+        """
+        Read the partitions overlapping a time range. Whole partitions are
+        returned, so candles outside the range may be included.
+
+        :param start: The start of the range in milliseconds, unbounded if None.
+        :param end: The end of the range in milliseconds, unbounded if None.
+        :param lookback: How many stored partitions before the range to read
+            too, for history preceding the start.
+        :return: A (n, 6) array of ohlcvs sorted by timestamp.
+        """
+        keys = list(self.partitions)
+        if start is not None:
+            # partitions are sorted, count those ending before the start
+            first = sum(month_bounds(key)[1] <= start for key in keys)
+            first = max(0, first - lookback)
+            keys = keys[first:]
+        if end is not None:
+            keys = [key for key in keys if month_bounds(key)[0] <= end]
+        if not keys:
+            return np.empty((0, len(OHLCV_COLUMNS)), dtype=np.float64, order="F")
+        if len(keys) == 1:
+            return self.read_partition(keys[0])
+        return np.asfortranarray(
+            np.concatenate([self.read_partition(key) for key in keys])
+        )
@@ -0,0 +1,92 @@
+from typing import Optional
+
+import numpy as np
+
+
+class CandleRangeIndex:
+    """
+    Finds the next candle whose [low, high] range contains any of a set of
+    prices without visiting the candles in between one by one.
+
+    Candles are grouped into fixed-size blocks and a sparse table holds the
+    minimum low and maximum high of every power-of-two run of blocks. Runs of
+    blocks that cannot contain any price are skipped by binary lifting in
+    O(log n), and the candidate block is then checked candle by candle with
+    a vectorized binary search.
+    """
+
+    def __init__(self, lows: np.ndarray, highs: np.ndarray, block_size: int = 256):
+        """
+        Build the index.
+
+        :param lows: The low of every candle.
+        :param highs: The high of every candle.
+        :param block_size: The number of candles per block.
+        """
+        self.block_size = block_size
+        self._lows = np.ascontiguousarray(lows, dtype=np.float64)
+        self._highs = np.ascontiguousarray(highs, dtype=np.float64)
+
+        blocks = -(-len(lows) // block_size)
+        padding = blocks * block_size - len(lows)
+        lows = np.append(self._lows, np.full(padding, np.inf))
+        highs = np.append(self._highs, np.full(padding, -np.inf))
+        self._min_lows = [lows.reshape(-1, block_size).min(axis=1)]
+        self._max_highs = [highs.reshape(-1, block_size).max(axis=1)]
+
+        # level k covers runs of 2**k blocks starting at each block
+        width = 1
+        while 2 * width <= blocks:
+            min_lows, max_highs = self._min_lows[-1], self._max_highs[-1]
+            self._min_lows.append(np.minimum(min_lows[:-width], min_lows[width:]))
+            self._max_highs.append(np.maximum(max_highs[:-width], max_highs[width:]))
+            width *= 2
+
+    def __len__(self) -> int:
+        return len(self._lows)
+
+    @staticmethod
+    def _crosses(prices: np.ndarray, lows, highs):
+        """
+        Check which ranges [low, high] contain at least one of the prices.
+
+        :param prices: The prices, sorted ascending.
+        """
+        index = np.searchsorted(prices, lows)
+        found = index < len(prices)
+        return found & (prices[np.minimum(index, len(prices) - 1)] <= highs)
+
+    def next_crossing(self, start: int, prices: np.ndarray) -> Optional[int]:
+        """
+        Find the first candle at or after start whose range contains a price.
+
+        :param start: The index of the first candle to consider.
+        :param prices: The prices, sorted ascending.
+        :return: The index of the candle, or None if no candle qualifies.
+        """
+        if len(prices) == 0:
+            return None
+
+        blocks = len(self._min_lows[0])
+        index = max(start, 0)
+        while index < len(self._lows):
+            # check the rest of the current block candle by candle
+            block = index // self.block_size
+            end = min((block + 1) * self.block_size, len(self._lows))
+            hits = self._crosses(prices, self._lows[index:end], self._highs[index:end])
+            if hits.any():
+                return index + int(np.argmax(hits))
+
+            # skip following runs of blocks whose range misses every price
+            block += 1
+            for level in range(len(self._min_lows) - 1, -1, -1):
+                if block + (1 << level) > blocks:
+                    continue
+                if not self._crosses(
+                    prices,
+                    self._min_lows[level][block],
+                    self._max_highs[level][block],
+                ):
+                    block += 1 << level
+            index = block * self.block_size
+        return None
@@ -0,0 +1,102 @@
+import threading
+import time
+from typing import Callable, Optional, Tuple, Type, TypeVar
+
+import ccxt
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket limiting how often requests are sent.
+
+    Tokens are added at a steady rate up to the capacity of the bucket, and
+    every request takes one, waiting for it if the bucket is empty. The
+    capacity is the burst of requests allowed at once.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        :param rate: Tokens added per second.
+        :param capacity: Maximum number of tokens in the bucket, which starts full.
+        :param clock: Monotonic time source in seconds.
+        :param sleep: Function used to wait for tokens.
+        :raises ValueError: If the rate or capacity is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive.")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_exchange(
+        cls, exchange: ccxt.Exchange, capacity: float = 1
+    ) -> Optional["TokenBucket"]:
+        """
+        Build a bucket following a ccxt exchange's rateLimit, the minimum
+        delay between requests in milliseconds.
+
+        :param exchange: The exchange.
+        :param capacity: The burst of requests allowed at once.
+        :return: The bucket, or None if the exchange has rate limiting disabled.
+        """
+        rate_limit = getattr(exchange, "rateLimit", 0) or 0
+        if not getattr(exchange, "enableRateLimit", False) or rate_limit <= 0:
+            return None
+        return cls(1000 / rate_limit, capacity)
+
+    def acquire(self) -> None:
+        """
+        Take a token, waiting until one is available.
+        """
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+def retry(
+    call: Callable[[], T],
+    retries: int = 3,
+    backoff: float = 1.0,
+    errors: Tuple[Type[Exception], ...] = (ccxt.NetworkError,),
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """
+    Call a function, retrying with exponential backoff on transient errors.
+
+    :param call: The function to call.
+    :param retries: How many times to retry after the first attempt.
+    :param backoff: Delay in seconds before the first retry, doubled each time.
+    :param errors: The exception types worth retrying. The default covers
+        ccxt's network errors, rate limit and timeout errors included.
+    :param sleep: Function used to wait between attempts.
+    :return: The result of the call.
+    :raises Exception: The last error once every attempt failed.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return call()
+        except errors:
+            if attempt == retries:
+                raise
+            sleep(backoff * 2**attempt)
@@ -0,0 +1,139 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+import numpy as np
+
+
+class ResampleCache:
+    """
+    A thread-safe LRU cache of resampled ohlcv arrays with a byte budget.
+
+    One cache is shared by every DataFeed by default. Entries are keyed by the
+    feed's content fingerprint and the target timeframe, so two feeds loaded
+    from identical data share their resampled arrays. Cached arrays are made
+    read-only because they are handed out to every feed that asks for them.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, max_entries: int = None):
+        """
+        Initialize an empty cache.
+
+        :param max_bytes: Total size in bytes the cached arrays may occupy.
+        :param max_entries: Maximum number of cached arrays, unbounded if None.
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """
+        Look up an entry, marking it as most recently used.
+
+        :param key: The cache key.
+        :return: The cached array, or None on a miss.
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: Hashable, data: np.ndarray) -> np.ndarray:
+        """
+        Store an entry, evicting least recently used entries to stay in budget.
+        Arrays larger than the whole budget are returned without being cached.
+
+        :param key: The cache key.
+        :param data: The array to cache.
+        :return: The cached, read-only array.
+        """
+        data.flags.writeable = False
+        if data.nbytes > self.max_bytes:
+            return data
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self._entries[key] = data
+            self.nbytes += data.nbytes
+            self.__evict()
+        return data
+
+    def get_or_compute(
+        self, key: Hashable, compute: Callable[[], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Look up an entry, computing and storing it on a miss.
+
+        :param key: The cache key.
+        :param compute: Callable producing the array on a miss.
+        :return: The cached or freshly computed array.
+        """
+        data = self.get(key)
+        if data is None:
+            data = self.put(key, compute())
+        return data
+
+    def resize(self, max_bytes: int = None, max_entries: int = None) -> None:
+        """
+        Change the budget of the cache, evicting entries if needed.
+        """
+        with self._lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if max_entries is not None:
+                self.max_entries = max_entries
+            self.__evict()
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        :return: A dictionary of hits, misses, evictions, entries and bytes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __evict(self) -> None:
+        while self._entries and (
+            self.nbytes > self.max_bytes
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+
+
+# cache shared by every DataFeed that is not given its own
+default_resample_cache = ResampleCache()
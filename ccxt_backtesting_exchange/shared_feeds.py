@@ -0,0 +1,176 @@
+import multiprocessing
+import secrets
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Iterable, Set, Tuple
+
+import numpy as np
+
+from .data_feed import DataFeed
+from .resample_cache import ResampleCache, default_resample_cache
+from .utils import timeframe_to_timedelta
+
+# shared memory blocks attached by this process, kept open for the lifetime
+# of the arrays viewing them
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+# names of the blocks created by this process
+_created: Set[str] = set()
+
+
+def _attach_block(name: str) -> shared_memory.SharedMemory:
+    block = _attached.get(name)
+    if block is not None:
+        return block
+    try:
+        block = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # before Python 3.13 attaching registers the block with the resource
+        # tracker. Processes started by multiprocessing share the tracker of
+        # the process that created the block, but any other process has its
+        # own tracker, which would unlink the block when the process exits.
+        block = shared_memory.SharedMemory(name=name)
+        if name not in _created and multiprocessing.parent_process() is None:
+            resource_tracker.unregister(block._name, "shared_memory")
+    _attached[name] = block
+    return block
+
+
+class SharedArray:
+    """
+    A picklable handle to a float64 array published in shared memory.
+    """
+
+    def __init__(self, name: str, shape: Tuple[int, ...]):
+        """
+        :param name: The name of the shared memory block.
+        :param shape: The shape of the array.
+        """
+        self.name = name
+        self.shape = tuple(shape)
+
+    def attach(self) -> np.ndarray:
+        """
+        Map the array into this process without copying it.
+
+        :return: A read-only, column-major view of the shared array.
+        :raises FileNotFoundError: If the block no longer exists.
+        """
+        if 0 in self.shape:
+            return np.empty(self.shape, dtype=np.float64, order="F")
+        block = _attach_block(self.name)
+        data = np.ndarray(self.shape, dtype=np.float64, buffer=block.buf, order="F")
+        data.flags.writeable = False
+        return data
+
+
+class SharedFeed:
+    """
+    A picklable handle to a DataFeed published by a SharedFeedStore, along
+    with any resampled timeframes published with it.
+    """
+
+    def __init__(
+        self,
+        timeframe: str,
+        data: SharedArray,
+        fingerprint: str,
+        resampled: Dict[str, SharedArray],
+    ):
+        self.timeframe = timeframe
+        self.data = data
+        self.fingerprint = fingerprint
+        self.resampled = resampled
+
+    def attach(self, resample_cache: ResampleCache = None) -> DataFeed:
+        """
+        Build a DataFeed reading the shared arrays in place.
+
+        The resampled arrays are stored in the resample cache, so the feed and
+        any other feed with the same data reuse them instead of resampling.
+
+        :param resample_cache: The cache the feed uses, the default cache if None.
+        :return: A DataFeed backed by shared memory.
+        """
+        cache = default_resample_cache if resample_cache is None else resample_cache
+        for timeframe, resampled in self.resampled.items():
+            milliseconds = int(timeframe_to_timedelta(timeframe).total_seconds() * 1000)
+            cache.put((self.fingerprint, milliseconds), resampled.attach())
+        return DataFeed(
+            self.data.attach(),
+            self.timeframe,
+            resample_cache=cache,
+            fingerprint=self.fingerprint,
+        )
+
+
+class SharedFeedStore:
+    """
+    Publishes ohlcv arrays into shared memory once, so worker processes can
+    attach to them by name instead of loading their own copy.
+
+    The store owns the shared memory blocks: they stay available until
+    close() is called, which should only happen after every worker is done.
+    """
+
+    def __init__(self, prefix: str = "ccxtbt"):
+        """
+        :param prefix: The prefix of the shared memory block names.
+        """
+        self.prefix = prefix
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+    def __enter__(self) -> "SharedFeedStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def publish(self, data: np.ndarray) -> SharedArray:
+        """
+        Copy an array into a new shared memory block.
+
+        :param data: The array to publish.
+        :return: The handle of the shared array.
+        """
+        data = np.asarray(data, dtype=np.float64)
+        name = f"{self.prefix}-{secrets.token_hex(8)}"
+        if data.size == 0:
+            return SharedArray(name, data.shape)
+
+        block = shared_memory.SharedMemory(name=name, create=True, size=data.nbytes)
+        self._blocks[name] = block
+        _created.add(name)
+        shared = np.ndarray(data.shape, dtype=np.float64, buffer=block.buf, order="F")
+        shared[:] = data
+        return SharedArray(name, data.shape)
+
+    def publish_feed(
+        self, data_feed: DataFeed, timeframe: str, resample: Iterable[str] = ()
+    ) -> SharedFeed:
+        """
+        Publish the data of a feed and, optionally, its resampled timeframes.
+
+        :param data_feed: The loaded feed.
+        :param timeframe: The timeframe of the feed's data.
+        :param resample: Timeframes to resample the feed to and publish.
+        :return: The handle workers pass to SharedFeed.attach.
+        """
+        resampled = {}
+        for target in resample:
+            data = data_feed.get_resampled_data(target)
+            if data is not data_feed.data:
+                resampled[target] = self.publish(data)
+        return SharedFeed(
+            timeframe,
+            self.publish(data_feed.data),
+            data_feed.fingerprint,
+            resampled,
+        )
+
+    def close(self) -> None:
+        """
+        Release and remove every shared memory block of the store.
+        """
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
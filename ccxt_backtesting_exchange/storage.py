@@ -0,0 +1,201 @@
+import hashlib
+import json
+import os
+from contextlib import contextmanager, suppress
+from typing import Optional, Tuple
+
+import numpy as np
+
+OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+SIDECAR_VERSION = 1
+
+
+def save_ohlcv_npy(data: np.ndarray, file_path: str) -> None:
+    """
+    Save ohlcv data in the binary columnar format read by DataFeed.
+
+    The data is written as a float64 .npy file in column-major order so that
+    each column, most importantly the timestamps, is contiguous on disk.
+
+    :param data: A (n, 6) array of ohlcvs.
+    :param file_path: The path of the .npy file to write.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    if data.size == 0:
+        data = data.reshape(0, len(OHLCV_COLUMNS))
+    _validate_ohlcv(data, file_path)
+
+    # write to a temporary file first so readers never see a partial file
+    with _atomic_open(file_path, "wb") as file:
+        np.save(file, np.asfortranarray(data))
+
+
+def load_ohlcv_npy(file_path: str) -> np.ndarray:
+    """
+    Open ohlcv data saved by save_ohlcv_npy without reading it into memory.
+
+    The file is memory-mapped read-only, so loading is near-instant and every
+    process opening the same file shares the operating system's page cache.
+
+    :param file_path: The path of the .npy file.
+    :return: A read-only (n, 6) float64 array backed by the file.
+    :raises ValueError: If the file does not hold a (n, 6) float64 array.
+    """
+    data = np.load(file_path, mmap_mode="r", allow_pickle=False)
+    _validate_ohlcv(data, file_path)
+    return np.asarray(data)
+
+
+def _validate_ohlcv(data: np.ndarray, file_path: str) -> None:
+    if data.ndim != 2 or data.shape[1] != len(OHLCV_COLUMNS):
+        raise ValueError(
+            f"Invalid ohlcv data in {file_path}: expected shape (n, "
+            f"{len(OHLCV_COLUMNS)}), got {data.shape}."
+        )
+    if data.dtype != np.float64:
+        raise ValueError(
+            f"Invalid ohlcv data in {file_path}: expected float64, got {data.dtype}."
+        )
+
+
+@contextmanager
+def _atomic_open(file_path: str, mode: str):
+    """
+    Open a temporary file that replaces file_path once it is closed, so
+    readers never see a partially written file.
+    """
+    temp_path = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, mode) as file:
+            yield file
+    except BaseException:
+        # the temporary file is missing if opening it failed
+        with suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, file_path)
+
+
+def sidecar_paths(json_path: str) -> Tuple[str, str]:
+    """
+    Get the paths of the binary sidecar of a JSON ohlcv file.
+
+    :param json_path: The path of the JSON file.
+    :return: The paths of the sidecar .npy file and of its header.
+    """
+    return f"{json_path}.npy", f"{json_path}.meta"
+
+
+def _file_digest(file_path: str) -> str:
+    with open(file_path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def _read_sidecar(json_path: str) -> Optional[np.ndarray]:
+    """
+    Load the sidecar of a JSON file if it is still valid for the source.
+
+    The sidecar is valid when the header matches the source file size and
+    either its modification time or, if only the time changed, its hash.
+
+    :return: The memory-mapped sidecar data, or None if it must be rebuilt.
+    """
+    npy_path, meta_path = sidecar_paths(json_path)
+    try:
+        with open(meta_path, "r") as file:
+            header = json.load(file)
+        stat = os.stat(json_path)
+        if header.get("version") != SIDECAR_VERSION or header["size"] != stat.st_size:
+            return None
+        if header["mtime_ns"] != stat.st_mtime_ns:
+            if header["sha256"] != _file_digest(json_path):
+                return None
+            header["mtime_ns"] = stat.st_mtime_ns
+            with _atomic_open(meta_path, "w") as file:
+                json.dump(header, file)
+
+        data = load_ohlcv_npy(npy_path)
+    except (OSError, ValueError, KeyError):
+        return None
+    if len(data) != header["rows"]:
+        return None
+    return data
+
+
+def write_sidecar(json_path: str, data: np.ndarray) -> None:
+    """
+    Write the binary sidecar and header of a JSON ohlcv file.
+
+    :param json_path: The path of the JSON source file.
+    :param data: The ohlcv data parsed from the source file.
+    """
+    npy_path, meta_path = sidecar_paths(json_path)
+    stat = os.stat(json_path)
+    digest = _file_digest(json_path)
+    save_ohlcv_npy(data, npy_path)
+    with _atomic_open(meta_path, "w") as file:
+        json.dump(
+            {
+                "version": SIDECAR_VERSION,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+                "rows": len(data),
+            },
+            file,
+        )
+
+
+def _parse_json(json_path: str) -> np.ndarray:
+    with open(json_path, "r") as file:
+        data = np.array(json.load(file), dtype=np.float64)
+    if data.size == 0:
+        data = data.reshape(0, len(OHLCV_COLUMNS))
+    return data
+
+
+def build_sidecar(json_path: str, force: bool = False) -> np.ndarray:
+    """
+    Make sure a JSON ohlcv file has a valid binary sidecar.
+
+    :param json_path: The path of the JSON file.
+    :param force: Rebuild the sidecar even if it is still valid.
+    :return: The ohlcv data of the file.
+    :raises ValueError: If the file does not hold ohlcv data.
+    """
+    if not force:
+        data = _read_sidecar(json_path)
+        if data is not None:
+            return data
+
+    data = _parse_json(json_path)
+    write_sidecar(json_path, data)
+    return data
+
+
+def load_ohlcv_json(json_path: str, sidecar: bool = True) -> np.ndarray:
+    """
+    Load ohlcv data from a JSON list-of-lists file.
+
+    With sidecar enabled, a valid binary sidecar is memory-mapped instead of
+    parsing the JSON, and a missing or stale sidecar is (re)built after
+    parsing. Failing to write the sidecar, e.g. on a read-only directory,
+    does not fail the load.
+
+    :param json_path: The path of the JSON file.
+    :param sidecar: Whether to use and maintain the binary sidecar.
+    :return: A (n, 6) float64 array of ohlcvs.
+    :raises FileNotFoundError: If the JSON file does not exist.
+    """
+    if sidecar:
+        data = _read_sidecar(json_path)
+        if data is not None:
+            return data
+
+    data = _parse_json(json_path)
+    if sidecar:
+        try:
+            write_sidecar(json_path, data)
+        except (OSError, ValueError):
+            pass
+    return data
@@ -0,0 +1,132 @@
+import numpy as np
+
+from .utils import resample_ohlcv, timeframe_to_timedelta
+
+
+class StreamingResampler:
+    """
+    Incrementally builds higher-timeframe ohlcvs as the backtest clock advances.
+
+    Base candles are consumed once their timestamp is in the past. Completed
+    bars are appended to a ring buffer of fixed capacity and the bar still
+    being built is kept aside as the partial bar, so lookback queries cost
+    O(limit) and never touch the full history.
+    """
+
+    def __init__(self, data: np.ndarray, timeframe: str, capacity: int = 1000):
+        """
+        Initialize the resampler.
+
+        :param data: The (n, 6) base ohlcvs of the feed, sorted by timestamp.
+        :param timeframe: The timeframe to build (e.g., '1h').
+        :param capacity: The number of completed bars kept in the ring buffer.
+        """
+        self.timeframe = timeframe
+        self.capacity = capacity
+        self._data = data
+        self._timestamps = (
+            np.ascontiguousarray(data[:, 0]) if data.size else np.array([])
+        )
+        interval = timeframe_to_timedelta(timeframe)
+        self._milliseconds = int(interval.total_seconds() * 1000)
+        self._ring = np.empty((capacity, 6), dtype=np.float64)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every bar built so far.
+        """
+        self._count = 0  # completed bars ever appended to the ring
+        self._partial = None
+        self._cursor = None  # next base row to consume
+        self._now = None
+
+    def __append(self, bars: np.ndarray) -> None:
+        capacity = self.capacity
+        bars = bars[-capacity:]
+        positions = (self._count + np.arange(len(bars))) % self.capacity
+        self._ring[positions] = bars
+        self._count += len(bars)
+
+    def __seed(self, timestamp: int) -> None:
+        """
+        Start consuming just early enough to fill the ring buffer at timestamp.
+
+        Bins without candles produce no bar, so the start is found by stepping
+        back over the candles before the current bin until they span capacity
+        bins, rather than by going back capacity intervals in time.
+        """
+        bin_start = (timestamp // self._milliseconds) * self._milliseconds
+        end = int(np.searchsorted(self._timestamps, bin_start))
+        window = self.capacity
+        while True:
+            first = max(0, end - window)
+            bins = self._timestamps[first:end] // self._milliseconds
+            # rows starting a bin, the first one may continue earlier rows
+            starts = np.flatnonzero(np.diff(bins)) + 1
+            if first == 0:
+                starts = np.concatenate([[0], starts])
+            if len(starts) >= self.capacity or first == 0:
+                break
+            window *= 2
+        if len(starts) >= self.capacity:
+            first += int(starts[-self.capacity])
+        self._cursor = first
+
+    def advance(self, timestamp: int) -> None:
+        """
+        Consume every base candle with a timestamp before the given time.
+
+        :param timestamp: The current time in milliseconds.
+        """
+        if self._now is not None and timestamp < self._now:
+            self.reset()
+        if self._cursor is None:
+            self.__seed(timestamp)
+        self._now = timestamp
+
+        start = self._cursor
+        end = int(np.searchsorted(self._timestamps, timestamp))
+        if end > start:
+            bars = resample_ohlcv(self._data[start:end], self._milliseconds)
+            self._cursor = end
+
+            partial = self._partial
+            if partial is not None:
+                if bars[0, 0] == partial[0]:
+                    bars[0, 1] = partial[1]
+                    bars[0, 2] = max(bars[0, 2], partial[2])
+                    bars[0, 3] = min(bars[0, 3], partial[3])
+                    bars[0, 5] += partial[5]
+                else:
+                    self.__append(partial[np.newaxis])
+            self.__append(bars[:-1])
+            self._partial = bars[-1]
+
+        # the partial bar is complete once its whole interval is in the past
+        if self._partial is not None and (
+            self._partial[0] + self._milliseconds <= timestamp
+        ):
+            self.__append(self._partial[np.newaxis])
+            self._partial = None
+
+    def ohlcv(self, limit: int = None, include_partial: bool = True) -> np.ndarray:
+        """
+        Get the most recent bars, oldest first.
+
+        :param limit: Maximum number of bars to return, the partial bar included.
+        :param include_partial: Whether to return the bar still being built.
+        :return: A (bars, 6) NumPy array of ohlcvs.
+        """
+        partial = self._partial if include_partial else None
+        available = min(self._count, self.capacity)
+        wanted = available + (partial is not None)
+        if limit is not None:
+            wanted = min(limit, wanted)
+
+        completed = max(0, min(available, wanted - (partial is not None)))
+        positions = (self._count - completed + np.arange(completed)) % self.capacity
+        bars = self._ring[positions]
+        if partial is not None and wanted > 0:
+            bars = np.vstack([bars, partial])
+        return bars
@@ -0,0 +1,251 @@
+import itertools
+import math
+import os
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+import pandas as pd
+from tqdm import tqdm
+
+from .backtester import Backtester
+from .clock import Clock
+from .data_feed import DataFeed
+from .order_store import OrderStatus
+from .shared_feeds import SharedFeed, SharedFeedStore
+
+# (symbol, timeframe, file path or shared feed) of a feed added to every run
+FeedSpec = Tuple[str, str, Union[str, SharedFeed]]
+Strategy = Callable[[Backtester, dict], None]
+
+
+def expand_param_grid(param_grid: Union[Dict[str, Sequence], Iterable[dict]]):
+    """
+    Expand a parameter grid into a list of parameter sets.
+
+    :param param_grid: Either a dictionary mapping each parameter to the values
+        to try, expanded to their cartesian product, or an iterable of
+        parameter sets used as is.
+    :return: A list of parameter dictionaries.
+    """
+    if isinstance(param_grid, dict):
+        keys = list(param_grid)
+        return [
+            dict(zip(keys, values))
+            for values in itertools.product(*(param_grid[key] for key in keys))
+        ]
+    return [dict(params) for params in param_grid]
+
+
+def portfolio_value(backtester: Backtester, quote: str) -> float:
+    """
+    Value the total balances of a backtester in a quote currency using the
+    last close of each '<asset>/<quote>' data feed at the current time.
+
+    :param backtester: The backtester to value.
+    :param quote: The quote currency, e.g. 'USDT'.
+    :return: The value, NaN if an asset held has no price.
+    """
+    value = 0.0
+    for asset, balance in backtester.fetch_balance().items():
+        if balance["total"] == 0 or asset == quote:
+            value += balance["total"]
+            continue
+        data_feed = backtester._data_feeds.get(f"{asset}/{quote}")
+        candles = (
+            data_feed.get_data_between_timestamps(
+                end=backtester.milliseconds(), limit=1
+            )
+            if data_feed is not None
+            else []
+        )
+        if len(candles) == 0:
+            return math.nan
+        value += balance["total"] * candles[-1][4]
+    return value
+
+
+def _run_one(
+    strategy: Strategy,
+    params: dict,
+    window: Tuple[datetime, datetime],
+    feeds: Sequence[FeedSpec],
+    balances: Dict[str, float],
+    interval: timedelta,
+    fee: float,
+    quote: str,
+) -> dict:
+    """
+    Run one backtest, calling the strategy before every tick of the clock.
+    """
+    start, end = window
+    backtester = Backtester(
+        balances=dict(balances), clock=Clock(start, end, interval), fee=fee
+    )
+    for symbol, timeframe, source in feeds:
+        if isinstance(source, SharedFeed):
+            source = source.attach()
+        backtester.add_data_feed(symbol, timeframe, source)
+
+    initial_value = portfolio_value(backtester, quote)
+    running = True
+    while running:
+        strategy(backtester, params)
+        running = backtester.tick()
+
+    orders = backtester.fetch_orders()
+    statuses = Counter(order["status"] for order in orders)
+    final_value = portfolio_value(backtester, quote)
+    return {
+        "orders": len(orders),
+        "open_orders": statuses[OrderStatus.OPEN.value],
+        "filled_orders": statuses[OrderStatus.FILLED.value],
+        "canceled_orders": statuses[OrderStatus.CANCELED.value],
+        "initial_value": initial_value,
+        "final_value": final_value,
+        "pnl": final_value - initial_value,
+        "balance": backtester.fetch_balance(),
+    }
+
+
+def _publish(
+    store: SharedFeedStore,
+    source: Union[str, SharedFeed],
+    timeframe: str,
+    resample: Iterable[str],
+) -> SharedFeed:
+    if isinstance(source, SharedFeed):
+        return source
+    return store.publish_feed(DataFeed(source, timeframe), timeframe, resample)
+
+
+def _run_chunk(strategy: Strategy, runs: List[dict], settings: dict) -> List[dict]:
+    """
+    Run a chunk of backtests in a worker, turning failures into error rows
+    so one bad parameter set does not lose the rest of the chunk.
+    """
+    results = []
+    for run in runs:
+        try:
+            result = _run_one(
+                strategy, run["params"], (run["start"], run["end"]), **settings
+            )
+            result["error"] = None
+        except Exception:
+            result = {"error": traceback.format_exc()}
+        results.append({"run": run["run"], **result})
+    return results
+
+
+def run_sweep(
+    strategy: Strategy,
+    param_grid: Union[Dict[str, Sequence], Iterable[dict]],
+    feeds: Sequence[FeedSpec],
+    balances: Dict[str, float],
+    windows: Sequence[Tuple[datetime, datetime]],
+    interval: timedelta = timedelta(minutes=1),
+    fee: float = 0.0,
+    quote: str = "USDT",
+    max_workers: int = None,
+    chunksize: int = None,
+    progress: bool = True,
+    share_feeds: bool = False,
+    resample: Iterable[str] = (),
+) -> pd.DataFrame:
+    """
+    Run a strategy over every combination of parameter set and date window,
+    distributing the runs over a pool of processes.
+
+    Each run builds its own Backtester, Clock and data feeds in the worker and
+    calls strategy(backtester, params) before every tick until the clock
+    reaches the end of the window. The strategy must be picklable, i.e.
+    defined at module level.
+
+    :param strategy: The strategy callable.
+    :param param_grid: The parameter grid, see expand_param_grid.
+    :param feeds: The (symbol, timeframe, file path) of every data feed.
+    :param balances: The starting balances of every run.
+    :param windows: The (start, end) datetimes of every window.
+    :param interval: The clock interval.
+    :param fee: The trading fee.
+    :param quote: The currency final balances are valued in.
+    :param max_workers: Number of worker processes, the CPU count if None.
+    :param chunksize: Number of runs sent to a worker at once. By default the
+        runs are split into about four chunks per worker.
+    :param progress: Whether to show a progress bar.
+    :param share_feeds: Load every feed once and publish it in shared memory
+        for the workers to attach to, instead of each run loading its own.
+    :param resample: Timeframes published along with shared feeds, so the
+        workers do not resample them again.
+    :return: A DataFrame with one row per run, holding the window, the
+        parameters, order counts, initial and final values, PnL, the final
+        balance and the error traceback of failed runs.
+    """
+    param_sets = expand_param_grid(param_grid)
+    runs = [
+        {"run": run, "start": start, "end": end, "params": params}
+        for run, ((start, end), params) in enumerate(
+            itertools.product(windows, param_sets)
+        )
+    ]
+    if not runs:
+        return pd.DataFrame(columns=["run", "start", "end"])
+
+    max_workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, math.ceil(len(runs) / (max_workers * 4)))
+    chunks = []
+    for first in range(0, len(runs), chunksize):
+        last = first + chunksize
+        chunks.append(runs[first:last])
+
+    results = []
+    with SharedFeedStore() as store:
+        if share_feeds:
+            feeds = [
+                (symbol, timeframe, _publish(store, source, timeframe, resample))
+                for symbol, timeframe, source in feeds
+            ]
+        settings = {
+            "feeds": list(feeds),
+            "balances": dict(balances),
+            "interval": interval,
+            "fee": fee,
+            "quote": quote,
+        }
+
+        with tqdm(total=len(runs), desc="Sweeping", disable=not progress) as bar:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_run_chunk, strategy, chunk, settings): chunk
+                    for chunk in chunks
+                }
+                for future in as_completed(futures):
+                    chunk = futures[future]
+                    try:
+                        results.extend(future.result())
+                    except BrokenProcessPool:
+                        # the worker died, e.g. killed or out of memory
+                        results.extend(
+                            {"run": run["run"], "error": "worker process died"}
+                            for run in chunk
+                        )
+                    bar.update(len(chunk))
+
+    table = pd.DataFrame(
+        [
+            {
+                "run": run["run"],
+                "start": run["start"],
+                "end": run["end"],
+                **run["params"],
+            }
+            for run in runs
+        ]
+    )
+    if results:
+        table = table.merge(pd.DataFrame(results), on="run", how="left")
+    return table.sort_values("run", ignore_index=True)
@@ -1,5 +1,7 @@
 from datetime import timedelta
 
+import numpy as np
+
 
 def timeframe_to_timedelta(timeframe: str) -> timedelta:
     """
@@ -29,3 +31,61 @@ def timeframe_to_timedelta(timeframe: str) -> timedelta:
 
     # Calculate the total timedelta
     return timedelta(**{unit_map[unit]: value})
+
+
+def resample_ohlcv(data: np.ndarray, resample_milliseconds: int) -> np.ndarray:
+    """
+    Aggregate time-sorted ohlcvs into bins of a larger timeframe in one pass.
+
+    :param data: A (n, 6) array of ohlcvs sorted by timestamp.
+    :param resample_milliseconds: The bin size in milliseconds.
+    :return: A (bins, 6) array of ohlcvs, timestamped at the start of each bin.
+    """
+    timestamps = data[:, 0]
+
+    # Compute the bins: round timestamps down to the nearest interval
+    bin_edges = (timestamps // resample_milliseconds) * resample_milliseconds
+
+    # Rows are sorted, so every bin is a contiguous segment of rows
+    starts = np.flatnonzero(np.diff(bin_edges, prepend=np.nan))
+    ends = np.append(starts[1:], len(data)) - 1
+
+    aggregated_data = np.empty(
+        (len(starts), data.shape[1]), dtype=np.float64, order="F"
+    )
+    aggregated_data[:, 0] = bin_edges[starts]
+    aggregated_data[:, 1] = data[starts, 1]  # first open, as open
+    aggregated_data[:, 2] = np.maximum.reduceat(data[:, 2], starts)
+    aggregated_data[:, 3] = np.minimum.reduceat(data[:, 3], starts)
+    aggregated_data[:, 4] = data[ends, 4]  # last close, as close
+    aggregated_data[:, 5] = np.add.reduceat(data[:, 5], starts)
+    return aggregated_data
+
+
+def find_gaps(timestamps: np.ndarray, start: int, end: int, step: int) -> np.ndarray:
+    """
+    Find the runs of missing candles on the grid start, start + step, ..., end.
+
+    Timestamps off the grid or outside the window are ignored. Each run is
+    reported as the time of its first missing candle and the time right after
+    its last one.
+
+    :param timestamps: The timestamps of the existing candles in milliseconds.
+    :param start: The first expected timestamp in milliseconds.
+    :param end: The last expected timestamp in milliseconds, included.
+    :param step: The candle interval in milliseconds.
+    :return: A (gaps, 2) int64 array of (start, end) times, end excluded.
+    """
+    last = (end - start) // step
+    offsets = np.asarray(timestamps, dtype=np.int64) - start
+    on_grid = (offsets >= 0) & (offsets % step == 0)
+    present = np.unique(offsets[on_grid] // step)
+    present = present[present <= last]
+
+    # a gap lies between two consecutive present grid indexes more than one apart
+    before = np.concatenate([[-1], present])
+    after = np.concatenate([present, [last + 1]])
+    is_gap = after - before > 1
+    return np.column_stack(
+        [start + (before[is_gap] + 1) * step, start + after[is_gap] * step]
+    )
@@ -0,0 +1,181 @@
+from typing import Dict, Union
+
+import numpy as np
+import pandas as pd
+from ccxt.base.errors import BadRequest, BadSymbol, InsufficientFunds
+
+from .data_feed import DataFeed
+
+
+class SignalResult:
+    """
+    The outcome of a vectorized signal backtest: the balance trajectories and
+    equity curve, one value per candle after its fills, and the trade list.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        timestamps: np.ndarray,
+        base: np.ndarray,
+        quote: np.ndarray,
+        equity: np.ndarray,
+        trades: pd.DataFrame,
+        balances: Dict[str, float],
+    ):
+        self.symbol = symbol
+        self.timestamps = timestamps
+        self.base = base
+        self.quote = quote
+        self.equity = equity
+        self.trades = trades
+        self._balances = balances
+
+    def fetch_balance(self) -> dict:
+        """
+        Get the final balances in the format of Backtester.fetch_balance.
+
+        :return: A dictionary of balances indexed by asset.
+        """
+        return {
+            asset: {"free": total, "used": 0.0, "total": total}
+            for asset, total in self._balances.items()
+        }
+
+
+def run_signals(
+    data_feed: Union[DataFeed, np.ndarray],
+    symbol: str,
+    balances: Dict[str, float],
+    amounts: np.ndarray,
+    prices: np.ndarray = None,
+    fee: float = 0.0,
+) -> SignalResult:
+    """
+    Backtest one order signal per candle without stepping a clock.
+
+    At candle i an order of amounts[i] base units is placed, a buy if positive
+    and a sell if negative, as create_order would at the candle's timestamp:
+    prices[i] is its limit price, a NaN price makes it a market order at the
+    candle's open, and a limit order that would cross the open becomes a
+    market order at the open. The order fills like fill_orders does, at its
+    price, if the price lies within the candle's [low, high], paying fee on
+    its quote value.
+    Unlike orders resting on a Backtester, an order that does not fill on its
+    candle expires, which is what makes the run path independent.
+
+    :param data_feed: The DataFeed, or (n, 6) ohlcv array, the signals are aligned to.
+    :param symbol: The trading pair (e.g., "BTC/USDT").
+    :param balances: Starting balances, example: {"BTC": 1, "USDT": 1000}
+    :param amounts: The signed order amount of every candle, 0 for no order.
+    :param prices: The limit price of every candle, market orders if None.
+    :param fee: Fee rate charged on the quote value of every order.
+    :return: The balance trajectories, equity curve and trades of the run.
+    :raises BadSymbol: If the trading pair is invalid.
+    :raises BadRequest: If the signals do not match the candles or a limit
+        price is not positive.
+    :raises InsufficientFunds: If an order needs more than the balance left
+        when it is placed, like create_order.
+    """
+    if not isinstance(symbol, str) or "/" not in symbol:
+        raise BadSymbol(
+            "Invalid symbol format. Expected 'BASE/QUOTE' (e.g., 'BTC/USDT')."
+        )
+    base_asset, quote_asset = symbol.split("/")
+    data = data_feed.data if isinstance(data_feed, DataFeed) else data_feed
+    data = np.asarray(data, dtype=np.float64).reshape(-1, 6)
+    timestamps, opens, highs, lows, closes = data[:, :5].T
+
+    amounts = np.asarray(amounts, dtype=np.float64)
+    if prices is None:
+        prices = np.full(len(data), np.nan)
+    prices = np.asarray(prices, dtype=np.float64)
+    if amounts.shape != (len(data),) or prices.shape != (len(data),):
+        raise BadRequest(
+            f"Expected one amount and one price per candle ({len(data)}), got "
+            f"{amounts.shape} and {prices.shape}."
+        )
+
+    placed = np.nan_to_num(amounts) != 0
+    buys = amounts > 0
+    sizes = np.abs(np.nan_to_num(amounts))
+    if np.any(placed & (prices <= 0)):
+        raise BadRequest("Invalid price. Must be a positive number.")
+
+    # limit orders crossing the open are filled as market orders at the open
+    market = np.isnan(prices) | np.where(buys, prices > opens, prices < opens)
+    prices = np.where(market, opens, prices)
+    filled = placed & (lows <= prices) & (prices <= highs)
+
+    values = sizes * prices
+    fee_costs = values * fee
+    quote_deltas = np.where(buys, -(values + fee_costs), values - fee_costs)
+    base_deltas = np.where(buys, sizes, -sizes)
+    start_quote = balances.get(quote_asset, 0.0)
+    start_base = balances.get(base_asset, 0.0)
+    quote = start_quote + np.cumsum(np.where(filled, quote_deltas, 0.0))
+    base = start_base + np.cumsum(np.where(filled, base_deltas, 0.0))
+
+    # an order can only use what the previous candles' fills left
+    quote_before = np.concatenate([[start_quote], quote[:-1]])
+    base_before = np.concatenate([[start_base], base[:-1]])
+    short = placed & np.where(
+        buys, quote_before < values + fee_costs, base_before < sizes
+    )
+    if short.any():
+        index = int(np.argmax(short))
+        asset = quote_asset if buys[index] else base_asset
+        raise InsufficientFunds(
+            f"Insufficient balance: {asset} balance too low at candle {index} "
+            f"({int(timestamps[index])})."
+        )
+
+    trades = pd.DataFrame(
+        {
+            "timestamp": timestamps[filled].astype(np.int64),
+            "symbol": symbol,
+            "type": np.where(market[filled], "market", "limit"),
+            "side": np.where(buys[filled], "buy", "sell"),
+            "price": prices[filled],
+            "amount": sizes[filled],
+            "cost": values[filled],
+            "fee": fee_costs[filled],
+        }
+    )
+    final_balances = dict(balances)
+    if len(data):
+        final_balances[quote_asset] = float(quote[-1])
+        final_balances[base_asset] = float(base[-1])
+    return SignalResult(
+        symbol,
+        timestamps.astype(np.int64),
+        base,
+        quote,
+        quote + base * closes,
+        trades,
+        final_balances,
+    )
+
+
+def run_target_positions(
+    data_feed: Union[DataFeed, np.ndarray],
+    symbol: str,
+    balances: Dict[str, float],
+    targets: np.ndarray,
+    fee: float = 0.0,
+) -> SignalResult:
+    """
+    Backtest a target position series, trading at each candle's open with
+    market orders to hold targets[i] base units from candle i on.
+
+    :param data_feed: The DataFeed, or (n, 6) ohlcv array, the targets are aligned to.
+    :param symbol: The trading pair (e.g., "BTC/USDT").
+    :param balances: Starting balances, example: {"BTC": 1, "USDT": 1000}
+    :param targets: The base asset position wanted at every candle.
+    :param fee: Fee rate charged on the quote value of every order.
+    :return: The balance trajectories, equity curve and trades of the run.
+    """
+    base_asset = symbol.split("/")[0] if isinstance(symbol, str) else None
+    targets = np.asarray(targets, dtype=np.float64)
+    amounts = np.diff(targets, prepend=balances.get(base_asset, 0.0))
+    return run_signals(data_feed, symbol, balances, amounts, fee=fee)
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from ccxt.base.errors import OrderNotFound
+
+from ccxt_backtesting_exchange.async_backtester import AsyncBacktester
+
+
+@pytest.fixture
+def exchange(clock):
+    exchange = AsyncBacktester(
+        balances={"SOL": 10.0, "USDT": 10000.0}, clock=clock, fee=0.001
+    )
+    exchange.add_data_feed("SOL/USDT", "1m", "./data/test-sol-data.json")
+    return exchange
+
+
+def test_exchange_methods_are_coroutines(exchange):
+    async def main():
+        order = await exchange.create_order("SOL/USDT", "limit", "buy", 1.0, 189.5)
+        assert order["status"] == "open"
+        assert (await exchange.fetch_balance())["USDT"]["used"] == pytest.approx(
+            189.5 * 1.001
+        )
+        assert len(await exchange.fetch_open_orders("SOL/USDT")) == 1
+        await exchange.cancel_order(order["id"], "SOL/USDT")
+        assert (await exchange.fetch_order(order["id"]))["status"] == "canceled"
+        with pytest.raises(OrderNotFound):
+            await exchange.fetch_order(42)
+        ticker = await exchange.fetch_ticker("SOL/USDT")
+        assert ticker["timestamp"] == exchange.milliseconds()
+        await exchange.close()
+
+    asyncio.run(main())
+
+
+def test_strategies_share_the_clock(exchange):
+    seen = {"fast": [], "slow": [], "early": []}
+
+    async def strategy(name, delay, ticks=None):
+        async def run(exchange):
+            while await exchange.next_tick():
+                await asyncio.sleep(delay)
+                seen[name].append(exchange.milliseconds())
+                if ticks is not None and len(seen[name]) == ticks:
+                    return name
+            return name
+
+        return run
+
+    async def main():
+        return await exchange.run(
+            await strategy("fast", 0),
+            await strategy("slow", 0.001),
+            await strategy("early", 0, ticks=3),
+        )
+
+    assert asyncio.run(main()) == ["fast", "slow", "early"]
+    assert seen["fast"] == seen["slow"]
+    assert len(seen["fast"]) == 29
+    assert seen["early"] == seen["fast"][:3]
+    assert exchange.backtester.tick() is False
+
+
+def test_orders_fill_as_the_clock_ticks(exchange):
+    async def trader(exchange):
+        await exchange.create_order("SOL/USDT", "limit", "buy", 1.0, 189.5)
+        while await exchange.next_tick():
+            if not await exchange.fetch_open_orders("SOL/USDT"):
+                return exchange.milliseconds()
+
+    filled_at = asyncio.run(exchange.run(trader))[0]
+    order = asyncio.run(exchange.fetch_closed_orders("SOL/USDT"))[0]
+    # orders fill at the time of the tick, before the clock moves on
+    assert order["lastTradeTimestamp"] == filled_at - 60000
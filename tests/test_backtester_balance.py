@@ -141,6 +141,81 @@ def test_cancel_some_orders_affects_balances_correctly(backtester):
     assert balance == expected_balance
 
 
+def test_cancel_orders_releases_balances_like_cancel_order(backtester):
+    backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 200.0)
+    backtester.create_order("ETH/USDT", "limit", "buy", 1.0, 2000.0)
+    backtester.create_order("ETH/USDT", "limit", "sell", 1.0, 3500.0)
+    backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 150.0)
+    backtester.create_order("SOL/USDT", "limit", "sell", 1.0, 350.0)
+    buy_order = backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 100.0)
+    sell_order = backtester.create_order("SOL/USDT", "limit", "sell", 0.5, 300.0)
+    backtester.tick()
+
+    canceled = backtester.cancel_orders([sell_order["id"], buy_order["id"]])
+    balance = backtester.fetch_balance()
+    expected_balance = {
+        "BTC": {"free": 1.0, "used": 0, "total": 1.0},
+        "ETH": {"free": 4.0, "used": 1.0, "total": 5.0},
+        "SOL": {"free": 9.0, "used": 1.0, "total": 10.0},
+        "USDT": {"free": 7647.65, "used": 2352.35, "total": 10000.0},
+    }
+    assert_dict_close(balance, expected_balance)
+    assert [order["id"] for order in canceled] == [sell_order["id"], buy_order["id"]]
+    assert {order["status"] for order in canceled} == {"canceled"}
+    assert {order["lastTradeTimestamp"] for order in canceled} == {1735687860000}
+    assert len(backtester.fetch_open_orders("SOL/USDT")) == 3
+
+
+def test_cancel_orders_cancels_nothing_if_one_order_cannot_be(backtester):
+    first = backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 200.0)
+    second = backtester.create_order("SOL/USDT", "limit", "sell", 1.0, 350.0)
+    backtester.cancel_order(second["id"])
+    balance = backtester.fetch_balance()
+
+    with pytest.raises(BadRequest, match="already closed or canceled"):
+        backtester.cancel_orders([first["id"], second["id"]])
+    with pytest.raises(OrderNotFound):
+        backtester.cancel_orders([first["id"], 1000])
+    with pytest.raises(OrderNotFound):
+        backtester.cancel_orders([first["id"]], symbol="ETH/USDT")
+
+    assert backtester.fetch_balance() == balance
+    assert backtester.fetch_order(first["id"])["status"] == "open"
+
+
+def test_cancel_orders_rejects_duplicate_ids(backtester):
+    first = backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 200.0)
+    second = backtester.create_order("SOL/USDT", "limit", "sell", 1.0, 350.0)
+    balance = backtester.fetch_balance()
+
+    with pytest.raises(BadRequest, match=f"Order {second['id']} is listed more"):
+        backtester.cancel_orders([second["id"], first["id"], second["id"]])
+
+    assert backtester.fetch_balance() == balance
+    assert len(backtester.fetch_open_orders("SOL/USDT")) == 2
+
+
+def test_cancel_all_orders_restores_balances(backtester):
+    backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 200.0)
+    backtester.create_order("SOL/USDT", "limit", "sell", 1.0, 350.0)
+    eth_order = backtester.create_order("ETH/USDT", "limit", "sell", 1.0, 3500.0)
+
+    canceled = backtester.cancel_all_orders("SOL/USDT")
+    assert [order["symbol"] for order in canceled] == ["SOL/USDT", "SOL/USDT"]
+    assert backtester.fetch_open_orders("SOL/USDT") == []
+    assert backtester.fetch_order(eth_order["id"])["status"] == "open"
+
+    assert len(backtester.cancel_all_orders()) == 1
+    assert backtester.cancel_all_orders() == []
+    expected_balance = {
+        "BTC": {"free": 1.0, "used": 0, "total": 1.0},
+        "ETH": {"free": 5.0, "used": 0, "total": 5.0},
+        "SOL": {"free": 10.0, "used": 0, "total": 10.0},
+        "USDT": {"free": 10000.0, "used": 0, "total": 10000.0},
+    }
+    assert_dict_close(backtester.fetch_balance(), expected_balance)
+
+
 def test_attempt_cancelling_nonexistent_order_raises_exception(backtester):
     with pytest.raises(OrderNotFound):
         backtester.cancel_order(1000)
@@ -225,3 +300,32 @@ def test_fill_multiple_orders_modifies_balance_correctly(
         "USDT": {"free": 9438.50847, "used": 180.18, "total": 9618.68847},
     }
     assert_dict_close(balance, expected_balance)
+
+
+def test_invalid_fill_mode_raises(clock):
+    with pytest.raises(ValueError):
+        Backtester(balances={"USDT": 1.0}, clock=clock, fill_mode="invalid")
+
+
+@pytest.mark.parametrize("ticks", [1, 5, 30])
+def test_vectorized_fills_match_iterative_fills(clock, ticks):
+    backtesters = []
+    for fill_mode in Backtester.FILL_MODES:
+        clock.reset()
+        backtester = Backtester(
+            balances={"SOL": 100.0, "USDT": 100000.0},
+            clock=clock,
+            fee=0.001,
+            fill_mode=fill_mode,
+        )
+        backtester.add_data_feed("SOL/USDT", "1m", "./data/test-sol-data.json")
+        for i in range(20):
+            backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 188.0 + i * 0.1)
+            backtester.create_order("SOL/USDT", "limit", "sell", 0.5, 192.0 - i * 0.1)
+        for _ in range(ticks):
+            backtester.tick()
+        backtesters.append(backtester)
+
+    iterative, vectorized = backtesters
+    assert_dict_close(iterative.fetch_balance(), vectorized.fetch_balance())
+    assert iterative.fetch_orders() == vectorized.fetch_orders()
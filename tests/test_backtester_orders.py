@@ -1,3 +1,5 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
 
@@ -9,6 +11,9 @@ from ccxt.base.errors import (
     OrderImmediatelyFillable,
 )
 
+from ccxt_backtesting_exchange.backtester import Backtester
+from ccxt_backtesting_exchange.clock import Clock
+
 
 @pytest.fixture
 def backtester_with_orders(backtester):
@@ -320,3 +325,163 @@ def test_assert_orders_fill_in_correct_sequence_on_every_tick(
     assert len(backtester_with_data_feed.fetch_open_orders("SOL/USDT")) == 1
     backtester_with_data_feed.tick()
     assert len(backtester_with_data_feed.fetch_open_orders("SOL/USDT")) == 0
+
+
+def place_resting_orders(backtester):
+    backtester.add_data_feed("SOL/USDT", "1m", "./data/test-sol-data.json")
+    backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 190.30)
+    backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 189.8)
+    backtester.create_order("SOL/USDT", "limit", "buy", 1.0, 189.25)
+    backtester.create_order("SOL/USDT", "limit", "sell", 1.0, 191.1)
+    backtester.create_order("SOL/USDT", "limit", "sell", 1.0, 195.0)
+
+
+def fill_times(backtester):
+    return sorted(
+        (order["id"], order["lastTradeTimestamp"])
+        for order in backtester.fetch_closed_orders("SOL/USDT")
+    )
+
+
+@pytest.mark.parametrize("minutes", [1, 3, 7])
+def test_run_until_event_matches_tick_loop(minutes):
+    def make_backtester():
+        clock = Clock(
+            start_time=datetime(2024, 12, 31, 23, 30, tzinfo=timezone.utc),
+            end_time=datetime(2024, 12, 31, 23, 59, tzinfo=timezone.utc),
+            interval=timedelta(minutes=minutes),
+        )
+        backtester = Backtester(balances={"SOL": 10.0, "USDT": 10000.0}, clock=clock)
+        place_resting_orders(backtester)
+        return backtester
+
+    ticking = make_backtester()
+    events = []
+    while ticking.tick():
+        if len(fill_times(ticking)) > len(events):
+            events.append((ticking.milliseconds(), fill_times(ticking)))
+
+    jumping = make_backtester()
+    jumps = []
+    while jumping.run_until_event():
+        jumps.append((jumping.milliseconds(), fill_times(jumping)))
+
+    assert jumps == events
+    assert fill_times(jumping) == fill_times(ticking)
+    assert jumping.milliseconds() == ticking.milliseconds()
+    assert len(events) > 1
+
+
+def order_request(symbol, type, side, amount, price, params=None):
+    request = {
+        "symbol": symbol,
+        "type": type,
+        "side": side,
+        "amount": amount,
+        "price": price,
+    }
+    if params is not None:
+        request["params"] = params
+    return request
+
+
+LADDER = [
+    order_request("SOL/USDT", "limit", "buy", 1.0, 190.30),
+    order_request("SOL/USDT", "limit", "buy", 1.0, 195.0),
+    order_request("SOL/USDT", "market", "buy", 1.0, 190.49),
+    order_request("SOL/USDT", "limit", "sell", 2.0, 191.0),
+    order_request("SOL/USDT", "limit", "sell", 1.0, 185.0),
+    order_request("BTC/USDT", "limit", "buy", 0.01, 90000.0),
+]
+
+
+def test_create_orders_matches_create_order():
+    start = datetime(2024, 12, 31, 23, 30, tzinfo=timezone.utc)
+    sequential, batched = [
+        Backtester(
+            {"SOL": 10.0, "BTC": 1.0, "USDT": 10000.0},
+            Clock(start, start + timedelta(minutes=29), timedelta(minutes=1)),
+            fee=0.001,
+        )
+        for _ in range(2)
+    ]
+    for backtester in (sequential, batched):
+        backtester.add_data_feed("SOL/USDT", "1m", "./data/test-sol-data.json")
+        backtester.add_data_feed("BTC/USDT", "1m", "./data/test-btc-data.json")
+
+    expected = [
+        sequential.create_order(
+            order["symbol"],
+            order["type"],
+            order["side"],
+            order["amount"],
+            order["price"],
+        )
+        for order in LADDER
+    ]
+    orders = batched.create_orders(LADDER)
+
+    assert orders == expected
+    assert [order["status"] for order in orders] == ["open"] * len(LADDER)
+    assert orders[1]["type"] == "market"
+    assert batched.fetch_balance() == sequential.fetch_balance()
+
+    sequential.tick()
+    batched.tick()
+    assert batched.fetch_orders() == sequential.fetch_orders()
+    assert batched.fetch_balance() == sequential.fetch_balance()
+
+
+def test_create_orders_atomic_creates_nothing_on_error(backtester_with_data_feed):
+    balances = backtester_with_data_feed.fetch_balance()
+    orders = LADDER + [order_request("SOL/USDT", "limit", "sell", -1.0, 190.0)]
+
+    with pytest.raises(BadRequest, match="Invalid amount"):
+        backtester_with_data_feed.create_orders(orders)
+
+    with pytest.raises(InsufficientFunds, match="SOL balance too low"):
+        backtester_with_data_feed.create_orders(
+            [order_request("SOL/USDT", "limit", "sell", 6.0, 191.0)] * 2
+        )
+
+    assert backtester_with_data_feed.fetch_orders() == []
+    assert backtester_with_data_feed.fetch_balance() == balances
+
+
+def test_create_orders_best_effort_rejects_invalid_orders(backtester_with_data_feed):
+    orders = backtester_with_data_feed.create_orders(
+        [
+            order_request("SOL/USDT", "limit", "sell", 6.0, 191.0),
+            order_request("SOL/USDT", "limit", "sell", 6.0, 192.0),
+            order_request("SOLUSDT", "limit", "buy", 1.0, 190.0),
+            order_request("SOL/USDT", "limit", "buy", 1.0, 195.0, {"postOnly": True}),
+            order_request("SOL/USDT", "stop", "buy", 1.0, 190.0),
+            order_request("SOL/USDT", "limit", "sell", 4.0, 193.0),
+        ],
+        {"atomic": False},
+    )
+
+    assert [order["status"] for order in orders] == [
+        "open",
+        "rejected",
+        "rejected",
+        "rejected",
+        "rejected",
+        "open",
+    ]
+    assert [order["id"] for order in orders] == [0, None, None, None, None, 1]
+    assert "InsufficientFunds" in orders[1]["info"]["error"]
+    assert "BadSymbol" in orders[2]["info"]["error"]
+    assert "OrderImmediatelyFillable" in orders[3]["info"]["error"]
+    assert "BadRequest" in orders[4]["info"]["error"]
+    assert backtester_with_data_feed.fetch_balance()["SOL"] == {
+        "free": 0.0,
+        "used": 10.0,
+        "total": 10.0,
+    }
+    assert len(backtester_with_data_feed.fetch_open_orders("SOL/USDT")) == 2
+
+
+def test_create_orders_empty_batch(backtester):
+    assert backtester.create_orders([]) == []
+    assert backtester.fetch_orders() == []
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from ccxt_backtesting_exchange.balance_ledger import BalanceLedger
+
+
+@pytest.fixture
+def ledger():
+    return BalanceLedger({"BTC": 1.0, "USDT": 10000.0})
+
+
+def test_ledger_exports_ccxt_balance_layout(ledger):
+    assert ledger.to_dict() == {
+        "BTC": {"free": 1.0, "used": 0.0, "total": 1.0},
+        "USDT": {"free": 10000.0, "used": 0.0, "total": 10000.0},
+    }
+
+
+def test_ledger_update_adds_delta(ledger):
+    ledger.update("USDT", "free", -200.2)
+    ledger.update("USDT", "used", 200.2)
+    assert ledger.get("USDT", "free") == 9799.8
+    assert ledger.get("USDT", "used") == 200.2
+    assert ledger.get("USDT", "total") == 10000.0
+
+
+def test_ledger_stores_float64(ledger):
+    ledger.update("BTC", "free", 1e-12)
+    assert ledger.get("BTC", "free") == 1.0 + 1e-12
+    assert ledger._values.dtype == np.float64
+
+
+def test_ledger_grows_past_capacity():
+    ledger = BalanceLedger(capacity=1)
+    for i in range(10):
+        ledger.add_asset(f"A{i}", float(i))
+    assert len(ledger) == 10
+    assert ledger.get("A9", "total") == 9.0
+
+
+def test_ledger_unknown_asset_raises(ledger):
+    with pytest.raises(ValueError):
+        ledger.get("ETH", "free")
+
+
+def test_ledger_unknown_column_raises(ledger):
+    with pytest.raises(ValueError):
+        ledger.update("BTC", "locked", 1.0)
+
+
+def test_ledger_duplicate_asset_raises(ledger):
+    with pytest.raises(ValueError):
+        ledger.add_asset("BTC")
@@ -60,3 +60,51 @@ def test_reset_restarts_clock(clock):
     assert clock.get_current_time() == datetime.datetime(
         2025, 1, 1, 0, 0, 0, tzinfo=datetime.timezone.utc
     )
+
+
+def test_fast_forward_matches_repeated_ticks(clock):
+    assert clock.ticks_until(clock.epoch()) == 0
+    assert clock.ticks_until(clock.epoch() + 1) == 1
+    assert clock.fast_forward(clock.ticks_until(1735718400000)) is True
+    assert clock.datetime() == "2025-01-01 08:00:00"
+    assert clock.fast_forward(4) is False
+    assert clock.datetime() == "2025-01-02 00:00:00"
+
+
+def test_ticks_follow_the_interval_in_milliseconds():
+    start_time = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    clock = Clock(
+        start_time,
+        start_time + datetime.timedelta(hours=1),
+        datetime.timedelta(minutes=7),
+    )
+    epochs = [clock.epoch()]
+    while clock.tick():
+        epochs.append(clock.epoch())
+    assert epochs == list(range(clock.start_epoch, clock.end_epoch + 1, 420000))
+    assert clock.ticks == len(epochs)
+    assert isinstance(clock.epoch(), int)
+
+
+def test_datetime_is_memoized_until_the_clock_moves(clock):
+    assert clock.datetime() is clock.datetime()
+    clock.tick()
+    assert clock.datetime() == "2025-01-01 04:00:00"
+    clock.reset()
+    assert clock.datetime() == "2025-01-01 00:00:00"
+    assert clock.get_current_time() == clock.start_time
+
+
+def test_setting_current_time_moves_the_clock(clock):
+    clock.current_time = clock.start_time + datetime.timedelta(hours=8)
+    assert clock.epoch() == 1735718400000
+    assert clock.tick() is True
+    assert clock.datetime() == "2025-01-01 12:00:00"
+
+
+def test_invalid_interval_raises_error():
+    start_time = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    with pytest.raises(ValueError):
+        Clock(start_time, start_time, datetime.timedelta(0))
+    with pytest.raises(ValueError):
+        Clock(start_time, start_time, datetime.timedelta(microseconds=1500))
@@ -1,8 +1,11 @@
+import pathlib
+
 import pytest
 import numpy as np
 from .utils import assert_timestamps_in_range
 
 from ccxt_backtesting_exchange.data_feed import DataFeed
+from ccxt_backtesting_exchange.storage import save_ohlcv_npy
 
 
 @pytest.fixture
@@ -195,3 +198,123 @@ def test_resample_data_to_15m_timeframe(data_feed):
     )
     assert len(resampled_data) == len(expected_resample)
     assert np.allclose(resampled_data, expected_resample, atol=1e-12)
+
+
+@pytest.fixture
+def npy_data_feed(tmp_path, data_feed):
+    file_path = str(tmp_path / "test-sol-data.npy")
+    save_ohlcv_npy(data_feed.get_data_between_timestamps(), file_path)
+    return DataFeed(file_path)
+
+
+def test_npy_data_feed_matches_json_data_feed(npy_data_feed, data_feed):
+    assert np.array_equal(
+        npy_data_feed.get_data_between_timestamps(),
+        data_feed.get_data_between_timestamps(),
+    )
+    assert np.array_equal(
+        npy_data_feed.get_data_at_timestamp(1735686600000),
+        data_feed.get_data_at_timestamp(1735686600000),
+    )
+    assert np.allclose(
+        npy_data_feed.get_resampled_data("15m"),
+        data_feed.get_resampled_data("15m"),
+        atol=1e-12,
+    )
+
+
+def test_npy_data_feed_is_memory_mapped_read_only(npy_data_feed):
+    data = npy_data_feed.get_resampled_data("1m")
+    assert not data.flags.writeable
+    with pytest.raises(ValueError):
+        data[0, 1] = 0.0
+
+
+def test_missing_npy_data_feed_is_empty():
+    assert len(DataFeed("./data/empty.npy").get_data_between_timestamps()) == 0
+
+
+def test_resample_matches_per_bin_aggregation_with_gaps(tmp_path):
+    rng = np.random.default_rng(0)
+    timestamps = 1735686000000 + 60000 * np.sort(
+        rng.choice(5000, size=3000, replace=False)
+    )
+    prices = rng.uniform(100, 200, size=(len(timestamps), 4))
+    data = np.column_stack([timestamps, prices, rng.uniform(0, 10, len(timestamps))])
+    file_path = str(tmp_path / "gaps.npy")
+    save_ohlcv_npy(data, file_path)
+    data_feed = DataFeed(file_path)
+
+    resampled_data = data_feed.get_resampled_data("1h")
+
+    bin_edges = (timestamps // 3600000) * 3600000
+    expected = np.array(
+        [
+            data_feed._aggregate_ohlcv(data[bin_edges == bin_val])
+            for bin_val in np.unique(bin_edges)
+        ]
+    )
+    expected[:, 0] = np.unique(bin_edges)
+    assert np.allclose(resampled_data, expected, rtol=0, atol=1e-9)
+
+
+def test_get_data_between_timestamps_returns_a_view(data_feed):
+    data = data_feed.get_data_between_timestamps()
+    window = data_feed.get_data_between_timestamps(
+        start=1735686600000, end=1735688400000, limit=10
+    )
+    assert np.shares_memory(window, data)
+    assert window[0, 0] == 1735687800000
+
+
+def test_get_data_between_timestamps_with_empty_range(data_feed):
+    data = data_feed.get_data_between_timestamps(start=1735688400000, end=1735686600000)
+    assert data.shape == (0, 6)
+
+
+def test_get_data_at_timestamp_cursor_matches_binary_search(data_feed):
+    data = data_feed.get_data_between_timestamps()
+    timestamps = data[:, 0]
+    rng = np.random.default_rng(0)
+    forward = np.arange(timestamps[0] - 60000, timestamps[-1] + 1, 30000)
+    random = rng.integers(timestamps[0] - 60000, timestamps[-1] + 1, 200)
+
+    for timestamp in np.concatenate([forward, random, forward[::7]]):
+        data_feed.advance(int(timestamp))
+        expected = data[np.searchsorted(timestamps, timestamp)]
+        assert np.array_equal(data_feed.get_data_at_timestamp(timestamp), expected)
+
+
+def test_array_data_feed_uses_column_major_arrays_in_place(data_feed):
+    fortran = np.asfortranarray(data_feed.data.copy())
+    contiguous = np.ascontiguousarray(data_feed.data)
+
+    assert np.shares_memory(DataFeed(fortran).data, fortran)
+    copied = DataFeed(contiguous).data
+    assert not np.shares_memory(copied, contiguous)
+    assert np.array_equal(copied, contiguous)
+
+
+@pytest.mark.parametrize("timeframe", [None, "1m", "15m"])
+def test_get_data_between_timestamps_views_are_read_only(data_feed, timeframe):
+    window = data_feed.get_data_between_timestamps(limit=10, timeframe=timeframe)
+    assert not window.flags.writeable
+    with pytest.raises(ValueError):
+        window[0, 4] = 0.0
+
+
+def test_array_data_feed_leaves_the_caller_array_writable(data_feed):
+    fortran = np.asfortranarray(data_feed.data.copy())
+    feed = DataFeed(fortran)
+    with pytest.raises(ValueError):
+        feed.get_data_between_timestamps()[0, 4] = 0.0
+    fortran[0, 4] = 0.0
+    assert feed.data[0, 4] == 0.0
+
+
+def test_data_feed_accepts_path_objects(tmp_path, data_feed):
+    file_path = tmp_path / "test-sol-data.npy"
+    save_ohlcv_npy(data_feed.data, str(file_path))
+    assert np.array_equal(DataFeed(file_path).data, data_feed.data)
+    json_feed = DataFeed(pathlib.Path("./data/test-sol-data.json"), sidecar=False)
+    assert np.array_equal(json_feed.data, data_feed.data)
@@ -1,12 +1,18 @@
 from datetime import datetime, timedelta, timezone
 import json
 import os
+import threading
+import time
 
+import ccxt
+import numpy as np
 import pandas as pd
 import pytest
 
 
 from ccxt_backtesting_exchange.market_data import MarketDataCache
+from ccxt_backtesting_exchange.rate_limit import TokenBucket
+from ccxt_backtesting_exchange.utils import find_gaps
 from .utils import assert_timestamps_in_range
 
 
@@ -158,3 +164,166 @@ def test_sync_with_backtester(market_data_cache, backtester_with_data_feed):
     df = market_data_cache.load_existing_data()
     assert df.shape == (30, 6)
     assert_timestamps_in_range(df.to_numpy(), 1735686000000, 1735687740000)
+
+
+class StubExchange:
+    """
+    An offline exchange serving candles from a list, failing on demand.
+    """
+
+    def __init__(self, ohlcv, failures=0, fail_before=None, rate_limit=0):
+        self.ohlcv = ohlcv
+        self.failures = failures
+        self.fail_before = fail_before
+        self.rateLimit = rate_limit
+        self.enableRateLimit = rate_limit > 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def fetch_ohlcv(self, symbol, timeframe="1m", since=None, limit=None, params={}):
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            failing = self.failures > 0 or (
+                self.fail_before is not None and since < self.fail_before
+            )
+            self.failures -= self.failures > 0
+        try:
+            time.sleep(0.005)
+            if failing:
+                raise ccxt.NetworkError("connection reset")
+            rows = [row for row in self.ohlcv if since <= row[0] < params["until"]]
+            return rows[:limit]
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def sol_ohlcv():
+    with open("./data/test-sol-data.json", "r") as file:
+        return json.load(file)
+
+
+def make_stub_cache(exchange):
+    return MarketDataCache("stub", "TEST/PAIR", "1m", exchange=exchange, backoff=0)
+
+
+SYNC_START = datetime(2024, 12, 31, 23, tzinfo=timezone.utc)
+SYNC_END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_sync_fetches_chunks_concurrently_in_timestamp_order(sol_ohlcv):
+    exchange = StubExchange(sol_ohlcv)
+    cache = make_stub_cache(exchange)
+    try:
+        df = cache.sync(SYNC_START, SYNC_END, chunk_size=5, max_workers=4)
+        assert 1 < exchange.max_in_flight <= 4
+        assert df.to_numpy().tolist() == sol_ohlcv
+        assert cache.load_existing_data().to_numpy().tolist() == sol_ohlcv
+    finally:
+        os.remove(cache.file_path)
+
+
+def test_sync_retries_failed_requests(sol_ohlcv):
+    exchange = StubExchange(sol_ohlcv, failures=3)
+    cache = make_stub_cache(exchange)
+    try:
+        df = cache.sync(SYNC_START, SYNC_END, chunk_size=30, max_workers=2)
+        assert df.to_numpy().tolist() == sol_ohlcv
+    finally:
+        os.remove(cache.file_path)
+
+
+def test_sync_saves_fetched_chunks_when_a_chunk_keeps_failing(sol_ohlcv):
+    exchange = StubExchange(sol_ohlcv, fail_before=sol_ohlcv[30][0])
+    cache = make_stub_cache(exchange)
+    cache.retries = 1
+    try:
+        with pytest.raises(ccxt.NetworkError):
+            cache.sync(SYNC_START, SYNC_END, chunk_size=30, max_workers=2)
+        assert cache.load_existing_data().to_numpy().tolist() == sol_ohlcv[30:]
+    finally:
+        os.remove(cache.file_path)
+
+
+def test_token_bucket_spaces_requests():
+    now = [0.0]
+    bucket = TokenBucket(
+        rate=10,
+        capacity=2,
+        clock=lambda: now[0],
+        sleep=lambda s: now.__setitem__(0, now[0] + s),
+    )
+    for _ in range(4):
+        bucket.acquire()
+    assert now[0] == pytest.approx(0.2)
+
+
+def test_token_bucket_follows_exchange_rate_limit():
+    assert TokenBucket.from_exchange(StubExchange([])) is None
+    bucket = TokenBucket.from_exchange(StubExchange([], rate_limit=50), capacity=3)
+    assert bucket.rate == 20
+    assert bucket.capacity == 3
+
+
+def test_fetch_ohlcv_follows_pages_without_printing(sol_ohlcv, capsys):
+    exchange = StubExchange(sol_ohlcv)
+    cache = make_stub_cache(exchange)
+    df = cache.fetch_ohlcv(
+        since=sol_ohlcv[0][0], until=sol_ohlcv[-1][0] + 60000, limit=7
+    )
+    assert df.to_numpy().tolist() == sol_ohlcv
+    assert df["timestamp"].dtype == "int64"
+    # 9 pages of data and the empty page ending the range
+    assert exchange.requests == 10
+    assert capsys.readouterr().out == ""
+
+
+def test_iter_ohlcv_yields_pages(sol_ohlcv):
+    cache = make_stub_cache(StubExchange(sol_ohlcv))
+    pages = list(
+        cache.iter_ohlcv(since=sol_ohlcv[0][0], until=sol_ohlcv[9][0], limit=4)
+    )
+    assert [len(page) for page in pages] == [4, 4, 1]
+    assert pages[0].dtype == "float64"
+
+
+def test_fetch_ohlcv_stops_on_pages_that_do_not_advance(sol_ohlcv):
+    exchange = StubExchange(sol_ohlcv)
+    exchange.fetch_ohlcv = lambda *args, **kwargs: sol_ohlcv[:5]
+    cache = make_stub_cache(exchange)
+    df = cache.fetch_ohlcv(since=0, until=sol_ohlcv[-1][0], limit=5)
+    assert df.to_numpy().tolist() == sol_ohlcv[:5]
+    assert cache.fetch_ohlcv(since=0, limit=5).shape == (5, 6)
+
+
+def test_identify_data_gaps_ignores_duplicates_and_off_grid_candles(market_data_cache):
+    start = datetime(2024, 12, 31, 23, tzinfo=timezone.utc)
+    minute = 60000
+    first = int(start.timestamp() * 1000)
+    timestamps = [first, first, first + 30000, first + 2 * minute, first + 9 * minute]
+    df = pd.DataFrame({"timestamp": timestamps})
+    gaps = market_data_cache.identify_data_gaps(df, start, start + timedelta(minutes=5))
+    assert gaps == [
+        (start + timedelta(minutes=1), start + timedelta(minutes=2)),
+        (start + timedelta(minutes=3), start + timedelta(minutes=6)),
+    ]
+    assert all(isinstance(time, pd.Timestamp) for gap in gaps for time in gap)
+
+
+def test_find_gaps_matches_date_range_difference():
+    rng = np.random.default_rng(3)
+    step = 60000
+    start = 1735686000000
+    expected = start + step * np.arange(500)
+    timestamps = rng.choice(expected, size=300, replace=False)
+
+    gaps = find_gaps(timestamps, start, int(expected[-1]), step)
+    missing = np.concatenate([np.arange(a, b, step) for a, b in gaps])
+    assert np.array_equal(missing, np.setdiff1d(expected, timestamps))
+    # runs are maximal: a gap never ends where the next one starts
+    assert np.all(gaps[1:, 0] > gaps[:-1, 1])
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from ccxt_backtesting_exchange.order_book import RestingOrderBook
+
+
+@pytest.fixture
+def book():
+    book = RestingOrderBook()
+    book.add(0, "buy", 189.5)
+    book.add(1, "buy", 190.3)
+    book.add(2, "sell", 191.0)
+    book.add(3, "buy", 189.8)
+    book.add(4, "sell", 190.4)
+    book.add(5, "buy", 190.3)
+    return book
+
+
+def test_bids_are_sorted_descending_and_asks_ascending(book):
+    assert book.bids.prices().tolist() == [190.3, 190.3, 189.8, 189.5]
+    assert book.bids.rows() == [1, 5, 3, 0]
+    assert book.asks.prices().tolist() == [190.4, 191.0]
+    assert book.asks.rows() == [4, 2]
+
+
+def test_crossable_only_returns_orders_within_range(book):
+    assert book.crossable(189.7, 190.35).tolist() == [1, 5, 3]
+    assert book.crossable(190.3, 191.0).tolist() == [1, 5, 4, 2]
+    assert book.crossable(192.0, 193.0).size == 0
+
+
+def test_remove_keeps_other_orders_at_same_price(book):
+    book.remove(1, "buy", 190.3)
+    assert book.bids.rows() == [5, 3, 0]
+    assert len(book) == 5
+    with pytest.raises(KeyError):
+        book.remove(1, "buy", 190.3)
+
+
+def test_prices_returns_all_resting_prices_sorted(book):
+    assert np.array_equal(book.prices(), [189.5, 189.8, 190.3, 190.3, 190.4, 191.0])
@@ -0,0 +1,262 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+from ccxt.base.errors import BadRequest, OrderNotFound
+
+from ccxt_backtesting_exchange.order_store import OrderStatus, OrderStore
+
+
+@pytest.fixture
+def store():
+    store = OrderStore(capacity=2)
+    for i, (symbol, side) in enumerate(
+        [("SOL/USDT", "buy"), ("BTC/USDT", "sell"), ("SOL/USDT", "sell")]
+    ):
+        store.append(
+            datetime="2024-12-31 23:30:00",
+            timestamp=1735687800000 + i * 60000,
+            symbol=symbol,
+            type="limit",
+            side=side,
+            price=100.0 + i,
+            amount=1.0,
+            fee_cost=0.1,
+            fee_rate=0.001,
+        )
+    return store
+
+
+def test_append_grows_and_assigns_sequential_ids(store):
+    assert len(store) == 3
+    assert store.row(2) == 2
+    assert store.price(2) == 102.0
+
+
+def test_to_dict_has_ccxt_order_shape(store):
+    order = store.to_dict(1)
+    assert order == {
+        "id": 1,
+        "datetime": "2024-12-31 23:30:00",
+        "timestamp": 1735687860000,
+        "lastTradeTimestamp": None,
+        "symbol": "BTC/USDT",
+        "type": "limit",
+        "side": "sell",
+        "price": 101.0,
+        "amount": 1.0,
+        "status": "open",
+        "fee": {"currency": "USDT", "cost": 0.1, "rate": 0.001},
+        "params": None,
+    }
+
+
+def test_unknown_id_raises(store):
+    with pytest.raises(OrderNotFound):
+        store.row(3)
+    with pytest.raises(OrderNotFound):
+        store.row("invalid_id")
+
+
+def test_status_and_symbol_indexes_follow_status_changes(store):
+    open_status = OrderStatus.OPEN.value
+    assert store.symbols(open_status) == ["SOL/USDT", "BTC/USDT"]
+    assert store.rows("SOL/USDT", open_status).tolist() == [0, 2]
+
+    store.set_status(0, OrderStatus.FILLED.value, 1735687900000)
+    assert store.rows("SOL/USDT", open_status).tolist() == [2]
+    assert store.rows(status=OrderStatus.FILLED.value).tolist() == [0]
+    assert store.rows("SOL/USDT").tolist() == [0, 2]
+    assert store.to_dict(0)["lastTradeTimestamp"] == 1735687900000
+
+
+def test_filter_by_column(store):
+    rows = store.rows()
+    assert store.filter(rows, "side", "sell").tolist() == [1, 2]
+    assert store.filter(rows, "price", 100.0).tolist() == [0]
+    assert store.filter(rows, "id", 1).tolist() == [1]
+    assert store.filter(rows, "type", "stop").size == 0
+    assert isinstance(store.filter(rows, "datetime", "x"), np.ndarray)
+    with pytest.raises(BadRequest):
+        store.filter(rows, "invalid", 1)
+
+
+def test_extend_appends_open_orders_at_once(store):
+    rows = store.extend(
+        datetime="2024-12-31 23:33:00",
+        timestamp=1735687980000,
+        symbols=["SOL/USDT", "ETH/USDT", "SOL/USDT"],
+        types=["limit", "market", "limit"],
+        sides=["buy", "sell", "sell"],
+        prices=np.array([99.0, 3000.0, 105.0]),
+        amounts=np.array([1.0, 0.5, 2.0]),
+        fee_costs=np.array([0.099, 1.5, 0.21]),
+        fee_rate=0.001,
+        params=[{}, {}, {"postOnly": True}],
+    )
+
+    assert rows.tolist() == [3, 4, 5]
+    assert len(store) == 6
+    assert store.to_dict(4)["type"] == "market"
+    assert store.to_dict(5)["params"] == {"postOnly": True}
+    assert store.rows("SOL/USDT", OrderStatus.OPEN.value).tolist() == [0, 2, 3, 5]
+    assert store.crossable("SOL/USDT", 98.0, 101.0).tolist() == [0, 3]
+
+
+def test_views_behave_like_order_dicts(store):
+    orders = store.views(np.array([2, 0]))
+
+    assert len(orders) == 2
+    assert orders.ids == [2, 0]
+    assert orders == [store.to_dict(2), store.to_dict(0)]
+    assert isinstance(orders[0], dict)
+    assert orders[0] == store.to_dict(2)
+    assert orders[-1] == store.to_dict(0)
+    assert orders[1:] == [store.to_dict(0)]
+    assert orders.to_list() == [store.to_dict(2), store.to_dict(0)]
+    assert orders + [] == [store.to_dict(2), store.to_dict(0)]
+    assert [] + orders == [store.to_dict(2), store.to_dict(0)]
+    assert orders.copy() == [store.to_dict(2), store.to_dict(0)]
+    with pytest.raises(IndexError):
+        orders[2]
+
+
+def test_views_can_be_annotated_serialized_and_pickled(store):
+    orders = store.views(np.array([2, 0]))
+    orders[0]["note"] = "grid"
+    order = orders[0].copy()
+
+    assert orders[0]["note"] == "grid"
+    assert order == {**store.to_dict(2), "note": "grid"}
+    assert json.loads(json.dumps(orders[1])) == json.loads(json.dumps(store.to_dict(0)))
+    assert json.loads(json.dumps(list(orders)))[0]["note"] == "grid"
+    with pytest.raises(TypeError):
+        # not a builtin list, see OrderList
+        json.dumps(orders)
+
+    unpickled = pickle.loads(pickle.dumps(orders))
+    assert type(unpickled) is list
+    assert unpickled == orders
+
+
+def test_views_keep_the_status_they_were_taken_with(store):
+    orders = store.views(store.rows(status=OrderStatus.OPEN.value))
+    store.set_status(0, OrderStatus.FILLED.value, 1735687900000)
+
+    assert orders[0]["status"] == "open"
+    assert orders[0]["lastTradeTimestamp"] is None
+    assert store.views(np.array([0]))[0]["status"] == "filled"
+    assert store.views(np.array([0]))[0]["lastTradeTimestamp"] == 1735687900000
+
+
+def random_store(rng, time_ordered):
+    store = OrderStore(capacity=4)
+    timestamps = np.sort(rng.integers(0, 40, 200)) * 60000
+    if not time_ordered:
+        rng.shuffle(timestamps[150:])
+    for timestamp in timestamps.tolist():
+        store.append(
+            datetime="",
+            timestamp=timestamp,
+            symbol=rng.choice(["SOL/USDT", "BTC/USDT", "ETH/USDT"]),
+            type="limit",
+            side=rng.choice(["buy", "sell"]),
+            price=float(rng.integers(90, 110)),
+            amount=1.0,
+            fee_cost=0.0,
+            fee_rate=0.0,
+        )
+    for row in rng.choice(len(store), 120, replace=False).tolist():
+        status = rng.choice([OrderStatus.FILLED.value, OrderStatus.CANCELED.value])
+        store.set_status(row, status, 0)
+    return store
+
+
+@pytest.mark.parametrize("time_ordered", [True, False])
+def test_latest_matches_filtering_and_sorting(time_ordered):
+    rng = np.random.default_rng(5)
+    store = random_store(rng, time_ordered)
+    assert store.time_ordered == time_ordered
+
+    orders = [store.to_dict(row) for row in range(len(store))]
+    for symbol in [None, "SOL/USDT", "ETH/USDT", "DOGE/USDT"]:
+        for status in [None, "open", "filled", "canceled"]:
+            for since, until, limit in [
+                (None, None, None),
+                (600000, None, 5),
+                (None, 1200000, 0),
+                (300000, 1800000, None),
+                (1800000, 300000, 3),
+                (None, None, 1000),
+            ]:
+                expected = [
+                    order["id"]
+                    for order in orders
+                    if (symbol is None or order["symbol"] == symbol)
+                    and (status is None or order["status"] == status)
+                    and (since is None or order["timestamp"] >= since)
+                    and (until is None or order["timestamp"] < until)
+                ]
+                expected.sort(key=lambda id: (orders[id]["timestamp"], id))
+                expected = expected[::-1][:limit]
+
+                rows = store.latest(symbol, status, since, until, limit)
+                assert rows.tolist() == expected
+
+
+def test_latest_by_status_across_symbols(store):
+    for i in range(3, 8):
+        store.append(
+            datetime="",
+            timestamp=1735687800000 + i * 60000,
+            symbol=("SOL/USDT", "BTC/USDT")[i % 2],
+            type="limit",
+            side="buy",
+            price=100.0,
+            amount=1.0,
+            fee_cost=0.0,
+            fee_rate=0.0,
+        )
+    # rows fill out of id order
+    for row in (6, 1, 7, 3, 4):
+        store.set_status(row, OrderStatus.FILLED.value, 0)
+    store.set_status(6, OrderStatus.OPEN.value, 0)
+
+    assert store.rows(status="filled").tolist() == [1, 3, 4, 7]
+    assert store.rows(status="open").tolist() == [0, 2, 5, 6]
+    assert store.latest(status="filled").tolist() == [7, 4, 3, 1]
+    assert store.latest(status="filled", limit=2).tolist() == [7, 4]
+    assert store.latest(
+        status="filled", since=1735687800000 + 3 * 60000, until=1735688220000
+    ).tolist() == [4, 3]
+    assert store.latest(
+        status="open", since=1735687800000 + 60000, limit=2
+    ).tolist() == [6, 5]
+
+
+def test_bulk_status_changes_match_row_by_row_changes():
+    bulk = random_store(np.random.default_rng(8), time_ordered=True)
+    single = random_store(np.random.default_rng(8), time_ordered=True)
+    rng = np.random.default_rng(9)
+    for status in ["canceled", "open", "filled", "open"]:
+        rows = rng.choice(len(bulk), 100, replace=False)
+        bulk.set_statuses(rows, status, 1)
+        for row in rows.tolist():
+            single.set_status(row, status, 1)
+
+        for symbol in [None, "SOL/USDT", "BTC/USDT", "ETH/USDT"]:
+            for name in [None, "open", "filled", "canceled"]:
+                assert (
+                    bulk.rows(symbol, name).tolist()
+                    == single.rows(symbol, name).tolist()
+                )
+            if symbol is not None:
+                assert np.array_equal(
+                    np.sort(bulk.crossable(symbol, 0.0, 1000.0)),
+                    np.sort(single.crossable(symbol, 0.0, 1000.0)),
+                )
+                assert np.array_equal(
+                    bulk.book(symbol).prices(), single.book(symbol).prices()
+                )
+        assert bulk.symbols("open") == single.symbols("open")
@@ -0,0 +1,194 @@
+import os
+import shutil
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from ccxt_backtesting_exchange.backtester import Backtester
+from ccxt_backtesting_exchange.clock import Clock
+from ccxt_backtesting_exchange.data_feed import DataFeed
+from ccxt_backtesting_exchange.market_data import MarketDataCache
+from ccxt_backtesting_exchange.partitioned_store import (
+    PartitionedStore,
+    merge_ranges,
+)
+
+from .test_market_data import StubExchange
+
+HOUR = 3600000
+NOV_15 = int(datetime(2024, 11, 15, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def hourly_ohlcv(start, hours, price=100.0):
+    timestamps = start + HOUR * np.arange(hours, dtype=np.float64)
+    data = np.full((hours, 6), price)
+    data[:, 0] = timestamps
+    return data
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PartitionedStore(str(tmp_path / "sol_usdt_1h"))
+
+
+def test_write_splits_candles_into_monthly_partitions(store):
+    data = hourly_ohlcv(NOV_15, 24 * 60)
+    assert store.write(data) == ["2024-11", "2024-12", "2025-01"]
+    assert [entry["rows"] for entry in store.partitions.values()] == [
+        16 * 24,
+        31 * 24,
+        13 * 24,
+    ]
+    assert np.array_equal(store.read(), data)
+
+    reopened = PartitionedStore(store.directory)
+    assert reopened.partitions == store.partitions
+
+
+def test_write_only_rewrites_touched_partitions(store):
+    store.write(hourly_ohlcv(NOV_15, 24 * 60))
+    november = os.stat(store.partition_path("2024-11")).st_mtime_ns
+
+    december = store.partitions["2024-12"]["first"]
+    assert store.write(hourly_ohlcv(december, 2, price=200.0)) == ["2024-12"]
+    assert os.stat(store.partition_path("2024-11")).st_mtime_ns == november
+
+    rewritten = store.read_partition("2024-12")
+    assert len(rewritten) == 31 * 24
+    assert rewritten[:2, 4].tolist() == [200.0, 200.0]
+    assert rewritten[2, 4] == 100.0
+
+
+def test_read_only_opens_partitions_overlapping_the_window(store):
+    store.write(hourly_ohlcv(NOV_15, 24 * 60))
+    december = store.partitions["2024-12"]
+    window = store.read(december["first"] + HOUR, december["last"])
+    assert window[0, 0] == december["first"]
+    assert window[-1, 0] == december["last"]
+    assert not window.flags.writeable
+    assert store.read(0, NOV_15 - 40 * 24 * HOUR).shape == (0, 6)
+
+
+def test_read_with_lookback_adds_earlier_partitions(store):
+    store.write(hourly_ohlcv(NOV_15, 24 * 60))
+    december = store.partitions["2024-12"]["first"]
+    assert store.read(december, lookback=1)[0, 0] == NOV_15
+    assert store.read(december, lookback=5)[0, 0] == NOV_15
+    assert store.read(december + HOUR, december + HOUR, lookback=1)[0, 0] == NOV_15
+
+
+def test_backtester_on_a_month_boundary_has_lookback(store):
+    store.write(hourly_ohlcv(NOV_15, 24 * 60))
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    clock = Clock(start, start + timedelta(days=1), timedelta(hours=1))
+    backtester = Backtester({"USDT": 100.0}, clock=clock)
+    backtester.add_data_feed("TEST/PAIR", "1h", store.directory)
+
+    now = backtester.milliseconds()
+    history = backtester.fetch_ohlcv(
+        "TEST/PAIR", "1h", limit=100, params={"until": now}
+    )
+    assert len(history) == 100
+    assert history[-1, 0] == now - HOUR
+    assert backtester.fetch_ticker("TEST/PAIR")["previousClose"] == 100.0
+
+
+def test_covered_ranges_are_merged(store):
+    store.add_covered_ranges([(10, 20), (30, 40)])
+    store.add_covered_ranges([(20, 25), (35, 50)])
+    assert store.covered_ranges == [(10, 25), (30, 50)]
+    assert merge_ranges([(5, 6), (1, 2), (2, 3)]) == [(1, 3), (5, 6)]
+    assert PartitionedStore(store.directory).covered_ranges == [(10, 25), (30, 50)]
+    assert store.missing_ranges(0, 100) == [(0, 10), (25, 30), (50, 100)]
+    assert store.missing_ranges(12, 24) == []
+    assert store.missing_ranges(15, 35) == [(25, 30)]
+
+
+def test_partitioned_sync_records_ranges_and_feeds_the_backtester():
+    data = hourly_ohlcv(NOV_15, 24 * 60).tolist()
+    cache = MarketDataCache(
+        "stub", "TEST/PAIR", "1h", exchange=StubExchange(data), partitioned=True
+    )
+    try:
+        start = datetime(2024, 11, 20, tzinfo=timezone.utc)
+        end = datetime(2024, 12, 10, tzinfo=timezone.utc)
+        df = cache.sync(start, end, chunk_size=100)
+        assert df["timestamp"].iloc[0] == start.timestamp() * 1000
+        assert list(cache.store.partitions) == ["2024-11", "2024-12"]
+        # the candle at end is part of the synced window
+        synced = (int(start.timestamp() * 1000), int(end.timestamp() * 1000) + HOUR)
+        assert cache.store.covered_ranges == [synced]
+
+        # a second sync finds its gaps in the manifest and only fetches the rest
+        requests = cache.exchange.requests
+        cache.sync(start, end)
+        assert cache.exchange.requests == requests
+        later = end + timedelta(days=2)
+        assert cache.identify_store_gaps(start, later) == [
+            (
+                datetime(2024, 12, 10, 1, tzinfo=timezone.utc),
+                datetime(2024, 12, 12, 1, tzinfo=timezone.utc),
+            )
+        ]
+
+        clock = Clock(start, start + timedelta(days=1), timedelta(hours=1))
+        backtester = Backtester({"USDT": 100.0}, clock=clock)
+        backtester.add_data_feed("TEST/PAIR", "1h", cache.store.directory)
+        feed = backtester._data_feeds["TEST/PAIR"]
+        assert len(feed.data) == cache.store.partitions["2024-11"]["rows"]
+
+        assert len(DataFeed(cache.store.directory, "1h").data) == len(df)
+    finally:
+        shutil.rmtree(cache.store.directory)
+
+
+@pytest.fixture
+def tokyo_time(monkeypatch):
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_partitioned_sync_takes_naive_datetimes_as_utc(tokyo_time):
+    data = hourly_ohlcv(NOV_15, 24 * 30).tolist()
+    cache = MarketDataCache(
+        "stub", "TEST/PAIR", "1h", exchange=StubExchange(data), partitioned=True
+    )
+    try:
+        start, end = datetime(2024, 12, 1), datetime(2024, 12, 5)
+        df = cache.sync(start, end, chunk_size=100)
+        first = int(datetime(2024, 12, 1, tzinfo=timezone.utc).timestamp() * 1000)
+        assert df["timestamp"].iloc[0] == first
+        assert list(cache.store.partitions) == ["2024-12"]
+
+        # only the December partition covers the window
+        cache.sync(datetime(2024, 11, 25), end, chunk_size=100)
+        assert list(cache.store.partitions) == ["2024-11", "2024-12"]
+        assert cache.load_existing_data(start, end)["timestamp"].iloc[0] == first
+    finally:
+        shutil.rmtree(cache.store.directory)
+
+
+def test_partitioned_sync_only_covers_the_candles_it_received():
+    data = hourly_ohlcv(NOV_15, 61).tolist()
+    exchange = StubExchange(data[:25])
+    cache = MarketDataCache(
+        "stub", "TEST/PAIR", "1h", exchange=exchange, partitioned=True
+    )
+    try:
+        start = datetime(2024, 11, 15, tzinfo=timezone.utc)
+        end = start + timedelta(hours=60)
+        # chunks of 10 candles: one partial chunk, then empty ones
+        assert len(cache.sync(start, end, chunk_size=10)) == 25
+        assert cache.store.covered_ranges == [(NOV_15, NOV_15 + 25 * HOUR)]
+
+        # the missing candles are fetched once the exchange has them
+        exchange.ohlcv = data
+        assert len(cache.sync(start, end, chunk_size=10)) == 61
+        assert cache.store.covered_ranges == [(NOV_15, NOV_15 + 61 * HOUR)]
+    finally:
+        shutil.rmtree(cache.store.directory)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from ccxt_backtesting_exchange.range_index import CandleRangeIndex
+
+
+def brute_force_next_crossing(lows, highs, start, prices):
+    hits = (prices >= lows[start:, None]) & (prices <= highs[start:, None])
+    hits = hits.any(axis=1)
+    return start + int(np.argmax(hits)) if hits.any() else None
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 256])
+def test_next_crossing_matches_brute_force(block_size):
+    rng = np.random.default_rng(7)
+    closes = 100 + np.cumsum(rng.normal(0, 1, 3000))
+    lows = closes - rng.uniform(0, 0.5, len(closes))
+    highs = closes + rng.uniform(0, 0.5, len(closes))
+    index = CandleRangeIndex(lows, highs, block_size=block_size)
+
+    for _ in range(200):
+        prices = np.sort(rng.uniform(closes.min(), closes.max(), rng.integers(1, 4)))
+        start = int(rng.integers(0, len(closes)))
+        assert index.next_crossing(start, prices) == brute_force_next_crossing(
+            lows, highs, start, prices
+        )
+
+
+def test_next_crossing_includes_range_bounds():
+    index = CandleRangeIndex(np.array([1.0, 2.0, 3.0]), np.array([1.5, 2.5, 3.5]))
+    assert index.next_crossing(0, np.array([2.5])) == 1
+    assert index.next_crossing(0, np.array([3.0])) == 2
+    assert index.next_crossing(2, np.array([2.0])) is None
+
+
+def test_next_crossing_without_prices_or_candles():
+    assert (
+        CandleRangeIndex(np.array([1.0]), np.array([2.0])).next_crossing(
+            0, np.array([])
+        )
+        is None
+    )
+    assert (
+        CandleRangeIndex(np.array([]), np.array([])).next_crossing(0, np.array([1.0]))
+        is None
+    )
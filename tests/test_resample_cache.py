@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from ccxt_backtesting_exchange.data_feed import DataFeed
+from ccxt_backtesting_exchange.resample_cache import ResampleCache
+
+
+@pytest.fixture
+def cache():
+    return ResampleCache(max_bytes=3 * 80)  # room for three (10,) float64 arrays
+
+
+def test_get_counts_hits_and_misses(cache):
+    assert cache.get("a") is None
+    cache.put("a", np.zeros(10))
+    assert cache.get("a") is not None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted_over_budget(cache):
+    for key in "abc":
+        cache.put(key, np.zeros(10))
+    cache.get("a")
+    cache.put("d", np.zeros(10))
+
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    assert cache.stats()["evictions"] == 1
+    assert cache.nbytes == 240
+
+
+def test_max_entries_is_enforced():
+    cache = ResampleCache(max_entries=1)
+    cache.put("a", np.zeros(1))
+    cache.put("b", np.zeros(1))
+    assert len(cache) == 1
+    assert "b" in cache
+
+
+def test_oversized_entry_is_not_cached(cache):
+    data = cache.put("a", np.zeros(100))
+    assert len(data) == 100
+    assert "a" not in cache
+
+
+def test_cached_arrays_are_read_only(cache):
+    data = cache.get_or_compute("a", lambda: np.zeros(10))
+    with pytest.raises(ValueError):
+        data[0] = 1.0
+
+
+def test_resize_evicts_down_to_new_budget(cache):
+    for key in "abc":
+        cache.put(key, np.zeros(10))
+    cache.resize(max_bytes=80)
+    assert len(cache) == 1
+    assert "c" in cache
+
+
+def test_identical_feeds_share_resampled_data():
+    cache = ResampleCache()
+    feed1 = DataFeed("./data/test-sol-data.json", resample_cache=cache)
+    feed2 = DataFeed("./data/test-sol-data.json", resample_cache=cache)
+    other = DataFeed("./data/test-btc-data.json", resample_cache=cache)
+
+    assert feed1.get_resampled_data("15m") is feed2.get_resampled_data("15m")
+    assert other.get_resampled_data("15m") is not feed1.get_resampled_data("15m")
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+    assert len(cache) == 2
@@ -0,0 +1,72 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from ccxt_backtesting_exchange.data_feed import DataFeed
+from ccxt_backtesting_exchange.resample_cache import ResampleCache
+from ccxt_backtesting_exchange.shared_feeds import SharedArray, SharedFeedStore
+
+FILE_PATH = "./data/test-sol-data.json"
+
+
+@pytest.fixture
+def store():
+    with SharedFeedStore() as store:
+        yield store
+
+
+def sum_shared(handle: SharedArray) -> float:
+    return float(handle.attach().sum())
+
+
+def test_attach_is_read_only_and_zero_copy(store):
+    data = DataFeed(FILE_PATH).data
+    handle = store.publish(data)
+
+    first, second = handle.attach(), handle.attach()
+    assert np.array_equal(first, data)
+    assert np.shares_memory(first, second)
+    assert first.flags.f_contiguous
+    with pytest.raises(ValueError):
+        first[0, 0] = 0.0
+
+
+def test_workers_attach_by_name(store):
+    data = DataFeed(FILE_PATH).data
+    handle = store.publish(data)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        sums = list(executor.map(sum_shared, [handle] * 4))
+    assert sums == [pytest.approx(data.sum())] * 4
+
+
+def test_attached_feed_reuses_published_resampled_data(store):
+    data_feed = DataFeed(FILE_PATH)
+    shared = store.publish_feed(data_feed, "1m", resample=["5m", "1m"])
+    assert list(shared.resampled) == ["5m"]
+
+    cache = ResampleCache()
+    attached = shared.attach(resample_cache=cache)
+    assert attached.fingerprint == data_feed.fingerprint
+    assert np.shares_memory(attached.data, shared.data.attach())
+
+    resampled = attached.get_resampled_data("5m")
+    assert np.shares_memory(resampled, shared.resampled["5m"].attach())
+    assert np.array_equal(resampled, data_feed.get_resampled_data("5m"))
+    assert cache.misses == 0
+    assert np.array_equal(
+        attached.get_data_between_timestamps(limit=3),
+        data_feed.get_data_between_timestamps(limit=3),
+    )
+
+
+def test_close_removes_the_blocks():
+    with SharedFeedStore() as store:
+        handle = store.publish(np.ones((2, 6)))
+    with pytest.raises(FileNotFoundError):
+        handle.attach()
+
+
+def test_empty_arrays_are_published_without_a_block(store):
+    handle = store.publish(np.empty((0, 6)))
+    assert handle.attach().shape == (0, 6)
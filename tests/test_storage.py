@@ -0,0 +1,122 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from ccxt_backtesting_exchange import storage
+from ccxt_backtesting_exchange.convert import convert_directory, main
+from ccxt_backtesting_exchange.storage import (
+    load_ohlcv_json,
+    load_ohlcv_npy,
+    save_ohlcv_npy,
+    sidecar_paths,
+)
+
+
+def test_save_and_load_npy_round_trip(tmp_path):
+    data = np.arange(12, dtype=np.float64).reshape(2, 6)
+    file_path = str(tmp_path / "ohlcv.npy")
+    save_ohlcv_npy(data, file_path)
+
+    loaded = load_ohlcv_npy(file_path)
+    assert np.array_equal(loaded, data)
+    assert loaded.flags.f_contiguous
+
+
+def test_save_empty_npy(tmp_path):
+    file_path = str(tmp_path / "empty.npy")
+    save_ohlcv_npy([], file_path)
+    assert load_ohlcv_npy(file_path).shape == (0, 6)
+
+
+def test_save_npy_with_invalid_shape_raises(tmp_path):
+    with pytest.raises(ValueError):
+        save_ohlcv_npy(np.zeros((2, 5)), str(tmp_path / "invalid.npy"))
+
+
+def test_load_npy_with_invalid_dtype_raises(tmp_path):
+    file_path = str(tmp_path / "invalid.npy")
+    np.save(file_path, np.zeros((2, 6), dtype=np.float32))
+    with pytest.raises(ValueError):
+        load_ohlcv_npy(file_path)
+
+
+@pytest.fixture
+def json_path(tmp_path):
+    file_path = str(tmp_path / "ohlcv.json")
+    shutil.copy("./data/test-sol-data.json", file_path)
+    return file_path
+
+
+def test_load_json_writes_sidecar_and_reuses_it(json_path):
+    parsed = load_ohlcv_json(json_path)
+    npy_path, meta_path = sidecar_paths(json_path)
+    assert os.path.exists(npy_path) and os.path.exists(meta_path)
+    assert parsed.flags.writeable
+
+    loaded = load_ohlcv_json(json_path)
+    assert not loaded.flags.writeable  # memory-mapped sidecar, not parsed JSON
+    assert np.array_equal(loaded, parsed)
+
+
+def test_sidecar_is_rebuilt_when_source_changes(json_path):
+    load_ohlcv_json(json_path)
+    with open(json_path, "r") as file:
+        data = json.load(file)
+    with open(json_path, "w") as file:
+        json.dump(data[:10], file)
+
+    assert load_ohlcv_json(json_path).shape == (10, 6)
+    assert load_ohlcv_json(json_path).shape == (10, 6)
+
+
+def test_sidecar_survives_touch_without_content_change(json_path):
+    load_ohlcv_json(json_path)
+    stat = os.stat(json_path)
+    os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    loaded = load_ohlcv_json(json_path)
+    assert not loaded.flags.writeable
+    assert loaded.shape == (60, 6)
+
+
+def test_load_json_without_sidecar(json_path):
+    load_ohlcv_json(json_path, sidecar=False)
+    assert not any(os.path.exists(path) for path in sidecar_paths(json_path))
+
+
+def test_convert_directory(tmp_path, json_path):
+    with open(tmp_path / "invalid.json", "w") as file:
+        json.dump([[1, 2, 3]], file)
+
+    assert main([str(tmp_path)]) == 1
+    results = convert_directory(str(tmp_path))
+    assert results[json_path] is None
+    assert results[str(tmp_path / "invalid.json")] is not None
+    assert os.path.exists(sidecar_paths(json_path)[0])
+
+
+@pytest.mark.parametrize("sidecar", [True, False])
+def test_load_empty_json(tmp_path, sidecar):
+    json_path = str(tmp_path / "empty.json")
+    with open(json_path, "w") as file:
+        json.dump([], file)
+
+    assert load_ohlcv_json(json_path, sidecar=sidecar).shape == (0, 6)
+    # the second load reads the sidecar when enabled
+    assert load_ohlcv_json(json_path, sidecar=sidecar).shape == (0, 6)
+    assert os.path.exists(sidecar_paths(json_path)[0]) == sidecar
+
+
+def test_save_npy_reraises_when_the_temporary_file_cannot_be_opened(
+    tmp_path, monkeypatch
+):
+    def deny(path, mode):
+        raise PermissionError(f"Cannot open {path}.")
+
+    monkeypatch.setattr(storage, "open", deny, raising=False)
+    with pytest.raises(PermissionError):
+        save_ohlcv_npy(np.zeros((2, 6)), str(tmp_path / "denied.npy"))
+    assert os.listdir(tmp_path) == []
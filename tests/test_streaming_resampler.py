@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from ccxt_backtesting_exchange.data_feed import DataFeed
+from ccxt_backtesting_exchange.streaming_resampler import StreamingResampler
+
+START = 1735686000000  # first candle of the test data
+MINUTE = 60000
+
+
+@pytest.fixture
+def data():
+    return DataFeed("./data/test-sol-data.json").get_data_between_timestamps()
+
+
+def test_completed_bars_match_full_resample(data):
+    resampler = StreamingResampler(data, "15m")
+    for minute in range(61):
+        resampler.advance(START + minute * MINUTE)
+
+    expected = DataFeed("./data/test-sol-data.json").get_resampled_data("15m")
+    assert np.allclose(resampler.ohlcv(include_partial=False), expected, atol=1e-9)
+
+
+def test_partial_bar_only_uses_past_candles(data):
+    resampler = StreamingResampler(data, "15m")
+    now = START + 20 * MINUTE
+    resampler.advance(now)
+
+    bars = resampler.ohlcv()
+    assert bars.shape == (2, 6)
+    partial = bars[-1]
+    expected = data[(data[:, 0] >= START + 15 * MINUTE) & (data[:, 0] < now)]
+    assert partial[0] == START + 15 * MINUTE
+    assert partial[1] == expected[0, 1]
+    assert partial[2] == expected[:, 2].max()
+    assert partial[3] == expected[:, 3].min()
+    assert partial[4] == expected[-1, 4]
+    assert partial[5] == pytest.approx(expected[:, 5].sum())
+
+
+def test_limit_and_capacity(data):
+    resampler = StreamingResampler(data, "5m", capacity=3)
+    for minute in range(0, 58):
+        resampler.advance(START + minute * MINUTE)
+
+    bars = resampler.ohlcv()
+    assert len(bars) == 4  # three completed bars and the partial bar
+    assert bars[-1, 0] == START + 55 * MINUTE
+    assert np.array_equal(resampler.ohlcv(limit=2), bars[-2:])
+    assert resampler.ohlcv(limit=0).shape == (0, 6)
+
+
+def test_seeding_mid_history_matches_streaming_from_start(data):
+    streamed = StreamingResampler(data, "5m", capacity=4)
+    for minute in range(0, 43):
+        streamed.advance(START + minute * MINUTE)
+
+    seeded = StreamingResampler(data, "5m", capacity=4)
+    seeded.advance(START + 42 * MINUTE)
+    assert np.allclose(seeded.ohlcv(), streamed.ohlcv())
+
+
+def test_moving_back_in_time_rebuilds_bars(data):
+    resampler = StreamingResampler(data, "15m")
+    resampler.advance(START + 50 * MINUTE)
+    resampler.advance(START + 20 * MINUTE)
+    assert resampler.ohlcv()[-1, 0] == START + 15 * MINUTE
+
+
+def test_watch_ohlcv_follows_the_clock(backtester_with_data_feed):
+    # the clock starts at 23:30, two 15m bars of history are complete
+    bars = backtester_with_data_feed.watch_ohlcv("SOL/USDT", "15m")
+    assert bars[:, 0].tolist() == [START, START + 15 * MINUTE]
+
+    for _ in range(5):
+        backtester_with_data_feed.tick()
+    bars = backtester_with_data_feed.watch_ohlcv("SOL/USDT", "15m", limit=2)
+    assert bars[:, 0].tolist() == [START + 15 * MINUTE, START + 30 * MINUTE]
+    assert bars[-1, 4] == backtester_with_data_feed.fetch_ticker("SOL/USDT")["close"]
+
+
+def test_watch_ohlcv_applies_since_before_limit(backtester_with_data_feed):
+    for _ in range(20):
+        backtester_with_data_feed.tick()
+    bars = backtester_with_data_feed.watch_ohlcv(
+        "SOL/USDT", "5m", since=START + 5 * MINUTE, limit=3
+    )
+    assert bars[:, 0].tolist() == [
+        START + 5 * MINUTE + i * 5 * MINUTE for i in range(3)
+    ]
+    fetched = backtester_with_data_feed.fetch_ohlcv(
+        "SOL/USDT", "5m", since=START + 5 * MINUTE, limit=3
+    )
+    assert bars[:, 0].tolist() == fetched[:, 0].tolist()
+
+
+@pytest.mark.parametrize("capacity", [1, 3, 6, 50])
+def test_seeding_after_gaps_fills_the_ring_buffer(data, capacity):
+    # drop the candles of whole 5m bins so bars are missing in between
+    minutes = (data[:, 0] - START) // MINUTE
+    kept = (minutes < 10) | ((minutes >= 25) & (minutes < 35)) | (minutes >= 50)
+    gappy = data[kept]
+    now = START + 57 * MINUTE
+
+    streamed = StreamingResampler(gappy, "5m", capacity=capacity)
+    for minute in range(0, 58):
+        streamed.advance(START + minute * MINUTE)
+    seeded = StreamingResampler(gappy, "5m", capacity=capacity)
+    seeded.advance(now)
+
+    assert len(seeded.ohlcv(include_partial=False)) == min(capacity, 5)
+    assert np.allclose(seeded.ohlcv(), streamed.ohlcv())
@@ -0,0 +1,92 @@
+import math
+from datetime import datetime, timezone
+
+import pytest
+
+from ccxt_backtesting_exchange.sweep import expand_param_grid, run_sweep
+
+FEEDS = [("SOL/USDT", "1m", "./data/test-sol-data.json")]
+BALANCES = {"SOL": 0.0, "USDT": 1000.0}
+WINDOWS = [
+    (
+        datetime(2024, 12, 31, 23, 30, tzinfo=timezone.utc),
+        datetime(2024, 12, 31, 23, 59, tzinfo=timezone.utc),
+    ),
+    (
+        datetime(2024, 12, 31, 23, 40, tzinfo=timezone.utc),
+        datetime(2024, 12, 31, 23, 50, tzinfo=timezone.utc),
+    ),
+]
+
+
+def buy_the_dip(backtester, params):
+    if params["price"] < 0:
+        raise ValueError("negative price")
+    if not backtester.fetch_orders():
+        backtester.create_order("SOL/USDT", "limit", "buy", 1.0, params["price"])
+
+
+def test_expand_param_grid():
+    assert expand_param_grid({"a": [1, 2], "b": ["x"]}) == [
+        {"a": 1, "b": "x"},
+        {"a": 2, "b": "x"},
+    ]
+    assert expand_param_grid([{"a": 1}]) == [{"a": 1}]
+
+
+def test_run_sweep_collects_one_row_per_run():
+    results = run_sweep(
+        buy_the_dip,
+        {"price": [189.5, 100.0, -1.0]},
+        FEEDS,
+        BALANCES,
+        WINDOWS,
+        max_workers=2,
+        chunksize=2,
+        progress=False,
+    )
+
+    assert results["run"].tolist() == list(range(6))
+    assert results["price"].tolist() == [189.5, 100.0, -1.0] * 2
+    assert results["start"].tolist() == [WINDOWS[0][0]] * 3 + [WINDOWS[1][0]] * 3
+
+    failed = results[results["price"] < 0]
+    assert failed["error"].str.contains("negative price").all()
+    succeeded = results[results["price"] > 0]
+    assert succeeded["error"].isna().all()
+    assert (succeeded["orders"] == 1).all()
+
+    # only the full window trades down to 189.5
+    filled = succeeded.iloc[0]
+    assert filled["filled_orders"] == 1
+    assert filled["balance"]["SOL"]["total"] == pytest.approx(1.0)
+    assert filled["balance"]["USDT"]["total"] == pytest.approx(810.5)
+    assert filled["initial_value"] == pytest.approx(1000.0)
+    assert filled["pnl"] == pytest.approx(filled["final_value"] - 1000.0)
+
+    unfilled = succeeded.iloc[1]
+    assert unfilled["open_orders"] == 1
+    assert unfilled["pnl"] == pytest.approx(0.0)
+    assert not math.isnan(unfilled["final_value"])
+
+
+def test_run_sweep_without_runs_returns_empty_table():
+    assert run_sweep(buy_the_dip, [], FEEDS, BALANCES, WINDOWS).empty
+
+
+def test_run_sweep_with_shared_feeds_matches_file_feeds():
+    settings = dict(max_workers=2, progress=False)
+    grid = {"price": [189.5, 100.0]}
+    from_files = run_sweep(buy_the_dip, grid, FEEDS, BALANCES, WINDOWS, **settings)
+    shared = run_sweep(
+        buy_the_dip,
+        grid,
+        FEEDS,
+        BALANCES,
+        WINDOWS,
+        share_feeds=True,
+        resample=["5m"],
+        **settings,
+    )
+    assert shared.drop(columns="balance").equals(from_files.drop(columns="balance"))
+    assert shared["balance"].tolist() == from_files["balance"].tolist()
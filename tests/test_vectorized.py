@@ -0,0 +1,108 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from ccxt.base.errors import BadRequest, InsufficientFunds
+
+from ccxt_backtesting_exchange.backtester import Backtester
+from ccxt_backtesting_exchange.clock import Clock
+from ccxt_backtesting_exchange.data_feed import DataFeed
+from ccxt_backtesting_exchange.vectorized import run_signals, run_target_positions
+
+FILE_PATH = "./data/test-sol-data.json"
+BALANCES = {"SOL": 2.0, "USDT": 2000.0}
+LARGE_BALANCES = {"SOL": 30.0, "USDT": 20000.0}
+
+
+@pytest.fixture
+def data_feed():
+    return DataFeed(FILE_PATH)
+
+
+@pytest.fixture
+def signals(data_feed):
+    rng = np.random.default_rng(11)
+    opens = data_feed.data[:, 1]
+    amounts = rng.choice([-0.5, 0.0, 0.5, 1.0], size=len(opens))
+    # a mix of market orders, limits crossing the open and resting limits
+    prices = opens + rng.choice([np.nan, -0.3, -0.05, 0.05, 0.3], size=len(opens))
+    return amounts, prices
+
+
+def run_event_loop(data_feed, amounts, prices, fee):
+    """
+    Drive a Backtester with the same signals, canceling unfilled orders
+    before the next candle.
+    """
+    timestamps = data_feed.data[:, 0]
+    start = datetime.fromtimestamp(timestamps[0] / 1000, tz=timezone.utc)
+    clock = Clock(start, start + timedelta(minutes=59), timedelta(minutes=1))
+    backtester = Backtester(dict(LARGE_BALANCES), clock=clock, fee=fee)
+    backtester.add_data_feed("SOL/USDT", "1m", FILE_PATH)
+
+    equity = []
+    for amount, price, candle in zip(amounts, prices, data_feed.data):
+        for order in backtester.fetch_open_orders("SOL/USDT"):
+            backtester.cancel_order(order["id"])
+        if amount != 0:
+            side = "buy" if amount > 0 else "sell"
+            if np.isnan(price):
+                # market orders are placed at the open of the candle
+                order_type, price = "market", candle[1]
+            else:
+                order_type = "limit"
+            backtester.create_order(
+                "SOL/USDT", order_type, side, abs(amount), float(price)
+            )
+        backtester.tick()
+        balance = backtester.fetch_balance()
+        equity.append(balance["USDT"]["total"] + balance["SOL"]["total"] * candle[4])
+    return backtester, np.array(equity)
+
+
+@pytest.mark.parametrize("fee", [0.0, 0.001])
+def test_run_signals_matches_the_event_loop(data_feed, signals, fee):
+    amounts, prices = signals
+    result = run_signals(
+        data_feed, "SOL/USDT", LARGE_BALANCES, amounts, prices, fee=fee
+    )
+    backtester, equity = run_event_loop(data_feed, amounts, prices, fee)
+
+    assert np.allclose(result.equity, equity)
+    for asset, balance in backtester.fetch_balance().items():
+        assert result.fetch_balance()[asset]["total"] == pytest.approx(balance["total"])
+
+    filled = backtester.fetch_closed_orders("SOL/USDT", limit=None)
+    filled = sorted(filled, key=lambda order: order["timestamp"])
+    assert len(result.trades) == len(filled) > 0
+    assert result.trades["side"].tolist() == [order["side"] for order in filled]
+    assert result.trades["type"].tolist() == [order["type"] for order in filled]
+    assert np.allclose(result.trades["price"], [order["price"] for order in filled])
+    assert np.allclose(result.trades["fee"], [order["fee"]["cost"] for order in filled])
+
+
+def test_run_signals_raises_when_balance_runs_out(data_feed):
+    amounts = np.zeros(len(data_feed.data))
+    amounts[[3, 7]] = -1.5
+    with pytest.raises(InsufficientFunds, match="SOL balance too low at candle 7"):
+        run_signals(data_feed, "SOL/USDT", BALANCES, amounts)
+
+
+def test_run_signals_validates_signals(data_feed):
+    with pytest.raises(BadRequest):
+        run_signals(data_feed, "SOL/USDT", BALANCES, np.zeros(3))
+    amounts = np.ones(len(data_feed.data)) * 0.1
+    with pytest.raises(BadRequest):
+        run_signals(data_feed, "SOL/USDT", BALANCES, amounts, -amounts)
+
+
+def test_run_target_positions_holds_the_targets(data_feed):
+    targets = np.where(np.arange(len(data_feed.data)) < 30, 3.0, 0.0)
+    result = run_target_positions(
+        data_feed.data, "SOL/USDT", BALANCES, targets, fee=0.001
+    )
+    assert np.allclose(result.base, targets)
+    assert result.trades["side"].tolist() == ["buy", "sell"]
+    assert (result.trades["type"] == "market").all()
+    closes = data_feed.data[:, 4]
+    assert np.allclose(result.equity, result.quote + result.base * closes)